@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Record niri's event stream and replay it over a local socket.
+
+Run from the repository root:
+
+    python3 -m bench.event_replay record session.ndjson.gz [--duration 60]
+    python3 -m bench.event_replay replay session.ndjson.gz [--speed 4 | --fast] \\
+        [-- ./niri-tools events --compact]
+
+``record`` subscribes to the running niri and writes every event with its
+CLOCK_MONOTONIC offset from the start of the recording, one
+``<nanoseconds>\\t<event json>`` line per event, gzip-compressed.
+
+``replay`` serves a recording on a Unix socket, to every client that
+subscribes to the event stream: at the recorded pace, ``--speed`` times
+faster, or with ``--fast`` as fast as the socket accepts it. Given a
+command after ``--``, it runs the command with ``NIRI_SOCKET`` pointing at
+the replay, waits for it to exit once the stream ends and reports how fast
+it consumed the events.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from bench.fake_niri import close_listener, start_accepting
+from client.socket_client import LineReader, event_type, subscribe
+from client.socket_path import _accepts_connections
+
+def record(sock_path, path, duration=None, count=None):
+    """Write events from niri to path until interrupted or a limit is hit."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(sock_path)
+    reader = subscribe(sock)
+
+    recorded = 0
+    start = time.monotonic_ns()
+    if duration is not None:
+        sock.settimeout(duration)
+    try:
+        with gzip.open(path, "wb") as out:
+            for line in reader:
+                out.write(b"%d\t%s\n" % (time.monotonic_ns() - start, line))
+                recorded += 1
+                if count is not None and recorded >= count:
+                    break
+                if duration is not None:
+                    remaining = duration - (time.monotonic_ns() - start) / 1e9
+                    if remaining <= 0:
+                        break
+                    sock.settimeout(remaining)
+    except (KeyboardInterrupt, socket.timeout):
+        pass
+    finally:
+        sock.close()
+    return recorded
+
+def load_recording(path):
+    """Return [(offset seconds, encoded event line with newline)]."""
+    events = []
+    with gzip.open(path, "rb") as f:
+        for line in f:
+            offset, _, event = line.partition(b"\t")
+            events.append((int(offset) / 1e9, event if event.endswith(b"\n") else event + b"\n"))
+    return events
+
+class EventReplayServer:
+    """Serve a recording to every event-stream subscriber on a Unix socket.
+
+    Events that are already due are sent together, so a recorded burst
+    arrives as a burst. speed=None sends everything at once.
+    """
+
+    def __init__(self, path, events, speed=1.0):
+        self.path = path
+        self.events = events
+        self.speed = speed
+        self.listener = None
+        self.finished = threading.Event()
+        self.sent = 0
+        self.send_seconds = 0.0
+
+    def start(self):
+        # Only a stale socket is replaced; --socket must not take over a
+        # running niri (or any other file) by accident.
+        if os.path.lexists(self.path):
+            if not stat.S_ISSOCK(os.lstat(self.path).st_mode):
+                raise FileExistsError(f"{self.path} exists and is not a socket")
+            if _accepts_connections(self.path):
+                raise FileExistsError(f"{self.path} is in use by another server")
+            os.unlink(self.path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(self.path)
+        self.listener.listen(16)
+        start_accepting(self.listener, self._serve)
+        return self
+
+    def stop(self):
+        if self.listener is not None:
+            close_listener(self.listener)
+            self.listener = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _serve(self, conn):
+        with conn:
+            line = LineReader(conn).readline()
+            try:
+                request = json.loads(line) if line else None
+            except ValueError:
+                return
+            if request not in ("EventStream", {"EventStream": None}):
+                conn.sendall(b'{"Err":"the replay server only serves the event stream"}\n')
+                return
+            conn.sendall(b'{"Ok":"Handled"}\n')
+            t0 = time.perf_counter()
+            try:
+                self._stream(conn)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            self.send_seconds = time.perf_counter() - t0
+            self.sent = len(self.events)
+            conn.shutdown(socket.SHUT_WR)
+            self.finished.set()
+
+    def _stream(self, conn):
+        if self.speed is None:
+            conn.sendall(b"".join(event for _, event in self.events))
+            return
+        start = time.monotonic()
+        i = 0
+        while i < len(self.events):
+            due = start + self.events[i][0] / self.speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            now = time.monotonic()
+            j = i + 1
+            while j < len(self.events) and start + self.events[j][0] / self.speed <= now:
+                j += 1
+            conn.sendall(b"".join(event for _, event in self.events[i:j]))
+            i = j
+
+def summarise(events):
+    kinds = {}
+    for _, event in events:
+        kind = event_type(event)
+        kinds[kind] = kinds.get(kind, 0) + 1
+    span = events[-1][0] if events else 0.0
+    return span, sorted(kinds.items(), key=lambda item: -item[1])
+
+def replay(args):
+    events = load_recording(args.file)
+    span, kinds = summarise(events)
+    print(f"🎞️ {len(events)} events over {span:.1f}s: "
+          + ", ".join(f"{kind} {n}" for kind, n in kinds[:5]))
+    speed = None if args.fast else args.speed
+
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        sock_path = args.socket or os.path.join(runtime_dir, "niri.replay.sock")
+        server = EventReplayServer(sock_path, events, speed)
+        try:
+            server.start()
+        except FileExistsError as e:
+            print(f"❌ Refusing to serve on {sock_path}: {e}", file=sys.stderr)
+            return 1
+        try:
+            if not args.command:
+                print(f"📡 Replaying on {sock_path} (Ctrl-C to stop)")
+                try:
+                    while True:
+                        time.sleep(3600)
+                except KeyboardInterrupt:
+                    return 0
+
+            env = dict(os.environ, NIRI_SOCKET=sock_path)
+            t0 = time.perf_counter()
+            proc = subprocess.run(args.command, env=env, stdout=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - t0
+        finally:
+            server.stop()
+
+    if not server.finished.is_set():
+        print(f"❌ {' '.join(args.command)} exited ({proc.returncode}) before the replay finished.", file=sys.stderr)
+        return 1
+    rate = len(events) / elapsed if elapsed else float("inf")
+    print(f"⏱️ {' '.join(args.command)}: {elapsed * 1000:.0f} ms, {rate:,.0f} events/s "
+          f"(server sent for {server.send_seconds * 1000:.0f} ms)")
+    return proc.returncode
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay the niri event stream.")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    rec = sub.add_parser("record", help="Capture events from the running niri")
+    rec.add_argument("file", help="Recording to write (gzip NDJSON)")
+    rec.add_argument("--duration", type=float, help="Stop after this many seconds")
+    rec.add_argument("--count", type=int, help="Stop after this many events")
+
+    rep = sub.add_parser("replay", help="Serve a recording on a Unix socket")
+    rep.add_argument("file", help="Recording to replay")
+    rep.add_argument("--speed", type=float, default=1.0, help="Replay this many times faster than recorded")
+    rep.add_argument("--fast", action="store_true", help="Send every event as fast as possible")
+    rep.add_argument("--socket", help="Socket path to serve on (default: a temporary one)")
+
+    # Everything after "--" is the command to run against the replay.
+    argv = sys.argv[1:]
+    command = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, command = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+    args.command = command
+    if args.mode == "replay" and args.speed <= 0:
+        rep.error("--speed must be greater than 0")
+
+    if args.mode == "record":
+        from client.socket_path import get_niri_socket_path
+
+        sock_path = get_niri_socket_path()
+        if not sock_path:
+            print("❌ Could not find the niri socket.", file=sys.stderr)
+            return 1
+        print(f"⏺️ Recording events from {sock_path} to {args.file} (Ctrl-C to stop)")
+        recorded = record(sock_path, args.file, args.duration, args.count)
+        print(f"✅ Recorded {recorded} events.")
+        return 0
+
+    return replay(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""A stand-in for niri's IPC socket, for benchmarks and regression runs.
+
+Answers the queries the tools send ("Windows", "Workspaces", "Outputs",
+"FocusedOutput", "FocusedWindow") and applies the actions built in
+ipc/actions.py (MoveWindowToWorkspace, MoveWindowToMonitor, FocusWindow)
+to a synthetic world; any other Action is acknowledged with
+``{"Ok": "Handled"}``. Event-stream subscribers get the full state first,
+as from niri, then an event for every change, whether it came from an
+action or from the built-in event generator. Like niri, it serves one
+request per connection.
+
+Run it on its own to point the tools at a big world without Wayland:
+
+    python3 -m bench.fake_niri --outputs 5 --workspaces 50 --windows 5000 \\
+        --latency 0.5 --event_rate 200
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+APP_IDS = [
+    "foot", "firefox", "org.gnome.Nautilus", "emacs", "googlemessages",
+    "slack", "spotify", "org.kde.okular", "code", "thunderbird",
+]
+
+def default_world():
+    outputs = {name: {"name": name} for name in ("HDMI-A-1", "HDMI-A-2")}
+    workspaces = [
+        {"id": 1, "idx": 1, "name": "main", "output": "HDMI-A-1",
+         "is_active": True, "is_focused": True, "is_urgent": False, "active_window_id": 1},
+        {"id": 2, "idx": 2, "name": "scratchpad", "output": "HDMI-A-1",
+         "is_active": False, "is_focused": False, "is_urgent": False, "active_window_id": 2},
+        {"id": 3, "idx": 1, "name": None, "output": "HDMI-A-2",
+         "is_active": True, "is_focused": False, "is_urgent": False, "active_window_id": None},
+    ]
+    windows = [
+        {"id": 1, "title": "~/src", "app_id": "foot", "pid": 101, "workspace_id": 1,
+         "is_focused": True, "is_floating": False, "is_urgent": False},
+        {"id": 2, "title": "Messages", "app_id": "googlemessages", "pid": 102, "workspace_id": 2,
+         "is_focused": False, "is_floating": False, "is_urgent": False},
+    ]
+    return {"outputs": outputs, "workspaces": workspaces, "windows": windows}
+
+def make_world(outputs=5, workspaces=50, windows=5000, seed=0):
+    """Build a synthetic world of the given size.
+
+    Workspaces are dealt round-robin over the outputs; the first one on
+    each output is active, the very first is focused and the second is
+    named "scratchpad". Windows are spread at random over the workspaces
+    and window 1 has focus.
+    """
+    rng = random.Random(seed)
+    output_names = [f"DP-{i + 1}" for i in range(outputs)]
+    world_outputs = {name: {"name": name} for name in output_names}
+
+    world_workspaces = []
+    per_output = {name: 0 for name in output_names}
+    for i in range(workspaces):
+        output = output_names[i % outputs]
+        per_output[output] += 1
+        world_workspaces.append({
+            "id": i + 1,
+            "idx": per_output[output],
+            "name": "scratchpad" if i == 1 else (f"ws-{i + 1}" if i % 5 == 0 else None),
+            "output": output,
+            "is_active": per_output[output] == 1,
+            "is_focused": i == 0,
+            "is_urgent": False,
+            "active_window_id": None,
+        })
+
+    world_windows = []
+    for i in range(windows):
+        app_id = rng.choice(APP_IDS)
+        workspace = world_workspaces[rng.randrange(workspaces)] if i else world_workspaces[0]
+        world_windows.append({
+            "id": i + 1,
+            "title": f"{app_id} {rng.randrange(10 ** 6):06d}",
+            "app_id": app_id,
+            "pid": 1000 + i,
+            "workspace_id": workspace["id"],
+            "is_focused": i == 0,
+            "is_floating": False,
+            "is_urgent": False,
+        })
+        if workspace["active_window_id"] is None:
+            workspace["active_window_id"] = i + 1
+    return {"outputs": world_outputs, "workspaces": world_workspaces, "windows": world_windows}
+
+class FakeNiriServer:
+    """Serve a world on a Unix socket from background threads.
+
+    latency is added before every reply, in seconds. Actions change the
+    world and are broadcast to event-stream subscribers.
+    """
+
+    def __init__(self, path, world=None, latency=0.0):
+        self.path = path
+        self.world = world or default_world()
+        self.latency = latency
+        self.listener = None
+        self.lock = threading.Lock()
+        self.subscribers = []
+        self.requests = 0
+        self.windows_by_id = {win["id"]: win for win in self.world["windows"]}
+        self.workspaces_by_id = {ws["id"]: ws for ws in self.world["workspaces"]}
+
+    def start(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(self.path)
+        self.listener.listen(128)
+        start_accepting(self.listener, self._serve)
+        return self
+
+    def stop(self):
+        if self.listener is not None:
+            close_listener(self.listener)
+            self.listener = None
+        with self.lock:
+            for conn in self.subscribers:
+                conn.close()
+            self.subscribers = []
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _serve(self, conn):
+        with conn.makefile("rb") as rfile:
+            line = rfile.readline()
+        try:
+            request = json.loads(line)
+        except ValueError:
+            conn.close()
+            return
+        if self.latency:
+            time.sleep(self.latency)
+        if request in ("EventStream", {"EventStream": None}):
+            self._subscribe(conn)
+            return
+        with self.lock:
+            self.requests += 1
+            reply = self.reply_to(request)
+            payload = json.dumps(reply).encode("utf-8") + b"\n"
+        with conn:
+            try:
+                conn.sendall(payload)
+            except OSError:
+                pass
+
+    def _subscribe(self, conn):
+        with self.lock:
+            state = [
+                {"WorkspacesChanged": {"workspaces": self.world["workspaces"]}},
+                {"WindowsChanged": {"windows": self.world["windows"]}},
+            ]
+            payload = b'{"Ok":"Handled"}\n' + b"".join(_encode(event) for event in state)
+            try:
+                conn.sendall(payload)
+            except OSError:
+                conn.close()
+                return
+            self.subscribers.append(conn)
+
+    def emit(self, *events):
+        """Send events to every subscriber, dropping the ones that left."""
+        payload = b"".join(_encode(event) for event in events)
+        with self.lock:
+            self._broadcast(payload)
+
+    def _broadcast(self, payload):
+        alive = []
+        for conn in self.subscribers:
+            try:
+                conn.sendall(payload)
+                alive.append(conn)
+            except OSError:
+                conn.close()
+        self.subscribers = alive
+
+    def reply_to(self, request):
+        """Answer one request. Called with the lock held."""
+        if request == "Windows":
+            return {"Ok": {"Windows": self.world["windows"]}}
+        if request == "Workspaces":
+            return {"Ok": {"Workspaces": self.world["workspaces"]}}
+        if request == "Outputs":
+            return {"Ok": {"Outputs": self.world["outputs"]}}
+        if request == "FocusedOutput":
+            focused = self._focused_workspace()
+            return {"Ok": {"FocusedOutput": self.world["outputs"].get(focused["output"]) if focused else None}}
+        if request == "FocusedWindow":
+            return {"Ok": {"FocusedWindow": next((w for w in self.world["windows"] if w["is_focused"]), None)}}
+        if isinstance(request, dict) and "Action" in request:
+            return self._apply_action(request["Action"])
+        return {"Err": f"unsupported request: {request}"}
+
+    def _apply_action(self, action):
+        events = []
+        if "MoveWindowToWorkspace" in action:
+            args = action["MoveWindowToWorkspace"]
+            window_id = args.get("window_id")
+            if window_id is None:  # niri's default: the focused window
+                window_id = next((w["id"] for w in self.world["windows"] if w["is_focused"]), None)
+            win = self.windows_by_id.get(window_id)
+            workspace = self._resolve_workspace(args.get("reference") or {})
+            if win is None or workspace is None:
+                return {"Err": "window or workspace not found"}
+            win["workspace_id"] = workspace["id"]
+            events.append({"WindowOpenedOrChanged": {"window": win}})
+            if args.get("focus", True):
+                events.extend(self._focus(win))
+        elif "MoveWindowToMonitor" in action:
+            args = action["MoveWindowToMonitor"]
+            win = self.windows_by_id.get(args.get("id"))
+            workspace = next((ws for ws in self.world["workspaces"]
+                              if ws["output"] == args.get("output") and ws["is_active"]), None)
+            if win is None or workspace is None:
+                return {"Err": "window or output not found"}
+            win["workspace_id"] = workspace["id"]
+            events.append({"WindowOpenedOrChanged": {"window": win}})
+        elif "FocusWindow" in action:
+            win = self.windows_by_id.get(action["FocusWindow"].get("id"))
+            if win is None:
+                return {"Err": "window not found"}
+            events.extend(self._focus(win))
+        if events:
+            self._broadcast(b"".join(_encode(event) for event in events))
+        return {"Ok": "Handled"}
+
+    def _resolve_workspace(self, reference):
+        if "Id" in reference:
+            return self.workspaces_by_id.get(reference["Id"])
+        if "Name" in reference:
+            return next((ws for ws in self.world["workspaces"] if ws["name"] == reference["Name"]), None)
+        if "Index" in reference:
+            # Like niri, an index counts on the focused output.
+            focused = self._focused_workspace()
+            output = focused["output"] if focused else None
+            return next((ws for ws in self.world["workspaces"]
+                         if ws["output"] == output and ws["idx"] == reference["Index"]), None)
+        return None
+
+    def _focused_workspace(self):
+        return next((ws for ws in self.world["workspaces"] if ws["is_focused"]), None)
+
+    def _focus(self, win):
+        for other in self.world["windows"]:
+            other["is_focused"] = other is win
+        workspace = self.workspaces_by_id[win["workspace_id"]]
+        for ws in self.world["workspaces"]:
+            ws["is_focused"] = ws is workspace
+            if ws["output"] == workspace["output"]:
+                ws["is_active"] = ws is workspace
+        workspace["active_window_id"] = win["id"]
+        return [
+            {"WorkspaceActivated": {"id": workspace["id"], "focused": True}},
+            {"WorkspaceActiveWindowChanged": {"workspace_id": workspace["id"], "active_window_id": win["id"]}},
+            {"WindowFocusChanged": {"id": win["id"]}},
+        ]
+
+    def generate_events(self, rate, count=None, seed=0):
+        """Change the world in the background at about rate events per second.
+
+        Mostly retitles windows, as terminals and browsers do, and now and
+        then moves focus. Returns the thread; it stops after count events
+        or when the server stops.
+        """
+        rng = random.Random(seed)
+        interval = 1.0 / rate
+
+        def run():
+            sent = 0
+            next_at = time.monotonic()
+            while self.listener is not None and (count is None or sent < count):
+                with self.lock:
+                    win = self.world["windows"][rng.randrange(len(self.world["windows"]))]
+                    if rng.random() < 0.9:
+                        win["title"] = f"{win['app_id']} {rng.randrange(10 ** 6):06d}"
+                        events = [{"WindowOpenedOrChanged": {"window": win}}]
+                    else:
+                        events = self._focus(win)
+                    self._broadcast(b"".join(_encode(event) for event in events))
+                sent += 1
+                next_at += interval
+                delay = next_at - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+def start_accepting(listener, serve):
+    """Run serve(conn) on its own thread for every connection to listener.
+
+    The accept loop keeps its own reference to the listener, so stop()
+    clearing the attribute cannot race it; it ends when the listener is
+    closed.
+    """
+    def accept_loop():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=serve, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+
+def close_listener(listener):
+    """Close a listening socket, waking the thread blocked in accept()."""
+    try:
+        listener.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    listener.close()
+
+def _encode(event):
+    return json.dumps(event, separators=(",", ":")).encode("utf-8") + b"\n"
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic niri IPC socket.")
+    parser.add_argument("--socket", help="Socket path (default: a temporary one)")
+    parser.add_argument("--outputs", type=int, default=5, help="Number of outputs")
+    parser.add_argument("--workspaces", type=int, default=50, help="Number of workspaces")
+    parser.add_argument("--windows", type=int, default=5000, help="Number of windows")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the world and the events")
+    parser.add_argument("--latency", type=float, default=0.0, help="Milliseconds to wait before each reply")
+    parser.add_argument("--event_rate", type=float, default=0.0, help="Generated events per second (0=none)")
+    args = parser.parse_args()
+
+    world = make_world(args.outputs, args.workspaces, args.windows, args.seed)
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        path = args.socket or os.path.join(runtime_dir, "niri.fake.sock")
+        with FakeNiriServer(path, world, latency=args.latency / 1000) as server:
+            if args.event_rate > 0:
+                server.generate_events(args.event_rate, seed=args.seed)
+            print(f"📡 Serving {args.windows} windows on {args.workspaces} workspaces, {args.outputs} outputs")
+            print(f"export NIRI_SOCKET={path}")
+            try:
+                while True:
+                    time.sleep(3600)
+            except KeyboardInterrupt:
+                pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark the NDJSON framing used for IPC replies and the event stream.
+
+Run from the repository root:
+
+    python3 -m bench.framing
+
+Compares LineReader with the old ``buffer += chunk`` / ``split`` loop for a
+1 MB Windows reply and a burst of 100k events pushed through a socketpair.
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+
+from client.socket_client import LineReader
+
+def make_windows_reply(target_size):
+    """Build a single-line Windows reply of roughly target_size bytes."""
+    windows = []
+    size = 0
+    while size < target_size:
+        win = {
+            "id": len(windows) + 1,
+            "title": f"window {len(windows)} " + "x" * 180,
+            "app_id": f"org.example.App{len(windows) % 40}",
+            "pid": 1000 + len(windows),
+            "workspace_id": len(windows) % 50 + 1,
+            "is_focused": False,
+            "is_floating": False,
+            "is_urgent": False,
+        }
+        windows.append(win)
+        size += len(json.dumps(win))
+    return json.dumps({"Ok": {"Windows": windows}}).encode() + b"\n"
+
+def make_event_burst(count):
+    lines = []
+    for i in range(count):
+        event = {"WindowOpenedOrChanged": {"window": {
+            "id": i % 500, "title": f"~/src build {i}", "app_id": "foot",
+            "workspace_id": 1, "is_focused": False,
+        }}}
+        lines.append(json.dumps(event).encode())
+    return b"\n".join(lines) + b"\n"
+
+def stream(payload):
+    """Return the reading end of a socketpair fed with payload by a thread."""
+    reader, writer = socket.socketpair()
+
+    def feed():
+        writer.sendall(payload)
+        writer.close()
+
+    threading.Thread(target=feed, daemon=True).start()
+    return reader
+
+def legacy_frames(sock):
+    """The pre-LineReader loop from subscribe_to_event_stream."""
+    buffer = b""
+    while True:
+        chunk = sock.recv(4096)
+        if not chunk:
+            return
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            yield line
+
+def line_reader_frames(sock):
+    return iter(LineReader(sock))
+
+def run(label, frames, payload, repeat):
+    best = None
+    count = 0
+    for _ in range(repeat):
+        sock = stream(payload)
+        t0 = time.perf_counter()
+        count = sum(1 for _ in frames(sock))
+        elapsed = time.perf_counter() - t0
+        sock.close()
+        best = elapsed if best is None else min(best, elapsed)
+    mb = len(payload) / 1e6
+    print(f"{label:<32} {count:>8} frames  {best * 1000:9.2f} ms  {mb / best:8.1f} MB/s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark IPC framing.")
+    parser.add_argument("--reply_bytes", type=int, default=1_000_000, help="Size of the Windows reply")
+    parser.add_argument("--events", type=int, default=100_000, help="Number of events in the burst")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the best is reported")
+    args = parser.parse_args()
+
+    reply = make_windows_reply(args.reply_bytes)
+    burst = make_event_burst(args.events)
+
+    print(f"📦 Windows reply: {len(reply)} bytes")
+    run("legacy buffer += chunk", legacy_frames, reply, args.repeat)
+    run("LineReader", line_reader_frames, reply, args.repeat)
+
+    print(f"📦 Event burst: {args.events} events, {len(burst)} bytes")
+    run("legacy buffer += chunk", legacy_frames, burst, args.repeat)
+    run("LineReader", line_reader_frames, burst, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark for every entry point, with a per-script budget.
+
+Run from the repository root:
+
+    python3 -m bench.startup
+
+Each script is started in a fresh interpreter against a stand-in niri
+socket. Scripts that finish on their own are run for real; long-running
+ones (GUIs, event streams, the daemon) only have their top-level imports
+executed. The report shows wall-clock start-up above a bare interpreter,
+the ``-X importtime`` total and the heaviest imports. The run fails when
+a script exits with an error or goes over its budget in
+bench/startup_budget.json. A script may only be skipped when an optional
+dependency it needs (a GUI toolkit, tabulate) is not installed.
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from bench.fake_niri import FakeNiriServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(ROOT, "bench", "startup_budget.json")
+
+# (script, argv, mode): "run" executes the script, "import" only its top level.
+ENTRY_POINTS = [
+    ("niri-move-window.py", ["--match", "googlemessages", "--target", "m", "--target_id", "HDMI-A-1", "--focus"], "run"),
+    ("niri-scratchpad.py", ["--scratchpad_name", "scratchpad"], "run"),
+    ("niri-workspaces.py", [], "run"),
+    ("niri-ctl", ["ping"], "run"),
+    ("niri-tools", ["scratchpad", "--scratchpad_name", "scratchpad"], "run"),
+    ("niri-windows.py", [], "run"),
+    ("niri-event-stream.py", [], "import"),
+    ("niri-tail-event-stream.py", [], "import"),
+    ("niri-daemon.py", [], "import"),
+    ("niri-hot-change.py", [], "import"),
+    ("niri-modify-focus-ring.py", [], "import"),
+]
+
+# The only modules a script may be missing and still count as skipped.
+OPTIONAL_MODULES = {
+    "niri-windows.py": {"tabulate"},
+    "niri-hot-change.py": {"PyQt5"},
+    "niri-modify-focus-ring.py": {"tkinter", "_tkinter"},
+}
+
+# Executes a script's top level without running its __main__ block. Plain
+# exec rather than runpy, so the harness itself adds no imports.
+IMPORT_ONLY = (
+    "import sys; path = sys.argv[1]; sys.argv = [path]; "
+    "exec(compile(open(path, 'rb').read(), path, 'exec'), "
+    "{'__name__': '__startup_bench__', '__file__': path})"
+)
+
+def interpreter_flags(path):
+    """Interpreter options from the script's shebang, e.g. niri-ctl's -S."""
+    with open(path, "r", encoding="utf-8") as f:
+        tokens = f.readline().split()
+    for i, token in enumerate(tokens):
+        if "python" in token:
+            return [flag for flag in tokens[i + 1:] if flag.startswith("-")]
+    return []
+
+def command(script, argv, mode, extra=()):
+    path = os.path.join(ROOT, script)
+    flags = interpreter_flags(path)
+    if mode == "import":
+        return [sys.executable, *flags, *extra, "-c", IMPORT_ONLY, path]
+    return [sys.executable, *flags, *extra, path, *argv]
+
+def run_once(cmd, env):
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True)
+    return time.perf_counter() - t0, proc
+
+def best_of(cmd, env, repeat):
+    best = None
+    proc = None
+    for _ in range(repeat):
+        elapsed, proc = run_once(cmd, env)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, proc
+
+def parse_importtime(stderr):
+    """Return (total µs, [(cumulative µs, module)]) for top-level imports."""
+    top = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            top.append((int(cumulative), name.strip()))
+    return sum(us for us, _ in top), sorted(top, reverse=True)
+
+def missing_module(stderr):
+    for line in stderr.splitlines():
+        if line.startswith("ModuleNotFoundError:"):
+            return line.split("'")[1] if "'" in line else line
+    return None
+
+def skipped_optional(script, proc):
+    """The optional module script could not import, or None."""
+    if proc.returncode == 0:
+        return None
+    missing = missing_module(proc.stderr)
+    if missing is None or missing.split(".")[0] not in OPTIONAL_MODULES.get(script, ()):
+        return None
+    return missing
+
+def failure(proc):
+    """Last line of a failed run's stderr, or None if it exited cleanly."""
+    if proc.returncode == 0:
+        return None
+    lines = proc.stderr.strip().splitlines() or proc.stdout.strip().splitlines()
+    return f"exit {proc.returncode}: {lines[-1] if lines else 'no output'}"
+
+class ControlStub:
+    """Answers niri-ctl like the daemon would, so its start-up can be timed."""
+
+    def __init__(self, path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(path)
+        self.sock.listen(16)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            with conn:
+                conn.recv(65536)
+                conn.sendall(b'{"status": 0, "output": "pong\\n"}\n')
+
+    def close(self):
+        self.sock.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure entry point cold start.")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per script; the best is reported")
+    parser.add_argument("--budget_scale", type=float, default=1.0,
+                        help="Multiply every budget, e.g. 2.0 on a slow machine")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("scripts", nargs="*", help="Only measure these scripts")
+    args = parser.parse_args()
+
+    with open(BUDGET_FILE, "r", encoding="utf-8") as f:
+        budgets = json.load(f)
+
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        env = dict(os.environ, XDG_RUNTIME_DIR=runtime_dir,
+                   NIRI_SOCKET=os.path.join(runtime_dir, "niri.bench.sock"),
+                   NIRI_TOOLS_SOCKET=os.path.join(runtime_dir, "niri_tools.sock"))
+        control = ControlStub(env["NIRI_TOOLS_SOCKET"])
+        with FakeNiriServer(env["NIRI_SOCKET"]):
+            baseline, _ = best_of([sys.executable, "-c", "pass"], env, args.repeat)
+            results = []
+            for script, argv, mode in ENTRY_POINTS:
+                if args.scripts and script not in args.scripts:
+                    continue
+                wall, proc = best_of(command(script, argv, mode), env, args.repeat)
+                _, traced = run_once(command(script, argv, mode, ["-X", "importtime"]), env)
+                import_us, heaviest = parse_importtime(traced.stderr)
+                budget = budgets.get(script)
+                result = {
+                    "script": script,
+                    "mode": mode,
+                    "wall_ms": round(wall * 1000, 2),
+                    "startup_ms": round((wall - baseline) * 1000, 2),
+                    "import_ms": round(import_us / 1000, 2),
+                    "heaviest": [[name, round(us / 1000, 2)] for us, name in heaviest[:5]],
+                    "budget_ms": budget * args.budget_scale if budget is not None else None,
+                    "skipped": skipped_optional(script, proc),
+                }
+                result["failed"] = None if result["skipped"] else failure(proc)
+                result["over_budget"] = (
+                    not result["skipped"]
+                    and not result["failed"]
+                    and result["budget_ms"] is not None
+                    and result["startup_ms"] > result["budget_ms"]
+                )
+                results.append(result)
+        control.close()
+
+    if args.json:
+        print(json.dumps({"baseline_ms": round(baseline * 1000, 2), "results": results}, indent=2))
+    else:
+        print(f"🐍 bare interpreter: {baseline * 1000:.1f} ms")
+        print(f"{'script':<28} {'mode':<7} {'startup':>9} {'imports':>9} {'budget':>8}  heaviest imports")
+        for r in results:
+            if r["skipped"]:
+                print(f"{r['script']:<28} {r['mode']:<7} skipped: optional module {r['skipped']} not installed")
+                continue
+            if r["failed"]:
+                print(f"{r['script']:<28} {r['mode']:<7} ❌ {r['failed']}")
+                continue
+            budget = f"{r['budget_ms']:.0f}" if r["budget_ms"] is not None else "-"
+            flag = "❌" if r["over_budget"] else "✅"
+            heaviest = ", ".join(f"{name} {ms:.1f}" for name, ms in r["heaviest"][:3])
+            print(f"{r['script']:<28} {r['mode']:<7} {r['startup_ms']:>7.1f}ms {r['import_ms']:>7.1f}ms "
+                  f"{budget:>6}ms {flag} {heaviest}")
+
+    failed = [r["script"] for r in results if r["failed"]]
+    if failed:
+        print(f"❌ Failed to start: {', '.join(failed)}", file=sys.stderr)
+    over = [r["script"] for r in results if r["over_budget"]]
+    if over:
+        print(f"❌ Over budget: {', '.join(over)}", file=sys.stderr)
+    return 1 if failed or over else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
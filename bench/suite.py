@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Latency and throughput benchmarks for the IPC client, lookups and commands.
+
+Run from the repository root:
+
+    python3 -m bench.suite [--json out.json] [--compare before.json]
+
+Everything runs against bench.fake_niri, so no compositor is needed. Each
+case reports p50/p99 per operation and the throughput at the median.
+--json writes the results so that a later run can be compared against
+them with --compare, e.g. before and after a change to
+client/socket_client.py or util/window_utils.py.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+from bench.fake_niri import FakeNiriServer, make_world
+from bench.window_index import make_windows
+from client.socket_client import NiriClient, send_command, subscribe_to_event_stream
+from cmds.move_window import move_window_by_match
+from ipc.actions import list_windows_query
+from ipc.fast_json import backend
+from ipc.models import decode_windows, decoder_name
+from state.niri_state import NiriState
+from util.window_utils import find_matching_window, find_windows_by_workspace_id
+
+SIZES = [10, 100, 1_000, 10_000, 100_000]
+
+def sample(fn, repeat, warmup=3):
+    """Return repeat wall-clock timings of fn(), in seconds."""
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def summarise(name, timings, items=1, unit="op"):
+    """p50/p99 per run and the throughput of items per second at the median."""
+    ordered = sorted(timings)
+    p50 = percentile(ordered, 50)
+    return {
+        "name": name,
+        "runs": len(timings),
+        "p50_us": round(p50 * 1e6, 2),
+        "p99_us": round(percentile(ordered, 99) * 1e6, 2),
+        "throughput": round(items / p50, 1) if p50 else None,
+        "unit": f"{unit}/s",
+    }
+
+def bench_send_command(sock_path, repeat):
+    results = [
+        summarise("send_command FocusedOutput", sample(lambda: send_command(sock_path, '"FocusedOutput"'), repeat)),
+        summarise("send_command Windows (5k)", sample(lambda: send_command(sock_path, list_windows_query()), repeat // 4 or 1)),
+    ]
+    with NiriClient(sock_path) as client:
+        results.append(summarise("NiriClient.request FocusedOutput",
+                                 sample(lambda: client.request('"FocusedOutput"'), repeat)))
+    return results
+
+def bench_event_decode(count, repeat):
+    events = []
+    for i in range(count):
+        if i % 2:
+            events.append({"WindowFocusChanged": {"id": i}})
+        else:
+            events.append({"WindowOpenedOrChanged": {"window": {
+                "id": i, "title": f"window {i}", "app_id": "foot", "workspace_id": i % 50,
+                "is_focused": False, "is_floating": False, "is_urgent": False}}})
+    payload = b'{"Ok":"Handled"}\n' + "".join(json.dumps(e) + "\n" for e in events).encode("utf-8")
+
+    def once():
+        ours, theirs = socket.socketpair()
+
+        def feed():
+            theirs.recv(64)
+            theirs.sendall(payload)
+            theirs.close()
+
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+        subscribe_to_event_stream(ours)
+        feeder.join()
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        timings = sample(once, repeat, warmup=1)
+    return [summarise(f"subscribe_to_event_stream ({count} events)", timings, items=count, unit="events")]
+
+def bench_decode(count, repeat):
+    """Decode a Windows reply into dicts (stdlib) and into models."""
+    windows = make_windows(count)
+    for win in windows:
+        win.update(pid=1000, is_focused=False, is_floating=False, is_urgent=False,
+                   layout=None, focus_timestamp=None)
+    raw = json.dumps({"Ok": {"Windows": windows}}).encode("utf-8")
+    return [
+        summarise(f"json.loads Windows ({count}) -> dicts",
+                  sample(lambda: json.loads(raw)["Ok"]["Windows"], repeat), items=count, unit="windows"),
+        summarise(f"decode_windows ({count}) -> models [{decoder_name()}]",
+                  sample(lambda: decode_windows(raw), repeat), items=count, unit="windows"),
+    ]
+
+def bench_lookups(repeat, max_windows):
+    results = []
+    for size in [s for s in SIZES if s <= max_windows]:
+        windows = make_windows(size)
+        last = windows[-1]
+        state = NiriState()
+        state.set_windows(windows)
+        # The last window is the linear scan's worst case.
+        query = last["title"]
+        workspace_id = last["workspace_id"]
+        runs = max(10, min(repeat, 2_000_000 // size))
+        results.append(summarise(f"find_matching_window n={size}",
+                                 sample(lambda: find_matching_window(windows, query), runs)))
+        results.append(summarise(f"NiriState.find_matching_window n={size}",
+                                 sample(lambda: state.find_matching_window(query), runs)))
+        results.append(summarise(f"find_windows_by_workspace_id n={size}",
+                                 sample(lambda: find_windows_by_workspace_id(windows, workspace_id), runs)))
+        results.append(summarise(f"NiriState.find_windows_by_workspace_id n={size}",
+                                 sample(lambda: state.find_windows_by_workspace_id(workspace_id), runs)))
+    return results
+
+def bench_move_window(sock_path, repeat):
+    args = SimpleNamespace(match="googlemessages", match_mode="first", target="w",
+                           target_id="scratchpad", focus=True)
+
+    def once():
+        with NiriClient(sock_path) as client:
+            move_window_by_match(client, args)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        timings = sample(once, repeat)
+    return [summarise("move_window_by_match end-to-end (5k windows)", timings)]
+
+def compare(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {r["name"]: r for r in json.load(f)["results"]}
+    print(f"\n{'vs ' + baseline_path:<52} {'p50 before':>12} {'p50 now':>12} {'change':>8}")
+    for r in results:
+        before = baseline.get(r["name"])
+        if before is None or not before["p50_us"]:
+            continue
+        change = (r["p50_us"] - before["p50_us"]) / before["p50_us"] * 100
+        print(f"{r['name']:<52} {before['p50_us']:>10.1f}µs {r['p50_us']:>10.1f}µs {change:>+7.1f}%")
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the IPC, event and lookup benchmarks.")
+    parser.add_argument("--repeat", type=int, default=200, help="Runs per case (scaled down for big inputs)")
+    parser.add_argument("--events", type=int, default=20_000, help="Events per decode run")
+    parser.add_argument("--max_windows", type=int, default=100_000, help="Largest window list for lookups")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--compare", help="Compare p50s against an earlier --json file")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        sock_path = os.path.join(runtime_dir, "niri.bench.sock")
+        with FakeNiriServer(sock_path, make_world(outputs=5, workspaces=50, windows=5000)):
+            results += bench_send_command(sock_path, args.repeat)
+            results += bench_move_window(sock_path, max(10, args.repeat // 10))
+    results += bench_event_decode(args.events, max(5, args.repeat // 40))
+    results += bench_decode(5000, max(10, args.repeat // 10))
+    results += bench_lookups(args.repeat, args.max_windows)
+
+    # Replies past FAST_THRESHOLD, like the 5000-window list, go through it.
+    print(f"🧩 large-reply JSON backend: {backend()}")
+    print(f"{'case':<52} {'p50':>12} {'p99':>12} {'throughput':>20}")
+    for r in results:
+        print(f"{r['name']:<52} {r['p50_us']:>10.1f}µs {r['p99_us']:>10.1f}µs "
+              f"{r['throughput']:>14,.0f} {r['unit']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "json_backend": backend(), "results": results},
+                      f, indent=2)
+        print(f"💾 Wrote {args.json}")
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
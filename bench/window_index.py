@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark WindowIndex lookups against the linear find_matching_window.
+
+Run from the repository root:
+
+    python3 -m bench.window_index
+"""
+
+import argparse
+import random
+import time
+
+from util.window_index import WindowIndex
+from util.window_utils import find_matching_window
+
+APPS = ["firefox", "foot", "emacs", "org.gnome.Nautilus", "kitty", "chromium", "thunderbird", "mpv"]
+WORDS = ["src", "build", "notes", "inbox", "review", "draft", "meeting", "logs", "README", "config"]
+
+def make_windows(count, seed=1):
+    rng = random.Random(seed)
+    windows = []
+    for i in range(1, count + 1):
+        words = " ".join(rng.choice(WORDS) for _ in range(4))
+        windows.append({
+            "id": i,
+            "title": f"{words} — {rng.randrange(10**6)}",
+            "app_id": rng.choice(APPS),
+            "workspace_id": rng.randrange(1, 51),
+        })
+    return windows
+
+def per_call(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark window matching.")
+    parser.add_argument("--windows", type=int, default=10_000, help="Number of synthetic windows")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per query")
+    args = parser.parse_args()
+
+    windows = make_windows(args.windows)
+    t0 = time.perf_counter()
+    index = WindowIndex(windows)
+    print(f"📦 {len(windows)} windows, index built in {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+    last = windows[-1]
+    queries = [
+        ("exact id", str(last["id"])),
+        ("exact app_id", "thunderbird"),
+        ("rare title substring", last["title"][-6:]),
+        ("common substring", "review"),
+        ("short query", "z"),
+        ("no match", "qqqxyz"),
+    ]
+
+    print(f"{'query':<22} {'linear':>12} {'WindowIndex':>12} {'search all':>12}")
+    for label, query in queries:
+        linear = per_call(lambda: find_matching_window(windows, query), args.repeat)
+        indexed = per_call(lambda: index.find_matching_window(query), args.repeat)
+        search_all = per_call(lambda: index.search(query), max(1, args.repeat // 10))
+        print(f"{label:<22} {linear * 1e6:>10.1f}µs {indexed * 1e6:>10.1f}µs {search_all * 1e6:>10.1f}µs")
+
+    renamed = dict(windows[len(windows) // 2], title="renamed window")
+    update = per_call(lambda: index.add(renamed), args.repeat)
+    print(f"{'title change (update)':<22} {'':>12} {update * 1e6:>10.1f}µs")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Build dist/niri-tools.pyz, a single-file niri-tools with bytecode inside.
+
+    python3 build-zipapp.py [--output dist/niri-tools.pyz]
+
+zipimport never writes __pycache__, so the archive carries .pyc files next
+to the sources (the only layout zipimport reads). They use unchecked hashes
+so zipimport does not need to stat the sources to validate them. The
+bytecode only suits the Python version that built it; on any other
+version the interpreter falls back to the bundled sources.
+"""
+
+import argparse
+import compileall
+import os
+import py_compile
+import shutil
+import sys
+import tempfile
+import zipapp
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PACKAGES = ["client", "cmds", "config", "editors", "ipc", "service", "state", "util"]
+
+MAIN = """\
+import sys
+
+from cmds.dispatch import main
+
+sys.exit(main())
+"""
+
+def stage(staging_dir):
+    for package in PACKAGES:
+        shutil.copytree(
+            os.path.join(ROOT, package),
+            os.path.join(staging_dir, package),
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+        )
+        # Namespace packages import from a zip, but regular packages skip
+        # the namespace path scan on every import.
+        init_path = os.path.join(staging_dir, package, "__init__.py")
+        if not os.path.exists(init_path):
+            open(init_path, "w").close()
+    with open(os.path.join(staging_dir, "__main__.py"), "w", encoding="utf-8") as f:
+        f.write(MAIN)
+
+def compile_tree(staging_dir):
+    return compileall.compile_dir(
+        staging_dir,
+        quiet=1,
+        legacy=True,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the niri-tools zipapp.")
+    parser.add_argument("--output", default=os.path.join(ROOT, "dist", "niri-tools.pyz"), help="Archive to write")
+    parser.add_argument("--python", default="/usr/bin/env python3", help="Interpreter for the archive's shebang")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with tempfile.TemporaryDirectory() as staging_dir:
+        stage(staging_dir)
+        if not compile_tree(staging_dir):
+            print("❌ Failed to compile the sources.", file=sys.stderr)
+            return 1
+        zipapp.create_archive(staging_dir, args.output, interpreter=args.python)
+
+    print(f"📦 Built {args.output} ({os.path.getsize(args.output) // 1024} KiB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
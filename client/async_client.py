@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+
+from client.socket_client import check_subscription_reply, encode_message
+from ipc.actions import event_stream_query
+
+# asyncio's StreamReader refuses lines longer than its limit (64 KiB by
+# default), which a Windows reply with many windows easily exceeds.
+STREAM_LIMIT = 64 * 1024 * 1024
+
+class AsyncNiriClient:
+    """asyncio counterpart of NiriClient.
+
+    Every request runs on its own connection, so any number of them can be
+    in flight at once, including alongside an open event stream.
+    """
+
+    def __init__(self, sock_path):
+        self.sock_path = sock_path
+
+    async def open_connection(self):
+        return await asyncio.open_unix_connection(self.sock_path, limit=STREAM_LIMIT)
+
+    async def request(self, message):
+        """Send an IPC message and return the decoded JSON response."""
+        reader, writer = await self.open_connection()
+        try:
+            writer.write(encode_message(message))
+            await writer.drain()
+            line = await reader.readline()
+        finally:
+            writer.close()
+        if not line.endswith(b"\n"):
+            raise ConnectionError("Niri closed the connection without replying.")
+        return json.loads(line)
+
+    async def request_many(self, messages):
+        """Send several messages concurrently and return replies in order."""
+        return await asyncio.gather(*(self.request(m) for m in messages))
+
+    async def events(self):
+        """Subscribe to the event stream and yield each decoded event.
+
+        Use as ``async for event in client.events():``. The iterator ends when
+        niri closes the stream.
+        """
+        reader, writer = await self.open_connection()
+        try:
+            writer.write(encode_message(event_stream_query()))
+            await writer.drain()
+
+            check_subscription_reply(await reader.readline())
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                yield json.loads(line)
+        finally:
+            writer.close()
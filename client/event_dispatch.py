@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+import json
+import select
+import time
+
+from client.socket_client import event_type, subscribe
+
+# Coalescing policies.
+EACH = "each"          # call the handler for every event
+LATEST = "latest"      # once per burst, with the newest event per key
+DEBOUNCE = "debounce"  # once the stream has been quiet for `wait` seconds
+RATE = "rate"          # at most once every `interval` seconds
+
+POLICIES = (EACH, LATEST, DEBOUNCE, RATE)
+
+def window_key(payload):
+    """Default coalescing key: the window (or workspace) id an event is about."""
+    if "window" in payload:
+        return payload["window"].get("id")
+    return payload.get("id", payload.get("workspace_id"))
+
+class Subscription:
+    """One handler for one event type, with its coalescing state and counts."""
+
+    def __init__(self, kind, handler, policy, key, wait, interval):
+        self.kind = kind
+        self.handler = handler
+        self.policy = policy
+        self.key = key
+        self.wait = wait
+        self.interval = interval
+        self.pending = {}    # key -> newest payload not yet delivered
+        self.due = None      # monotonic time of the next timed delivery
+        self.last_call = None
+        self.received = 0
+        self.merged = 0      # events replaced by a newer one before delivery
+        self.calls = 0
+        self.errors = 0
+
+    def add(self, payload, now):
+        self.received += 1
+        if self.policy == EACH:
+            self.pending[None] = payload
+            self.fire(now)
+            return
+        key = self.key(payload) if self.key is not None else None
+        if key in self.pending:
+            self.merged += 1
+            # Re-insert so delivery order follows the latest update.
+            del self.pending[key]
+        self.pending[key] = payload
+        if self.policy == DEBOUNCE:
+            self.due = now + self.wait
+
+    def burst_end(self, now):
+        if not self.pending:
+            return
+        if self.policy == LATEST:
+            self.fire(now)
+        elif self.policy == RATE:
+            if self.last_call is None or now - self.last_call >= self.interval:
+                self.fire(now)
+            else:
+                self.due = self.last_call + self.interval
+
+    def poll(self, now):
+        if self.due is not None and now >= self.due:
+            self.fire(now)
+
+    def fire(self, now):
+        payloads = list(self.pending.values())
+        self.pending.clear()
+        self.due = None
+        if not payloads:
+            return
+        self.last_call = now
+        self.calls += 1
+        try:
+            self.handler(payloads)
+        except Exception as e:
+            self.errors += 1
+            print(f"⚠️ {self.kind} handler failed: {e}")
+
+    def stats(self):
+        return {
+            "event": self.kind,
+            "policy": self.policy,
+            "received": self.received,
+            "merged": self.merged,
+            "calls": self.calls,
+            "errors": self.errors,
+            "pending": len(self.pending),
+        }
+
+class EventDispatcher:
+    """Run registered hooks on niri events, once per burst instead of per event.
+
+    niri sends bursts: a terminal retitles itself on every prompt, and a
+    session restore opens dozens of windows at once. A burst ends when
+    every event already received has been handled and the socket has
+    nothing more queued. Handlers receive a list of event payloads; under
+    every policy but ``each``, events with the same key (the window id by
+    default) collapse to the newest one. Events of a type nobody handles
+    are skipped without being decoded and counted as dropped.
+    """
+
+    def __init__(self):
+        self.subscriptions = {}  # event type -> [Subscription]
+        self.dropped = 0
+
+    def on(self, kind, handler, policy=LATEST, key=window_key, wait=0.1, interval=0.5):
+        """Register handler(payloads) for events of type kind.
+
+        wait is the quiet time for ``debounce``; interval the minimum
+        spacing of calls for ``rate``. Pass key=None to collapse every
+        event of the type into the newest one.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy} (expected one of {', '.join(POLICIES)})")
+        sub = Subscription(kind, handler, policy, key, wait, interval)
+        self.subscriptions.setdefault(kind, []).append(sub)
+        return sub
+
+    def feed(self, line, now=None):
+        """Dispatch one encoded event."""
+        kind = event_type(line)
+        subs = self.subscriptions.get(kind)
+        if not subs:
+            self.dropped += 1
+            return
+        now = time.monotonic() if now is None else now
+        payload = json.loads(line)[kind]
+        for sub in subs:
+            sub.add(payload, now)
+
+    def burst_end(self, now=None):
+        now = time.monotonic() if now is None else now
+        for sub in self._all():
+            sub.burst_end(now)
+
+    def poll(self, now=None):
+        """Deliver anything whose debounce or rate deadline has passed."""
+        now = time.monotonic() if now is None else now
+        for sub in self._all():
+            sub.poll(now)
+
+    def next_deadline(self):
+        deadlines = [sub.due for sub in self._all() if sub.due is not None]
+        return min(deadlines) if deadlines else None
+
+    def flush(self):
+        """Deliver everything still pending, e.g. when the stream ends."""
+        now = time.monotonic()
+        for sub in self._all():
+            sub.fire(now)
+
+    def run(self, sock):
+        """Subscribe on sock and dispatch events until niri hangs up."""
+        reader = subscribe(sock)
+
+        try:
+            while True:
+                if not reader.ready():
+                    self.burst_end()
+                    if not self._wait_readable(sock):
+                        continue
+                line = reader.readline()
+                if line is None:
+                    break
+                self.feed(line)
+        finally:
+            self.flush()
+
+    def _wait_readable(self, sock):
+        """Block until sock has data, delivering timed events meanwhile.
+
+        Returns False when a deadline passed first.
+        """
+        deadline = self.next_deadline()
+        if deadline is None:
+            return True
+        timeout = max(0.0, deadline - time.monotonic())
+        readable, _, _ = select.select([sock], [], [], timeout)
+        if not readable:
+            self.poll()
+            return False
+        return True
+
+    def stats(self):
+        merged = sum(sub.merged for sub in self._all())
+        return {
+            "dropped": self.dropped,
+            "merged": merged,
+            "handlers": [sub.stats() for sub in self._all()],
+        }
+
+    def _all(self):
+        for subs in self.subscriptions.values():
+            yield from subs
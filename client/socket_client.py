@@ -3,69 +3,295 @@
 import socket
 import json
 
-def send_command(sock_path, message):
-    """Send an IPC message to Niri and return the JSON response.
-    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    sock.connect(sock_path)
+from ipc.actions import event_stream_query
+from ipc.fast_json import DecodeError, loads
+
+class NiriClient:
+    """Keep one connection to the Niri IPC socket open across requests.
+
+    Requests are sent in sequence over the same socket. niri may hang up
+    after answering (current releases serve one request per connection), so
+    the socket is checked before each use and the client reconnects on its
+    own when the peer has gone away.
+    """
+
+    def __init__(self, sock_path):
+        self.sock_path = sock_path
+        self.sock = None
+        self.reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def connect(self):
+        """Return the open socket, connecting first if needed."""
+        if self.sock is not None and not _peer_closed(self.sock):
+            return self.sock
+        self.close()
+        self.sock = connect_to_niri_socket(self.sock_path)
+        if self.sock is None:
+            # A cached path can pass the cheap liveness check and still
+            # refuse connections; drop it so the next lookup rescans.
+            from client.socket_path import invalidate_socket_cache
+            invalidate_socket_cache(self.sock_path)
+            raise ConnectionError(f"Could not connect to Niri socket: {self.sock_path}")
+        self.reader = LineReader(self.sock)
+        return self.sock
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+            self.reader = None
+
+    def request(self, message, raw=False):
+        """Send an IPC message and return the decoded JSON response.
+
+        A request that fails because the connection dropped underneath us is
+        retried once on a fresh connection. raw=True returns the reply line
+        undecoded, for the ipc.models decoders.
+        """
+        payload = encode_message(message)
+        for attempt in range(2):
+            sock = self.connect()
+            try:
+                sock.sendall(payload)
+                line = self.reader.readline()
+            except (BrokenPipeError, ConnectionResetError):
+                line = None
+            if line is not None:
+                return line if raw else loads(line)
+            if self.reader.pending():
+                raise ConnectionError("Niri closed the connection mid-reply.")
+            self.close()
+        raise ConnectionError("Niri closed the connection without replying.")
+
+    def batch(self, messages, max_in_flight=128, raw=False):
+        """Send several messages at once and return their replies in order.
+
+        Every request is written before any reply is read, so N actions cost
+        about one round trip instead of N. niri serves one request per
+        connection and handles connections independently, so each message
+        goes out on its own connection and the messages in one batch should
+        not depend on each other's ordering. A message that cannot be
+        delivered gets ``{"Err": ...}`` in its slot; the rest still go
+        through. raw=True leaves the other replies undecoded, as request()
+        does.
+        """
+        replies = []
+        for i in range(0, len(messages), max_in_flight):
+            pending = [self._send_detached(m) for m in messages[i:i + max_in_flight]]
+            replies.extend(_collect_reply(item, raw) for item in pending)
+        return replies
+
+    def _send_detached(self, message):
+        """Write message on a new connection; return the socket or the error."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.sock_path)
+            sock.sendall(encode_message(message))
+        except OSError as e:
+            sock.close()
+            return e
+        return sock
+
+def _collect_reply(item, raw=False):
+    if isinstance(item, OSError):
+        return {"Err": f"Could not send request: {item}"}
+    try:
+        line = LineReader(item).readline()
+    except OSError as e:
+        return {"Err": f"Could not read reply: {e}"}
+    finally:
+        item.close()
+    if line is None:
+        return {"Err": "Niri closed the connection without replying."}
+    return line if raw else loads(line)
+
+class LineReader:
+    """Split a socket's byte stream into newline-terminated frames.
+
+    Data is received straight into one growable bytearray through a
+    memoryview, consumed frames are skipped by offset and the buffer is only
+    compacted when it runs out of room, so reading stays linear no matter
+    how large a reply is. When a receive brings several complete frames,
+    as in an event burst, they are all split off in one pass and handed
+    out from a list.
     """
 
-    sock = connect_to_niri_socket(sock_path)
+    def __init__(self, sock, chunk_size=65536):
+        self.sock = sock
+        self.chunk_size = chunk_size
+        self.buf = bytearray(chunk_size)
+        self.start = 0  # first unconsumed byte
+        self.end = 0    # end of received data
+        self.scan = 0   # where the next newline search resumes
+        self.lines = []  # frames already split off the buffer
+        self.next = 0    # next frame in lines to return
+
+    def __iter__(self):
+        while True:
+            line = self.readline()
+            if line is None:
+                return
+            yield line
+
+    def ready(self):
+        """True when readline() can return a frame without receiving."""
+        if self.next < len(self.lines):
+            return True
+        return self.buf.find(b"\n", self.scan, self.end) != -1
+
+    def pending(self):
+        """Return the number of buffered bytes not yet returned as a frame."""
+        queued = sum(len(line) + 1 for line in self.lines[self.next:])
+        return queued + self.end - self.start
 
+    def readline(self):
+        """Return the next frame without its newline, or None at EOF."""
+        if self.next < len(self.lines):
+            line = self.lines[self.next]
+            self.next += 1
+            return line
+        while True:
+            last = self.buf.rfind(b"\n", self.scan, self.end)
+            if last != -1:
+                with memoryview(self.buf) as view:
+                    chunk = bytes(view[self.start:last])
+                single = self.buf.find(b"\n", self.scan, last) == -1
+                self.start = self.scan = last + 1
+                if single:
+                    return chunk
+                lines = chunk.split(b"\n")
+                self.lines = lines
+                self.next = 1
+                return lines[0]
+            self.scan = self.end
+            if not self._fill():
+                return None
+
+    def _fill(self):
+        """Receive more data into the buffer. Returns False at EOF."""
+        if self.start == self.end:
+            self.start = self.end = self.scan = 0
+        elif len(self.buf) - self.end < self.chunk_size // 4:
+            size = self.end - self.start
+            if self.start:
+                self.buf[:size] = self.buf[self.start:self.end]
+                self.scan -= self.start
+                self.start, self.end = 0, size
+            if len(self.buf) - size < self.chunk_size // 4:
+                self.buf.extend(bytes(len(self.buf)))
+        with memoryview(self.buf) as view:
+            received = self.sock.recv_into(view[self.end:])
+        self.end += received
+        return received > 0
+
+def encode_message(message):
+    """Serialise a query or action to a newline-terminated request."""
     if isinstance(message, dict):
         message = json.dumps(message)
-    message += "\n"
+    return (message + "\n").encode("utf-8")
 
-    sock.sendall(message.encode("utf-8"))
-    result = sock.recv(65536)
-    sock.close()
+def _peer_closed(sock):
+    """Cheaply check whether the other end has hung up on an idle socket."""
+    try:
+        return sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT) == b""
+    except BlockingIOError:
+        return False
+    except OSError:
+        return True
 
-    return json.loads(result.decode())
+def send_command(sock_path, message):
+    """Send a single IPC message to Niri and return the JSON response."""
+    with NiriClient(sock_path) as client:
+        return client.request(message)
 
 def connect_to_niri_socket(socket_path):
     """Connect to the given Unix domain socket path."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         sock.connect(socket_path)
         return sock
     except Exception as e:
+        sock.close()
         print(f"❌ Error connecting to socket: {e}")
         return None
 
+def event_type(line):
+    """Return an encoded event's type without decoding the whole event.
+
+    niri writes each event as ``{"<Type>":{...}}``, so the type is the first
+    key. Returns None for anything else.
+    """
+    if not line.startswith(b'{"'):
+        return None
+    end = line.find(b'"', 2)
+    if end == -1:
+        return None
+    return line[2:end].decode("utf-8")
+
+def subscribe(sock):
+    """Subscribe to the event stream on sock and return its LineReader.
+
+    The reader is positioned after niri's ``{"Ok":"Handled"}``, so the
+    first line it returns is the first event. Raises ConnectionError when
+    niri refuses the subscription or hangs up before answering.
+    """
+    sock.sendall(encode_message(event_stream_query()))
+    reader = LineReader(sock)
+    check_subscription_reply(reader.readline())
+    return reader
+
+def check_subscription_reply(reply):
+    """Raise ConnectionError unless reply (bytes or None) is an Ok."""
+    if not reply:
+        raise ConnectionError("Niri closed the connection before accepting the event stream subscription.")
+    try:
+        decoded = loads(reply)
+    except DecodeError:
+        decoded = reply
+    if not isinstance(decoded, dict) or "Ok" not in decoded:
+        error = decoded.get("Err", decoded) if isinstance(decoded, dict) else decoded
+        raise ConnectionError(f"Event stream subscription failed: {error}")
+
+def iter_event_stream(sock):
+    """Subscribe on sock and yield each decoded event until Niri hangs up."""
+    for line in subscribe(sock):
+        yield loads(line)
+
 def subscribe_to_event_stream(sock):
-    """Send the event-stream subscription and start reading events."""
+    """Send the event-stream subscription and print events until it ends.
+
+    Returns 1 if the subscription was refused, 0 otherwise.
+    """
     try:
-        # Correct subscription message – just a quoted string, newline terminated
-        subscribe_message = '{"EventStream": null}\n'        
-        sock.sendall(subscribe_message.encode("utf-8"))
+        reader = subscribe(sock)
         print("✅ Subscribed to Niri event stream.\n")
-    except Exception as e:
-        print(f"❌ Failed to send subscription message: {e}")
-        return
+    except OSError as e:
+        print(f"❌ Failed to subscribe to the event stream: {e}")
+        sock.close()
+        return 1
 
-    buffer = b""
     try:
-        while True:
-            chunk = sock.recv(4096)
-            if not chunk:
-                print("🔌 Connection closed by Niri.")
-                break
-
-            buffer += chunk
-
-            # Handle newline-delimited JSON (NDJSON)
-            while b"\n" in buffer:
-                line, buffer = buffer.split(b"\n", 1)
-                try:
-                    event = json.loads(line.decode("utf-8"))
-                    print("🔔 Event:")
-                    print(json.dumps(event, indent=2))
-                    print("-" * 40)
-                except json.JSONDecodeError as err:
-                    print(f"⚠️ Failed to decode JSON: {err}")
-                    print(f"Raw line: {line}")
+        # Handle newline-delimited JSON (NDJSON)
+        for line in reader:
+            try:
+                event = loads(line)
+                print("🔔 Event:")
+                print(json.dumps(event, indent=2))
+                print("-" * 40)
+            except DecodeError as err:
+                print(f"⚠️ Failed to decode JSON: {err}")
+                print(f"Raw line: {line}")
+        print("🔌 Connection closed by Niri.")
     except KeyboardInterrupt:
         print("\n🛑 Interrupted — closing connection.")
     finally:
         sock.close()
         print("✅ Socket closed.")
-    
+    return 0
+
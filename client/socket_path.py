@@ -1,11 +1,124 @@
 #!/usr/bin/env python3
 
 import os
-import glob
+import socket
+import stat
 
-def get_niri_socket_path():
-    """Locate the Niri IPCUnix socket."""
+def get_niri_socket_path(use_cache=True):
+    """Locate the Niri IPC Unix socket.
+
+    Order of preference:
+      1. ``$NIRI_SOCKET``, which niri exports to everything it spawns.
+      2. The path cached by an earlier call, if it still looks alive.
+      3. A scan of ``$XDG_RUNTIME_DIR`` that skips stale sockets left by
+         old sessions and picks the live one deterministically.
+    """
+    env_path = os.environ.get("NIRI_SOCKET")
+    if env_path and _is_live(env_path):
+        return env_path
+
+    cache_path = _cache_file()
+    if use_cache:
+        cached = _read_cache(cache_path)
+        if cached and _is_live(cached):
+            return cached
+
+    path = discover_niri_socket()
+    if path:
+        _write_cache(cache_path, path)
+    return path
+
+def discover_niri_socket():
+    """Scan the runtime dir for niri sockets and return the live one."""
+    # Only needed on a cache miss, so keep it off the common start-up path.
+    import glob
+
+    xdg_runtime = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+    candidates = [p for p in glob.glob(os.path.join(xdg_runtime, "niri.*.sock")) if _is_live(p)]
+
+    # Prefer this session's display, then the newest niri; the path breaks
+    # any remaining tie so the choice never depends on directory order.
+    display = os.environ.get("WAYLAND_DISPLAY")
+    candidates.sort(key=lambda p: (_display_of(p) != display, -_mtime(p), p))
+    for path in candidates:
+        if _accepts_connections(path):
+            return path
+    return None
+
+def invalidate_socket_cache(path=None):
+    """Forget the cached socket path; with path, only if that is the one cached."""
+    cache_path = _cache_file()
+    if path is not None and _read_cache(cache_path) != path:
+        return
+    try:
+        os.unlink(cache_path)
+    except FileNotFoundError:
+        pass
+
+def _is_live(path):
+    """Cheap check: path is a socket and, if its name carries niri's pid,
+    that process still exists."""
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return False
+    except OSError:
+        return False
+    _, pid = _parse_socket_name(path)
+    if pid is None:
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def _accepts_connections(path):
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+def _parse_socket_name(path):
+    """Split ``niri.<display>.<pid>.sock`` into (display, pid)."""
+    name = os.path.basename(path)
+    if not (name.startswith("niri.") and name.endswith(".sock")):
+        return None, None
+    display, _, pid = name[len("niri."):-len(".sock")].rpartition(".")
+    if not display or not pid.isdecimal():
+        return None, None
+    return display, int(pid)
+
+def _display_of(path):
+    return _parse_socket_name(path)[0]
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0
+
+def _cache_file():
     xdg_runtime = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
-    pattern = os.path.join(xdg_runtime, "niri.wayland-1.*.sock")
-    matches = glob.glob(pattern)
-    return matches[0] if matches else None
+    return os.path.join(xdg_runtime, "niri_tools.socket-path")
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _write_cache(cache_path, path):
+    tmp_path = f"{cache_path}.{os.getpid()}"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
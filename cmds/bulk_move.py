@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+import sys
+
+from client.socket_client import NiriClient
+from client.socket_path import get_niri_socket_path
+from ipc.actions import (
+    move_window_to_workspace_action,
+    move_window_to_monitor_action,
+)
+from state.snapshot import fetch_snapshot
+from util.cli import parse_bulk_move_args
+from util.window_utils import find_windows_by_workspace_id
+from util.workspace_utils import find_workspace_by_name
+
+def main(argv=None):
+    args = parse_bulk_move_args(argv)
+
+    socket_path = get_niri_socket_path()
+    if not socket_path:
+        print("❌ Could not find Niri IPC socket.")
+        return 1
+
+    with NiriClient(socket_path) as client:
+        return bulk_move(client, args)
+
+def bulk_move(client, args, state=None):
+    """Move every selected window to the target; returns an exit status.
+
+    All windows are resolved from one snapshot and the moves go out as
+    one batch, in column order, so a workspace of 15 windows costs two
+    round trips instead of 15 process launches.
+    """
+    workspaces, windows = fetch_snapshot(client, state)
+
+    selected = select_windows(workspaces, windows, args)
+    if selected is None:
+        return 1
+
+    target = resolve_target(workspaces, args.target, args.target_id)
+    if target is None:
+        print(f"❌ No {'workspace' if args.target == 'w' else 'output'} matches '{args.target_id}'")
+        return 1
+    # Windows already where they are going stay put.
+    selected = [win for win in selected if win.get("workspace_id") != target["id"]]
+    if not selected:
+        print("✅ Nothing to move")
+        return 0
+
+    selected = in_column_order(selected, workspaces)
+    if args.target == "w":
+        # By id: the snapshot already resolved it, and an index would be
+        # read against whichever output has focus when niri gets it.
+        ref = {"Id": target["id"]}
+        actions = [move_window_to_workspace_action(win["id"], ref, False) for win in selected]
+    else:
+        actions = [move_window_to_monitor_action(win["id"], args.target_id) for win in selected]
+
+    for win in selected:
+        print(f"🪟 {win.get('id')}: {win.get('app_id', '')} — {win.get('title', '')}")
+    if args.dry_run:
+        print(f"📋 Would move {len(selected)} window(s) to {args.target_id}")
+        return 0
+
+    print(f"📤 Moving {len(selected)} window(s) to {args.target_id}...")
+    if args.strict_order:
+        results = [client.request(action) for action in actions]
+    else:
+        results = client.batch(actions)
+
+    failed = [(win, result) for win, result in zip(selected, results) if "Ok" not in result]
+    for win, result in failed:
+        print(f"❌ {win.get('id')}: {result.get('Err', result)}")
+    print(f"✅ Moved {len(selected) - len(failed)} of {len(selected)} window(s)")
+    return 1 if failed else 0
+
+def select_windows(workspaces, windows, args):
+    """Windows matching every given selector, or None if one cannot be resolved."""
+    if args.from_workspace:
+        source = find_workspace(workspaces, args.from_workspace)
+        if source is None:
+            print(f"❌ No workspace matches '{args.from_workspace}'")
+            return None
+        windows = find_windows_by_workspace_id(windows, source["id"])
+    if args.app_id:
+        app_id = args.app_id.lower()
+        windows = [win for win in windows if win.get("app_id", "").lower() == app_id]
+    if args.match:
+        match_str = args.match.lower()
+        windows = [
+            win for win in windows
+            if match_str in win.get("title", "").lower()
+            or match_str in win.get("app_id", "").lower()
+            or match_str in str(win.get("id", ""))
+        ]
+    return windows
+
+def find_workspace(workspaces, reference):
+    """A workspace by name, or by index on the focused output like niri."""
+    if not reference.isdecimal():
+        return find_workspace_by_name(workspaces, reference)
+    output = next((wsp.get("output") for wsp in workspaces if wsp.get("is_focused")), None)
+    for wsp in workspaces:
+        if wsp.get("output") == output and wsp.get("idx") == int(reference):
+            return wsp
+    return None
+
+def resolve_target(workspaces, target, target_id):
+    """The workspace the windows will land on."""
+    if target == "w":
+        return find_workspace(workspaces, target_id)
+    for wsp in workspaces:
+        if wsp.get("output") == target_id and wsp.get("is_active"):
+            return wsp
+    return None
+
+def in_column_order(windows, workspaces):
+    """Sort by source workspace, then column and row, floating windows last.
+
+    Each move appends the window to the target, so sending them in this
+    order rebuilds the columns in the same order. Without layout data
+    (older niri) the snapshot order is kept.
+    """
+    position = {wsp["id"]: (wsp.get("output") or "", wsp.get("idx") or 0) for wsp in workspaces}
+
+    def key(win):
+        layout = win.get("layout") or {}
+        pos = layout.get("pos_in_scrolling_layout")
+        return (position.get(win.get("workspace_id"), ("", 0)), pos is None, tuple(pos or ()))
+
+    return sorted(windows, key=key)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import importlib
+import sys
+
+# Subcommand -> (module with a main(argv) function, one-line help). A module
+# is only imported when its subcommand runs, so start-up cost stays flat as
+# tools are added.
+SUBCOMMANDS = {
+    "move-window": ("cmds.move_window", "Move a window matched by title/app_id to a workspace or monitor"),
+    "bulk-move": ("cmds.bulk_move", "Move every window matching a selector, or a whole workspace, at once"),
+    "layout": ("cmds.layout", "Save the window layout to a file, or restore it"),
+    "scratchpad": ("cmds.scratchpad", "Put, get or toggle scratchpad windows, or list them as JSON"),
+    "windows": ("cmds.windows", "Print a table of all windows"),
+    "workspaces": ("cmds.workspaces", "Show the windows on the scratchpad workspace"),
+    "events": ("cmds.events", "Tail the niri event stream"),
+    "edit-focus-ring": ("cmds.edit_focus_ring", "Open the focus-ring config editor"),
+}
+
+def usage():
+    lines = ["usage: niri-tools <command> [args...]", "", "commands:"]
+    for name, (_, help_text) in SUBCOMMANDS.items():
+        lines.append(f"  {name:<16} {help_text}")
+    lines.append("")
+    lines.append("Run 'niri-tools <command> --help' for the command's options.")
+    return "\n".join(lines)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0 if argv else 2
+
+    entry = SUBCOMMANDS.get(argv[0])
+    if entry is None:
+        print(f"❌ Unknown command: {argv[0]}\n", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+
+    sys.argv[0] = f"niri-tools {argv[0]}"
+    module = importlib.import_module(entry[0])
+    return module.main(argv[1:])
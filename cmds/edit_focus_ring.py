@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+
+import argparse
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Edit the focus-ring section of niri's config.kdl.")
+    parser.add_argument("--toolkit", choices=["qt", "tk"], default="qt",
+                        help="qt=PyQt5 editor (niri-hot-change), tk=Tkinter editor (niri-modify-focus-ring)")
+    # Anything else is for the editor itself, e.g. --preview_rate.
+    args, rest = parser.parse_known_args(argv)
+
+    # Only the chosen toolkit gets imported.
+    if args.toolkit == "qt":
+        from editors.focus_ring_qt import main as editor_main
+    else:
+        from editors.focus_ring_tk import main as editor_main
+    return editor_main(rest)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import sys
+
+from client.socket_path import get_niri_socket_path
+from client.socket_client import NiriClient
+from client.socket_client import event_type, subscribe
+from client.socket_client import subscribe_to_event_stream
+from util.cli import parse_events_args
+
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+def main(argv=None):
+    args = parse_events_args(argv)
+
+    socket_path = get_niri_socket_path()
+    if not socket_path:
+        print("❌ Could not find Niri IPC socket.", file=sys.stderr)
+        return 1
+
+    client = NiriClient(socket_path)
+    try:
+        sock = client.connect()
+    except ConnectionError:
+        return 1
+
+    if not (args.compact or args.only or args.fields):
+        try:
+            return subscribe_to_event_stream(sock)
+        except BrokenPipeError:
+            _close_quietly(sys.stdout)
+            return 0
+
+    only = set(_split(args.only)) if args.only else None
+    fields = [field.split(".") for field in _split(args.fields)] if args.fields else None
+    out = open(sys.stdout.fileno(), "wb", buffering=OUTPUT_BUFFER_SIZE, closefd=False)
+    status = 0
+    try:
+        status = tail_events(sock, out, only, fields) or 0
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+    finally:
+        sock.close()
+        _close_quietly(out)
+    return status
+
+def tail_events(sock, out, only=None, fields=None):
+    """Write events from sock to out as NDJSON.
+
+    Events are filtered by type before they are decoded, and without a
+    field projection the raw bytes niri sent are written as they are.
+    Output is block-buffered and flushed whenever the socket has nothing
+    more queued, so a burst costs one write while a quiet stream still
+    shows each event as it arrives.
+    """
+    try:
+        reader = subscribe(sock)
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    write = out.write
+    for line in reader:
+        kind = event_type(line)
+        if only is not None and kind not in only:
+            continue
+        if fields is None:
+            write(line)
+            write(b"\n")
+        else:
+            payload = json.loads(line).get(kind)
+            write(json.dumps(project(kind, payload, fields), separators=(",", ":")).encode("utf-8"))
+            write(b"\n")
+        if not reader.ready():
+            out.flush()
+
+def project(kind, payload, fields):
+    """Pick dotted field paths out of an event payload into a flat dict."""
+    projected = {"event": kind}
+    for path in fields:
+        value = payload
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            projected[".".join(path)] = value
+    return projected
+
+def _split(option):
+    return [part.strip() for part in option.split(",") if part.strip()]
+
+def _close_quietly(out):
+    try:
+        out.close()
+    except BrokenPipeError:
+        # The reader is gone; drop what is left and keep Python from
+        # complaining about stdout at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import re
+import sys
+
+from client.socket_client import NiriClient
+from client.socket_path import get_niri_socket_path
+from cmds.bulk_move import in_column_order
+from ipc.actions import (
+    move_window_to_workspace_action,
+    move_window_to_monitor_action,
+)
+from state.snapshot import fetch_snapshot
+from util.cli import parse_layout_args
+
+LAYOUT_VERSION = 1
+
+def main(argv=None):
+    args = parse_layout_args(argv)
+
+    socket_path = get_niri_socket_path()
+    if not socket_path:
+        print("❌ Could not find Niri IPC socket.")
+        return 1
+
+    with NiriClient(socket_path) as client:
+        if args.action == "save":
+            return save_layout(client, args.file)
+        return restore_layout(client, args.file, args.strict_order, args.dry_run)
+
+def save_layout(client, path, state=None):
+    """Write every window's workspace and output to path."""
+    workspaces, windows = fetch_snapshot(client, state)
+    by_id = {wsp["id"]: wsp for wsp in workspaces}
+
+    entries = []
+    for win in in_column_order(windows, workspaces):
+        wsp = by_id.get(win.get("workspace_id"))
+        if wsp is None:
+            continue
+        entries.append({
+            "app_id": win.get("app_id", ""),
+            "title": win.get("title", ""),
+            "title_pattern": title_pattern(win.get("title", "")),
+            "workspace": {"name": wsp.get("name"), "idx": wsp.get("idx"), "output": wsp.get("output")},
+        })
+
+    tmp_path = f"{path}.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": LAYOUT_VERSION, "windows": entries}, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
+    print(f"💾 Saved {len(entries)} window(s) to {path}")
+    return 0
+
+def restore_layout(client, path, strict_order=False, dry_run=False, state=None):
+    """Move windows back to where path says, skipping those already there."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read layout {path}: {e}")
+        return 1
+
+    entries = saved.get("windows") if isinstance(saved, dict) else None
+    if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+        print(f"❌ {path} is not a saved layout: expected an object with a \"windows\" list")
+        return 1
+
+    workspaces, windows = fetch_snapshot(client, state)
+    moves, missing = plan_restore(entries, workspaces, windows)
+
+    for entry in missing:
+        print(f"⚠️ No window for {entry.get('app_id')}: {entry.get('title')}")
+    if not moves:
+        print("✅ Layout already in place")
+        return 0
+
+    for win, action, where in moves:
+        print(f"🪟 {win.get('id')}: {win.get('app_id', '')} — {win.get('title', '')} → {where}")
+    if dry_run:
+        print(f"📋 Would move {len(moves)} window(s)")
+        return 0
+
+    actions = [action for _, action, _ in moves]
+    results = [client.request(a) for a in actions] if strict_order else client.batch(actions)
+    failed = [(win, result) for (win, _, _), result in zip(moves, results) if "Ok" not in result]
+    for win, result in failed:
+        print(f"❌ {win.get('id')}: {result.get('Err', result)}")
+    print(f"✅ Moved {len(moves) - len(failed)} of {len(moves)} window(s)")
+    return 1 if failed else 0
+
+def plan_restore(entries, workspaces, windows):
+    """Return ``([(window, action, description)], [unmatched entries])``.
+
+    Saved entries are matched to live windows by app_id, and within an
+    app_id by exact title first, then by the entry's ``title_pattern``
+    (a regular expression; save writes one, see title_pattern), then by
+    order. Each
+    window is used once. Windows already on their saved workspace get no
+    action; when the saved workspace is gone but its output is back, the
+    window goes to that output's active workspace.
+    """
+    matched = match_windows(entries, windows)
+    by_output_idx = {(wsp.get("output"), wsp.get("idx")): wsp for wsp in workspaces}
+    by_name = {wsp["name"]: wsp for wsp in workspaces if wsp.get("name")}
+    active = {wsp.get("output"): wsp for wsp in workspaces if wsp.get("is_active")}
+
+    moves = []
+    missing = []
+    for entry, win in zip(entries, matched):
+        if win is None:
+            missing.append(entry)
+            continue
+        place = entry.get("workspace") or {}
+        target = by_name.get(place.get("name")) if place.get("name") else by_output_idx.get((place.get("output"), place.get("idx")))
+        if target is not None:
+            if win.get("workspace_id") != target["id"]:
+                moves.append((win, move_window_to_workspace_action(win["id"], {"Id": target["id"]}, False),
+                              _describe(target)))
+        elif place.get("output") in active:
+            if win.get("workspace_id") != active[place["output"]]["id"]:
+                moves.append((win, move_window_to_monitor_action(win["id"], place["output"]), place["output"]))
+        else:
+            missing.append(entry)
+    return moves, missing
+
+def title_pattern(title):
+    """A pattern for title with its numbers generalised.
+
+    Counters, unread badges and the like change between sessions
+    ("Inbox (3)", "foot 12"), so each run of digits matches any number.
+    """
+    escaped = re.escape(title).replace("\\ ", " ")  # keep it readable in the file
+    return "^" + re.sub(r"\d+", r"\\d+", escaped) + "$"
+
+def match_windows(entries, windows):
+    """The live window for each saved entry, or None."""
+    by_app_id = {}
+    for win in windows:
+        by_app_id.setdefault(win.get("app_id", ""), []).append(win)
+
+    matched = [None] * len(entries)
+    used = set()
+    broken = set()  # entries whose title_pattern does not compile
+
+    def claim(i, predicate):
+        for win in by_app_id.get(entries[i].get("app_id", ""), ()):
+            if win["id"] not in used and predicate(win):
+                used.add(win["id"])
+                matched[i] = win
+                return
+
+    # Strictest rule first across all entries, so a loose match never
+    # takes a window another entry names exactly.
+    for i, entry in enumerate(entries):
+        claim(i, lambda win: win.get("title", "") == entry.get("title"))
+    for i, entry in enumerate(entries):
+        if matched[i] is None and entry.get("title_pattern"):
+            try:
+                pattern = re.compile(entry["title_pattern"])
+            except (re.error, TypeError) as e:
+                print(f"❌ Bad title_pattern {entry['title_pattern']!r} for {entry.get('app_id')}: {e}")
+                broken.add(i)
+                continue
+            claim(i, lambda win: pattern.search(win.get("title", "")) is not None)
+    for i in range(len(entries)):
+        if matched[i] is None and i not in broken:
+            claim(i, lambda win: True)
+    return matched
+
+def _describe(wsp):
+    return wsp.get("name") or f"{wsp.get('output')}#{wsp.get('idx')}"
+
+if __name__ == "__main__":
+    sys.exit(main())
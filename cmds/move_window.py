@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from client.socket_client import send_command
+from client.socket_client import NiriClient
 from client.socket_path import get_niri_socket_path
 from ipc.actions import (
     list_windows_query,
@@ -9,36 +9,36 @@ from ipc.actions import (
     focus_window_action,
     format_workspace_reference,
 )
-from util.window_utils import find_matching_window
-import json
+from ipc.models import decode_windows
+from util.cli import parse_args
 
-def move_window_by_match(args):
+def main(argv=None):
+    args = parse_args(argv)
     sock_path = get_niri_socket_path()
     if not sock_path:
         print("❌ Could not find Niri IPC socket.")
-        return
-    
-    print(f"📡 Using socket path: {sock_path}")
-    print("📤 Sending IPC Request: Windows")
-    response = send_command(sock_path, list_windows_query())
+        return 1
 
-    print("📥 Raw IPC Response:")
-    print(json.dumps(response, indent=2))
+    with NiriClient(sock_path) as client:
+        return move_window_by_match(client, args)
 
-    if isinstance(response.get("Ok"), dict) and "Windows" in response["Ok"]:
-        windows = response["Ok"]["Windows"]
-    else:
-        windows = response.get("Ok", [])
-
-    print(f"📦 Found {len(windows)} window(s)")
+def move_window_by_match(client, args, state=None):
+    """Move the window matching args.match; returns an exit status.
 
-    for win in windows:
-        print(f"🪟 Window => ID: {win.get('id')}, Title: {win.get('title')}, App ID: {win.get('app_id')}")
+    With or without the daemon's state, the same matcher picks the window:
+    the index's order of preference for --match_mode first, the ranked
+    tiers for --match_mode ranked.
+    """
+    if state is not None and args.match_mode == "ranked":
+        matched = _best_ranked(state.rank_windows(args.match, limit=5))
+    elif state is not None:
+        matched = state.find_matching_window(args.match)
+    else:
+        matched = _fetch_matching_window(client, args)
 
-    matched = find_matching_window(windows, args.match)
     if not matched:
         print(f"❌ No matching window found for: {args.match}")
-        return
+        return 1
 
     print("✅ Found matching window")
     print(f"  🖼 Title: {matched.get('title')}")
@@ -46,23 +46,52 @@ def move_window_by_match(args):
 
     window_id = matched["id"]
 
+    # Moves go out together; focusing has to wait until they are applied.
+    moves = []
     if args.target == "w":
         ref = format_workspace_reference(args.target_id)
-        action = move_window_to_workspace_action(window_id, ref, args.focus)
-        print("📤 Sending MoveWindowToWorkspace...")
-        result = send_command(sock_path, action)
-        print("📥 Received:", result)
-        
+        moves.append(("MoveWindowToWorkspace", move_window_to_workspace_action(window_id, ref, args.focus)))
+
     if args.target == "m":
         print(f"  🧩 target_id: {args.target_id}")
-        action = move_window_to_monitor_action(window_id, args.target_id)
-        print("📤 Sending MoveWindowToMonitor...")
-        result = send_command(sock_path, action)
-        print("📥 Received:", result)
+        moves.append(("MoveWindowToMonitor", move_window_to_monitor_action(window_id, args.target_id)))
+
+    failed = []
+    if moves:
+        print(f"📤 Sending {', '.join(name for name, _ in moves)}...")
+        for (name, _), result in zip(moves, client.batch([action for _, action in moves])):
+            if "Ok" not in result:
+                failed.append((name, result))
 
     if args.focus:
-        action = focus_window_action(window_id)
         print("📤 Sending FocusWindow...")
-        result = send_command(sock_path, action)
-        print("📥 Received:", result)
+        result = client.request(focus_window_action(window_id))
+        if "Ok" not in result:
+            failed.append(("FocusWindow", result))
+
+    for name, result in failed:
+        print(f"❌ {name}: {result.get('Err', result)}")
+    if failed:
+        return 1
+    if moves:
+        print(f"✅ Moved window {window_id} to {args.target_id}")
+    if args.focus:
+        print(f"✅ Focused window {window_id}")
+    return 0
+
+def _fetch_matching_window(client, args):
+    print(f"📡 Using socket path: {client.sock_path}")
+    windows = decode_windows(client.request(list_windows_query(), raw=True))
+    print(f"📦 Found {len(windows)} window(s)")
+
+    if args.match_mode == "ranked":
+        from util.window_match import rank_windows
+        return _best_ranked(rank_windows(windows, args.match, limit=5))
+    from util.window_index import first_matching_window
+    return first_matching_window(windows, args.match)
 
+def _best_ranked(ranked):
+    from util.window_match import TIER_NAMES
+    for tier, win in ranked:
+        print(f"🏁 {TIER_NAMES[tier]:<9} ID: {win.get('id')}, Title: {win.get('title')}, App ID: {win.get('app_id')}")
+    return ranked[0][1] if ranked else None
@@ -1,72 +1,185 @@
 #!/usr/bin/env python3
 
-from client.socket_client import (
-    connect_to_niri_socket,
-    send_command,
-)
-
+from client.socket_client import NiriClient
 from client.socket_path import get_niri_socket_path
-
 from ipc.actions import (
-    list_windows_query,
-    list_workspaces_query,
     move_window_to_workspace_action,
     move_window_to_monitor_action,
     focus_window_action,
-    format_workspace_reference,
 )
+from state.snapshot import fetch_snapshot
 
 from util.window_utils import (
-    find_matching_window,
     find_windows_by_workspace_id,
 )
 
 from util.workspace_utils import (
-    find_workspace_by_name,    
+    find_workspace_by_name,
 )
 
-import json
+from util.cli import parse_scratchpad_args
 
-def get_windows_from_scratchpad(scratchpad_name):
-    socket_path = get_niri_socket_path()
-    if not socket_path:
-        return
+import json
+import os
+import sys
 
-    sock = connect_to_niri_socket(socket_path)
-    if not sock:
-        return
+# get/toggle exit with this after printing the candidates when there is
+# more than one and no picker to choose with, as in the daemon. The
+# caller picks one and asks again with --window_id.
+CHOOSE_WINDOW = 3
 
-    response = send_command(socket_path, list_workspaces_query())
+def main(argv=None):
+    args = parse_scratchpad_args(argv)
 
-    if isinstance(response.get("Ok"), dict) and "Workspaces" in response["Ok"]:
-        workspaces = response["Ok"]["Workspaces"]
+    socket_path = get_niri_socket_path()
+    if not socket_path:
+        print("❌ Could not find Niri IPC socket.")
+        return 1
+
+    with NiriClient(socket_path) as client:
+        return run_scratchpad(client, args)
+
+def run_scratchpad(client, args, state=None):
+    """Carry out args.action; returns an exit status.
+
+    Everything runs in this process: no jq, no second script and one
+    snapshot of niri's state per call.
+    """
+    name = args.scratchpad_name
+    if args.action == "list":
+        windows = get_windows_from_scratchpad(client, name, state=state)
+        print(json.dumps([win.to_dict() for win in windows]))
+        return 0
+    if args.action == "put":
+        return put_focused_window(client, name)
+
+    workspaces, windows = fetch_snapshot(client, state)
+    if args.action == "toggle":
+        focused = next((win for win in windows if win.get("is_focused")), None)
+        if focused is not None and focused["id"] in _read_shown(name):
+            return put_focused_window(client, name, focused["id"])
+    return get_window(client, args, workspaces, windows)
+
+def put_focused_window(client, scratchpad_name, window_id=None):
+    print(f"📥 Putting focused window into scratchpad '{scratchpad_name}'...")
+    # A null window_id makes niri act on the focused window.
+    result = client.request(move_window_to_workspace_action(None, {"Name": scratchpad_name}, focus=False))
+    if "Ok" not in result:
+        print(f"❌ {result.get('Err', result)}")
+        return 1
+    if window_id is not None:
+        _write_shown(scratchpad_name, _read_shown(scratchpad_name) - {window_id})
+    return 0
+
+def get_window(client, args, workspaces, windows):
+    """Bring a scratchpad window to the focused output and focus it."""
+    name = args.scratchpad_name
+    wsp = find_workspace_by_name(workspaces, name)
+    if wsp is None:
+        print(f"❌ No workspace named '{name}'")
+        return 1
+
+    candidates = find_windows_by_workspace_id(windows, wsp["id"])
+    if not candidates:
+        print(f"❌ No windows found in scratchpad '{name}'")
+        return 1
+
+    if args.window_id is not None:
+        win = next((win for win in candidates if win.get("id") == args.window_id), None)
+        if win is None:
+            print(f"❌ Window {args.window_id} is not in scratchpad '{name}'")
+            return 1
+    elif len(candidates) == 1:
+        win = candidates[0]
+    elif not args.picker:
+        print("\n".join(picker_lines(candidates)))
+        return CHOOSE_WINDOW
     else:
-        workspaces = response.get("Ok", [])
-
-    # print("Raw IPC Response-Workspaces:")
-    # print(json.dumps(response, indent=2))
-
-    # test module
-    # wsp = find_workspace_by_id(workspaces, 4)
-    # print(f"Workspace for id 4: {wsp}")
+        win = pick_window(candidates, args.picker)
+        if win is None:
+            return 0
+
+    output = args.target_output or _focused_output(workspaces)
+    if not output:
+        print("❌ Could not tell which output has focus; pass --target_output")
+        return 1
+
+    print(f"📤 Bringing {win.get('app_id', '')}: {win.get('title', '')} to {output}...")
+    result = client.request(move_window_to_monitor_action(win["id"], output))
+    if "Ok" not in result:
+        print(f"❌ {result.get('Err', result)}")
+        return 1
+    # The window has moved either way, so toggle must still know to send
+    # it back. Focusing has to wait until the move is applied.
+    _remember_shown(name, win["id"])
+    result = client.request(focus_window_action(win["id"]))
+    if "Ok" not in result:
+        print(f"❌ {result.get('Err', result)}")
+        return 1
+    return 0
+
+def pick_window(windows, picker):
+    """Let the user choose one of windows with picker (rofi by default)."""
+    import shlex
+    import subprocess
+
+    lines = "\n".join(picker_lines(windows))
+    try:
+        proc = subprocess.run(shlex.split(picker), input=lines, capture_output=True, text=True)
+    except OSError as e:
+        print(f"❌ Could not run picker '{picker}': {e}")
+        return None
+
+    window_id = proc.stdout.strip().split("|", 1)[0]
+    for win in windows:
+        if str(win.get("id")) == window_id:
+            return win
+    return None
+
+def picker_lines(windows):
+    """One ``id|app_id: title`` line per window, as the picker gets them."""
+    return [f"{win.get('id')}|{win.get('app_id', '')}: {win.get('title', '')}" for win in windows]
+
+def get_windows_from_scratchpad(client, scratchpad_name, state=None):
+    workspaces, windows = fetch_snapshot(client, state)
 
     wsp = find_workspace_by_name(workspaces, scratchpad_name)
-    # print(f"Worksapce for name scratchpad: {wsp}")
-
-    response = send_command(socket_path, list_windows_query())
-
-    if isinstance(response.get("Ok"), dict) and "Windows" in response["Ok"]:
-        windows = response["Ok"]["Windows"]
-    else:
-        windows = response.get("Ok", [])
-
-    # print("Raw IPC Response-Windows:")
-    # print(json.dumps(response, indent=2))
-    
-    win = find_windows_by_workspace_id(windows, wsp.get("id",""))
-    # print(f"Windows for workspace: {wsp.get("id","")}")
-    # print(f"{win}")
-
-    return win
-
-    
+    if wsp is None:
+        return []
+
+    return find_windows_by_workspace_id(windows, wsp.get("id",""))
+
+def _focused_output(workspaces):
+    for wsp in workspaces:
+        if wsp.get("is_focused"):
+            return wsp.get("output")
+    return None
+
+# Windows brought out of a scratchpad are remembered so that toggle knows
+# to send them back; kept in the runtime dir so the daemon and one-off
+# runs share them.
+
+def _shown_path(scratchpad_name):
+    xdg_runtime = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+    return os.path.join(xdg_runtime, f"niri_tools.scratchpad-{scratchpad_name}")
+
+def _read_shown(scratchpad_name):
+    try:
+        with open(_shown_path(scratchpad_name), "r", encoding="utf-8") as f:
+            return {int(line) for line in f if line.strip().isdecimal()}
+    except OSError:
+        return set()
+
+def _remember_shown(scratchpad_name, window_id):
+    shown = _read_shown(scratchpad_name) | {window_id}
+    _write_shown(scratchpad_name, shown)
+
+def _write_shown(scratchpad_name, shown):
+    try:
+        with open(_shown_path(scratchpad_name), "w", encoding="utf-8") as f:
+            f.write("".join(f"{window_id}\n" for window_id in sorted(shown)))
+    except OSError:
+        pass
+
+if __name__ == "__main__":
+    sys.exit(main())
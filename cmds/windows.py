@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+
+import sys
+
+from client.socket_client import NiriClient
+from client.socket_path import get_niri_socket_path
+from ipc.actions import list_windows_query
+from ipc.models import decode_windows
+from util.cli import parse_windows_args
+
+HEADERS = {
+    "id": "ID",
+    "title": "Title",
+    "app_id": "App ID",
+    "workspace_id": "WS",
+    "is_focused": "Focused",
+    "is_floating": "Floating",
+    "is_urgent": "Urgent",
+}
+
+# Fixed widths for the live table, so a changed cell never shifts the
+# other rows and only the changed rows have to be redrawn.
+WIDTHS = {
+    "id": 6,
+    "app_id": 24,
+    "workspace_id": 4,
+    "is_focused": 8,
+    "is_floating": 8,
+    "is_urgent": 8,
+}
+
+FRAME_INTERVAL = 1 / 30  # seconds between live redraws at most
+
+def main(argv=None):
+    args = parse_windows_args(argv)
+
+    socket_path = get_niri_socket_path()
+    if not socket_path:
+        print("❌ Could not find Niri IPC socket.")
+        return 1
+
+    if args.watch:
+        return watch_windows(socket_path, args)
+
+    # Imported here so that only the table path pays for it.
+    from tabulate import tabulate
+
+    with NiriClient(socket_path) as client:
+        windows = decode_windows(client.request(list_windows_query(), raw=True))
+
+    table = []
+    for win in sort_windows(windows, args.sort, args.reverse):
+        table.append([cell(win, column, args.title_width) for column in args.columns])
+
+    headers = [HEADERS[column] for column in args.columns]
+    print(tabulate(table, headers=headers, tablefmt="github"))
+    return 0
+
+def cell(win, column, title_width=30):
+    if column == "title":
+        return (win.get("title") or "")[:title_width]
+    if column == "id":
+        return win.get("id")
+    return win.get(column, "")
+
+def sort_windows(windows, column, reverse=False):
+    if column is None:
+        return list(reversed(windows)) if reverse else windows
+    return sorted(windows, key=lambda win: _sort_key(win, column), reverse=reverse)
+
+def _sort_key(win, column):
+    value = win.get(column)
+    if isinstance(value, str):
+        value = value.lower()
+    # None sorts first without comparing it to anything else.
+    return (value is not None, value if value is not None else 0, win.get("id", 0))
+
+def watch_windows(socket_path, args):
+    """Show a live window table until interrupted."""
+    import select
+    import signal
+    import socket
+    import time
+
+    from client.socket_client import subscribe
+    from ipc.fast_json import loads
+    from state.niri_state import NiriState
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        # The first events after the subscription carry the full state.
+        reader = subscribe(sock)
+    except OSError as e:
+        print(f"❌ Could not subscribe to the event stream: {e}")
+        sock.close()
+        return 1
+
+    state = NiriState()
+    table = LiveWindowTable(sys.stdout, args.columns, args.sort, args.reverse, args.title_width)
+    signal.signal(signal.SIGWINCH, lambda *_: table.invalidate())
+
+    table.enter()
+    dirty = True
+    next_frame = 0.0
+    try:
+        while True:
+            if not reader.ready():
+                # End of a burst: draw once for everything it changed, but
+                # no more often than FRAME_INTERVAL however fast events come.
+                now = time.monotonic()
+                if dirty and now >= next_frame:
+                    table.draw(state.windows.values())
+                    dirty = False
+                    next_frame = now + FRAME_INTERVAL
+                timeout = max(0.0, next_frame - now) if dirty else 0.5
+                readable, _, _ = select.select([sock], [], [], timeout)
+                if not readable:
+                    dirty = dirty or table.size is None
+                    continue
+            line = reader.readline()
+            if line is None:
+                break
+            state.apply_event(loads(line))
+            dirty = True
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
+        table.leave()
+    return 0
+
+class LiveWindowTable:
+    """A window table redrawn in place with cursor addressing.
+
+    Every draw sorts the windows, renders only the rows that fit on the
+    screen and rewrites just the lines whose text changed since the last
+    draw, all in one write. A title change is one rewritten line
+    whatever the number of windows; nothing is rebuilt through tabulate.
+    """
+
+    def __init__(self, out, columns, sort=None, reverse=False, title_width=30):
+        self.out = out
+        self.columns = columns
+        self.sort = sort
+        self.reverse = reverse
+        self.title_width = title_width
+        self.widths = [title_width if c == "title" else WIDTHS[c] for c in columns]
+        self.screen = {}  # screen line number -> text currently shown
+        self.size = None
+
+    def invalidate(self):
+        """Force a full redraw, e.g. after the terminal was resized."""
+        self.size = None
+
+    def enter(self):
+        # Alternate screen, hidden cursor.
+        self.out.write("\x1b[?1049h\x1b[?25l")
+        self.out.flush()
+
+    def leave(self):
+        self.out.write("\x1b[?25h\x1b[?1049l")
+        self.out.flush()
+
+    def draw(self, windows):
+        import shutil
+
+        size = shutil.get_terminal_size()
+        parts = []
+        if size != self.size:
+            self.size = size
+            self.screen = {}
+            parts.append("\x1b[2J")
+
+        windows = list(windows)
+        rows = max(0, size.lines - 3)
+        visible = sort_windows(windows, self.sort, self.reverse)[:rows]
+
+        width = size.columns
+        lines = {1: self._format([HEADERS[c] for c in self.columns])[:width],
+                 2: "  ".join("-" * w for w in self.widths)[:width]}
+        for i, win in enumerate(visible):
+            text = self._format([cell(win, c, self.title_width) for c in self.columns])[:width]
+            # Highlight the focused window.
+            lines[3 + i] = f"\x1b[1m{text}\x1b[0m" if win.get("is_focused") else text
+        hidden = len(windows) - len(visible)
+        sort_label = self.sort or "niri order"
+        lines[size.lines] = (f"{len(windows)} windows, sorted by {sort_label}"
+                             f"{' (desc)' if self.reverse else ''}"
+                             f"{f', {hidden} below the fold' if hidden else ''}")[:width]
+
+        for number, text in lines.items():
+            if self.screen.get(number) != text:
+                parts.append(f"\x1b[{number};1H{text}\x1b[K")
+        for number in self.screen.keys() - lines.keys():
+            parts.append(f"\x1b[{number};1H\x1b[K")
+        self.screen = lines
+
+        if parts:
+            self.out.write("".join(parts))
+            self.out.flush()
+
+    def _format(self, values):
+        return "  ".join(
+            _fit(value, width) for value, width in zip(values, self.widths)
+        )
+
+def _fit(value, width):
+    text = "" if value is None else str(value)
+    return text[:width].ljust(width)
+
+if __name__ == "__main__":
+    sys.exit(main())
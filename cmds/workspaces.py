@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+from client.socket_path import get_niri_socket_path
+from client.socket_client import NiriClient
+from ipc.actions import list_workspaces_query
+from ipc.actions import list_windows_query
+from ipc.models import decode_windows, decode_workspaces
+from util.workspace_utils import find_workspace_by_id
+from util.workspace_utils import find_workspace_by_name
+from util.window_utils import find_windows_by_workspace_id
+import json
+import sys
+
+def main(argv=None):
+    socket_path = get_niri_socket_path()
+    if not socket_path:
+        print("❌ Could not find Niri IPC socket.")
+        return 1
+
+    with NiriClient(socket_path) as client:
+        return show_scratchpad_windows(client)
+
+def show_scratchpad_windows(client):
+    response = client.request(list_workspaces_query())
+
+    workspaces = decode_workspaces(response)
+
+    # print("Raw IPC Response-Workspaces:")
+    # print(json.dumps(response, indent=2))
+
+    # test module
+    # wsp = find_workspace_by_id(workspaces, 4)
+    # print(f"Workspace for id 4: {wsp}")
+
+    wsp = find_workspace_by_name(workspaces, "scratchpad")
+    # print(f"Worksapce for name scratchpad: {wsp}")
+    if wsp is None:
+        print("❌ No workspace named 'scratchpad'")
+        return 1
+
+    response = client.request(list_windows_query())
+
+    windows = decode_windows(response)
+
+    print("Raw IPC Response-Windows:")
+    print(json.dumps(response, indent=2))
+    
+    win = find_windows_by_workspace_id(windows, wsp.get("id",""))
+    print(f"Windows for workspace: {wsp.get('id','')}")
+    print(f"{win}")
+    return 0
+                                       
+if __name__ == "__main__":
+    sys.exit(main())
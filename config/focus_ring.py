@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""The focus-ring block of niri's config, as the editors see it.
+
+The block is located through the KDL index (``layout/focus-ring``), so
+commented-out copies, other ``focus-ring`` nodes (e.g. in window rules)
+and nested braces are no longer mistaken for it. Inside the block the
+editors still work line by line, because disabled settings are kept as
+``// key value`` comments that KDL itself does not see.
+"""
+
+import os
+import shlex
+
+from config import kdl
+
+CONFIG_PATH = os.path.expanduser('~/.config/niri/config.kdl')
+FOCUS_RING = "layout/focus-ring"
+
+def load_focus_ring(path=CONFIG_PATH):
+    """Return the config document and its focus-ring node."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Config file not found: {path}")
+    doc = kdl.load(path)
+    node = doc.find(FOCUS_RING)
+    if node is None or node.open is None:
+        raise ValueError("focus-ring block not found in config.")
+    return doc, node
+
+def parse_focus_ring(body):
+    """Parse each configurable line of the block's body into items."""
+    items = []
+    for line in body.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue  # Skip empty lines
+        enabled = not stripped.startswith('//')
+        clean = stripped.lstrip('/ ').strip() if not enabled else stripped
+
+        try:
+            tokens = shlex.split(clean)
+        except ValueError:
+            # Skip malformed lines rather than crashing
+            continue
+
+        if not tokens:
+            continue
+
+        key = tokens[0]
+
+        if key == 'off':
+            item = {'type': 'off', 'enabled': enabled, 'value': None, 'key': 'off'}
+
+        elif len(tokens) == 2 and key.endswith('-color'):
+            value = tokens[1].strip('"')
+            if value.startswith('#'):
+                item = {'type': 'color', 'enabled': enabled, 'value': value, 'key': key}
+            else:
+                item = {'type': 'simple', 'enabled': enabled, 'value': tokens[1], 'key': key}
+
+        elif 'gradient' in key and len(tokens) > 1:
+            params = {}
+            for t in tokens[1:]:
+                if '=' in t:
+                    pkey, pval = t.split('=', 1)
+                    params[pkey] = pval.strip('"')
+            if 'from' in params and 'to' in params:
+                item = {'type': 'gradient', 'enabled': enabled, 'value': params, 'key': key}
+            else:
+                continue
+
+        else:
+            if len(tokens) == 2:
+                item = {'type': 'simple', 'enabled': enabled, 'value': tokens[1], 'key': key}
+            else:
+                continue
+
+        items.append(item)
+    return items
+
+def reconstruct_block(items, indent='    ', closing='', newline='\n'):
+    """Rebuild the focus-ring block from items.
+
+    The block starts at the node name; the indentation before it is left
+    in the file as it was. indent goes before each setting and closing
+    before the final brace.
+    """
+    new_block = ['focus-ring {']
+    for item in items:
+        if item['type'] == 'off':
+            assembled = 'off'
+
+        elif item['type'] == 'simple':
+            assembled = f"{item['key']} {item['value']}"
+
+        elif item['type'] == 'color':
+            assembled = f"{item['key']} \"{item['value']}\""
+
+        elif item['type'] == 'gradient':
+            params = item['value']
+            param_strs = []
+            for pkey, pval in params.items():
+                if isinstance(pval, str) and pval.startswith('#'):
+                    param_strs.append(f'{pkey}="{pval}"')
+                elif isinstance(pval, str) and pval.isdigit():
+                    param_strs.append(f'{pkey}={pval}')
+                else:
+                    param_strs.append(f'{pkey}="{pval}"')
+            assembled = f"{item['key']} {' '.join(param_strs)}"
+
+        if item['enabled']:
+            new_block.append(f'{indent}{assembled}')
+        else:
+            new_block.append(f'{indent}// {assembled}')
+    new_block.append(f'{closing}}}')
+    return newline.join(new_block)
+
+def block_style(doc, node):
+    """The (indent, closing, newline) the block already uses in the file."""
+    text = doc.text
+    own = text[doc.line_start(node):node.start]
+    own = own if not own.strip() else ''
+
+    brace = node.close - 1
+    closing = text[text.rfind('\n', 0, brace) + 1:brace]
+    closing = closing if not closing.strip() else own
+
+    indent = None
+    for line in doc.body(node).splitlines()[1:]:  # [0] shares the '{' line
+        if line.strip():
+            indent = line[:len(line) - len(line.lstrip())]
+            break
+    if not indent:
+        # One step deeper, in the step the file uses for this node.
+        parent = node.parent
+        outer = text[doc.line_start(parent):parent.start] if parent is not None else ''
+        step = own[len(outer):] if own.startswith(outer) and own != outer else '    '
+        indent = closing + step
+
+    newline = '\r\n' if '\r\n' in doc.source(node) else '\n'
+    return indent, closing, newline
+
+def update_focus_ring(items, path=CONFIG_PATH):
+    """The config document with its focus-ring block rebuilt from items.
+
+    The config is re-read first if it changed on disk since it was
+    parsed, so edits made elsewhere are not overwritten. If the rebuilt
+    block is what the file already has, the same document comes back.
+    """
+    doc, node = load_focus_ring(path)
+    block = reconstruct_block(items, *block_style(doc, node))
+    if block == doc.source(node):
+        return doc
+    return doc.replace(node, block)
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""A structure-only KDL reader that keeps the source untouched.
+
+Only what an editor needs is parsed: node names, where every node starts
+and ends, and where its ``{ ... }`` children block is. Argument values
+are left as source text, so a block can be cut out, rewritten and put
+back without disturbing a byte around it. Comments (``//``, nested
+``/* */`` and ``/-``) are understood, so a commented-out ``focus-ring {``
+or a ``}`` inside a string no longer throws the block boundaries off.
+
+    doc = kdl.load(CONFIG_PATH)
+    node = doc.find("layout/focus-ring")
+    doc.source(node)  # 'focus-ring {\n ... }'
+
+Offsets are indices into the decoded text, which for the ASCII configs
+niri ships are also the byte offsets.
+"""
+
+import os
+import re
+import tempfile
+
+class KdlError(ValueError):
+    """The text is not KDL this reader understands."""
+
+_NEWLINE = "\r\n\x0b\x0c\x85\u2028\u2029"
+
+_TOKEN = re.compile(r"""
+    (?P<newline>\r\n|[\n\r\x0b\x0c\x85\u2028\u2029])
+  | (?P<space>[ \t\ufeff\u00a0\u1680\u2000-\u200a\u202f\u205f\u3000]+)
+  | (?P<comment>//[^\n\r\x0b\x0c\x85\u2028\u2029]*)
+  | (?P<block_comment>/\*)
+  | (?P<slashdash>/-)
+  | (?P<string>"(?:[^"\\]|\\.)*")
+  | (?P<raw_string>r?\#+"|r")
+  | (?P<open>\{)
+  | (?P<close>\})
+  | (?P<semicolon>;)
+  | (?P<escline>\\)
+  | (?P<word>\([^)]*\)|=|[^\s\\/(){}<>;\[\]=,"]+)
+""", re.VERBOSE | re.DOTALL)
+
+_BLOCK_COMMENT = re.compile(r"/\*|\*/")
+
+def tokenize(text, pos=0):
+    """Yield ``(kind, start, end)`` for every token of text, lazily.
+
+    Whitespace and comments are tokens too, so the spans cover the text
+    without gaps. Kinds are the group names of ``_TOKEN``, with block
+    comments reported as ``comment`` and raw strings as ``string``.
+    """
+    match = _TOKEN.match
+    end = len(text)
+    while pos < end:
+        m = match(text, pos)
+        if m is None:
+            raise KdlError(f"unexpected {text[pos]!r} on line {line_number(text, pos)}")
+        kind = m.lastgroup
+        stop = m.end()
+        if kind == "block_comment":
+            kind, stop = "comment", _block_comment_end(text, pos, stop)
+        elif kind == "raw_string":
+            closing = '"' + "#" * m.group().count("#")
+            close_at = text.find(closing, stop)
+            if close_at < 0:
+                raise KdlError(f"unterminated raw string on line {line_number(text, pos)}")
+            kind, stop = "string", close_at + len(closing)
+        yield kind, pos, stop
+        pos = stop
+
+def _block_comment_end(text, start, pos):
+    depth = 1
+    while depth:
+        m = _BLOCK_COMMENT.search(text, pos)
+        if m is None:
+            raise KdlError(f"unterminated /* comment on line {line_number(text, start)}")
+        depth += 1 if m.group() == "/*" else -1
+        pos = m.end()
+    return pos
+
+def line_number(text, pos):
+    return text.count("\n", 0, pos) + 1
+
+class Node:
+    """One node: ``name``, its ``path`` from the root and its span.
+
+    ``start``/``end`` cover the node from its name (or type annotation)
+    to its last token, ``;`` or closing ``}``. ``open``/``close`` cover
+    the children block from ``{`` to just past ``}``; both are None for
+    a node without one. Nodes commented out with ``/-``, and everything
+    inside them, have ``live`` set to False and are left out of the index.
+    """
+
+    __slots__ = ("name", "path", "start", "end", "open", "close", "children", "parent", "live")
+
+    def __init__(self, name, path, start, parent=None, live=True):
+        self.name = name
+        self.path = path
+        self.start = start
+        self.end = start
+        self.open = None
+        self.close = None
+        self.children = []
+        self.parent = parent
+        self.live = live
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def __repr__(self):
+        return f"<Node {self.path} {self.start}:{self.end}>"
+
+def parse(text):
+    """Return the top-level nodes of text."""
+    roots = []
+    stack = []  # (node, block is live, block is slashdashed) per open '{'
+    node = None  # the node whose name and arguments are being read
+    annotation = None  # start of a '(type)' before a node name
+    dash = False
+    escline = False
+    last_end = 0
+
+    for kind, start, end in tokenize(text):
+        if kind in ("space", "comment"):
+            continue
+        if kind == "escline":
+            escline = True
+            continue
+        if kind == "newline":
+            if escline:
+                escline = False
+            elif node is not None:
+                node.end = last_end
+                node = None
+            continue
+        if kind == "slashdash":
+            dash = True
+            continue
+
+        if kind in ("word", "string"):
+            if node is None:
+                if kind == "word" and text[start] == "(" and annotation is None:
+                    annotation = start
+                    last_end = end
+                    continue
+                parent = stack[-1][0] if stack else None
+                parent_live = stack[-1][1] if stack else True
+                name = _unquote(text[start:end]) if kind == "string" else text[start:end]
+                path = f"{parent.path}/{name}" if parent is not None else name
+                node = Node(name, path, start if annotation is None else annotation,
+                            parent, parent_live and not dash)
+                (parent.children if parent is not None else roots).append(node)
+                annotation = None
+            dash = False
+        elif kind == "semicolon":
+            if node is not None:
+                node.end = end
+                node = None
+            dash = False
+        elif kind == "open":
+            if node is None:
+                raise KdlError(f"'{{' without a node on line {line_number(text, start)}")
+            if not dash:
+                node.open = start
+            stack.append((node, node.live and not dash, dash))
+            node = None
+            dash = False
+        elif kind == "close":
+            if node is not None:
+                node.end = last_end
+            if not stack:
+                raise KdlError(f"unmatched '}}' on line {line_number(text, start)}")
+            owner, _, dashed_block = stack.pop()
+            if dashed_block:
+                # The node goes on after a /- { ... } block.
+                node = owner
+            else:
+                owner.close = owner.end = end
+                node = None
+            dash = False
+        last_end = end
+
+    if node is not None:
+        node.end = last_end
+    if stack:
+        raise KdlError(f"unclosed '{{' on line {line_number(text, stack[-1][0].start)}")
+    return roots
+
+def _unquote(token):
+    if token.startswith('"'):
+        return token[1:-1]
+    raw = token.lstrip("r")
+    hashes = len(raw) - len(raw.lstrip("#"))
+    return raw[hashes + 1:len(raw) - hashes - 1]
+
+def build_index(nodes):
+    """Map every live node's path to the nodes with that path, in order."""
+    index = {}
+    for root in nodes:
+        for node in root.walk():
+            if node.live:
+                index.setdefault(node.path, []).append(node)
+    return index
+
+class Document:
+    """Parsed KDL text with a path index, e.g. ``layout/focus-ring``."""
+
+    def __init__(self, text, nodes=None):
+        self.text = text
+        self.nodes = parse(text) if nodes is None else nodes
+        self.index = build_index(self.nodes)
+
+    def find(self, path):
+        """The first live node at path, or None."""
+        nodes = self.index.get(path)
+        return nodes[0] if nodes else None
+
+    def find_all(self, path):
+        return self.index.get(path, [])
+
+    def source(self, node):
+        return self.text[node.start:node.end]
+
+    def body(self, node):
+        """The text between a node's braces."""
+        if node.open is None:
+            raise KdlError(f"{node.path} has no children block")
+        return self.text[node.open + 1:node.close - 1]
+
+    def line_start(self, node):
+        """Offset of the first character of the line node starts on."""
+        return max(self.text.rfind(c, 0, node.start) for c in _NEWLINE) + 1
+
+    def replace(self, node, source):
+        """A new Document with node's source replaced by source.
+
+        Only source is tokenized; the rest of the tree is copied with its
+        offsets moved, so an edit costs the size of the block rather than
+        of the file. source must hold exactly one node.
+        """
+        new_nodes = parse(source)
+        live = [n for n in new_nodes if n.live]
+        if len(new_nodes) != 1 or len(live) != 1:
+            raise KdlError(f"replacement for {node.path} must be exactly one node")
+        delta = len(source) - (node.end - node.start)
+        text = self.text[:node.start] + source + self.text[node.end:]
+
+        def copy(old, parent):
+            if old is node:
+                return _rebase(new_nodes[0], parent, node.start, node.live)
+            new = Node(old.name, old.path, _moved(old.start, node.end, delta), parent, old.live)
+            new.end = _moved(old.end, node.end, delta)
+            new.open = _moved(old.open, node.end, delta)
+            new.close = _moved(old.close, node.end, delta)
+            new.children = [copy(child, new) for child in old.children]
+            return new
+
+        return Document(text, [copy(root, None) for root in self.nodes])
+
+def _moved(offset, after, delta):
+    if offset is None or offset < after:
+        return offset
+    return offset + delta
+
+def _rebase(node, parent, shift, live):
+    """Place a node parsed on its own at shift, under parent."""
+    node.parent = parent
+    node.path = f"{parent.path}/{node.name}" if parent is not None else node.name
+    node.live = node.live and live
+    node.start += shift
+    node.end += shift
+    if node.open is not None:
+        node.open += shift
+        node.close += shift
+    node.children = [_rebase(child, node, shift, node.live) for child in node.children]
+    return node
+
+# Parsed documents by path, reused while the file's mtime and size match.
+_cache = {}
+
+def load(path):
+    """The parsed document at path, re-read only when the file changed."""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    # newline="" keeps \r\n as it is, so offsets and round trips are exact.
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        doc = Document(f.read())
+    _cache[path] = (key, doc)
+    return doc
+
+def remember(path, doc):
+    """Cache doc for path after writing doc.text there ourselves."""
+    st = os.stat(path)
+    _cache[path] = ((st.st_mtime_ns, st.st_size), doc)
+
+def save(path, doc):
+    """Write doc.text to path unless the file already holds it.
+
+    Returns True if the file was written. Saving what is already there
+    is skipped, so niri is not made to reload an unchanged config.
+    """
+    try:
+        current = load(path).text
+    except FileNotFoundError:
+        current = None
+    if current == doc.text:
+        return False
+    write_atomic(path, doc.text)
+    remember(path, doc)
+    return True
+
+def write_atomic(path, text):
+    """Replace path with text so readers see the old or new file, never half.
+
+    The text goes to a temporary file next to the target, is fsynced and
+    then renamed over it. A symlinked config (e.g. from a dotfiles repo)
+    has its target replaced, not the link.
+    """
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Make the rename itself durable.
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
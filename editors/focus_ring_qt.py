@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from PyQt5.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+    QPushButton, QColorDialog, QGroupBox, QCheckBox, QMessageBox, QScrollArea,
+    QFrame
+)
+from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+
+from config import kdl
+from config.focus_ring import CONFIG_PATH, load_focus_ring, parse_focus_ring, update_focus_ring
+from util.cli import parse_hot_change_args
+
+# ----------------------------------------------------------------------------- 
+# Config writes (run on the writer thread)
+# -----------------------------------------------------------------------------
+
+def write_items(items):
+    """Rebuild the block from items and save it; True if the file changed."""
+    return kdl.save(CONFIG_PATH, update_focus_ring(items, CONFIG_PATH))
+
+class _WriteSignals(QObject):
+    # Emitted from the writer thread; Qt queues it to the UI thread.
+    done = pyqtSignal(bool, object)  # preview?, finished future
+
+# ----------------------------------------------------------------------------- 
+# Qt widgets
+# -----------------------------------------------------------------------------
+
+def _color_preview(color_hex: str) -> QFrame:
+    frame = QFrame()
+    frame.setFixedSize(32, 18)
+    frame.setFrameShape(QFrame.Box)
+    frame.setStyleSheet(f"background-color: {color_hex or '#000000'};")
+    return frame
+
+class FocusRingEditor(QWidget):
+    def __init__(self, items, preview_rate=4.0, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Niri Focus Ring Editor (Qt)")
+        self.items = items  # list of dicts; we’ll attach widgets to each dict
+
+        # Scrollable area
+        outer = QVBoxLayout(self)
+        scroll = QScrollArea(self)
+        scroll.setWidgetResizable(True)
+        container = QWidget()
+        layout = QVBoxLayout(container)
+
+        # Build per-item UIs
+        for item in self.items:
+            g = QGroupBox(item['key'])
+            gl = QHBoxLayout(g)
+
+            # checkbox for enabled on all except 'width' special-case
+            add_enable_box = not (item['type'] == 'simple' and item['key'] == 'width')
+
+            if add_enable_box:
+                item['check'] = QCheckBox(self)
+                item['check'].setChecked(bool(item['enabled']))
+                gl.addWidget(item['check'])
+
+            if item['type'] == 'off':
+                gl.addWidget(QLabel("off", self))
+
+            elif item['type'] == 'simple':
+                gl.addWidget(QLabel(item['key'] + ":", self))
+                item['entry'] = QLineEdit(str(item['value']), self)
+                item['entry'].setFixedWidth(80)
+                gl.addWidget(item['entry'])
+
+            elif item['type'] == 'color':
+                gl.addWidget(QLabel(item['key'] + ":", self))
+                item['color_edit'] = QLineEdit(item.get('value', ''), self)
+                item['color_edit'].setFixedWidth(110)
+                gl.addWidget(item['color_edit'])
+
+                # color picker
+                btn = QPushButton("Pick", self)
+                gl.addWidget(btn)
+                # preview
+                item['preview'] = _color_preview(item.get('value', '#000000'))
+                gl.addWidget(item['preview'])
+
+                # bind item; ignore clicked(bool)
+                btn.clicked.connect(partial(self._pick_color_for, item))
+
+                # keep preview in sync if typed
+                item['color_edit'].textChanged.connect(
+                    lambda txt, it=item: it['preview'].setStyleSheet(f"background-color: {txt or '#000000'};")
+                )
+
+            elif item['type'] == 'gradient':
+                gl.addWidget(QLabel(item['key'] + ":", self))
+
+                # from
+                gl.addWidget(QLabel("from", self))
+                item['from_edit'] = QLineEdit(item['value'].get('from', ''), self)
+                item['from_edit'].setFixedWidth(110)
+                gl.addWidget(item['from_edit'])
+                from_btn = QPushButton("Pick", self)
+                gl.addWidget(from_btn)
+                item['from_preview'] = _color_preview(item['value'].get('from', '#000000'))
+                gl.addWidget(item['from_preview'])
+                from_btn.clicked.connect(partial(self._pick_from_color, item))
+                item['from_edit'].textChanged.connect(
+                    lambda txt, it=item: it['from_preview'].setStyleSheet(f"background-color: {txt or '#000000'};")
+                )
+
+                # to
+                gl.addWidget(QLabel("to", self))
+                item['to_edit'] = QLineEdit(item['value'].get('to', ''), self)
+                item['to_edit'].setFixedWidth(110)
+                gl.addWidget(item['to_edit'])
+                to_btn = QPushButton("Pick", self)
+                gl.addWidget(to_btn)
+                item['to_preview'] = _color_preview(item['value'].get('to', '#000000'))
+                gl.addWidget(item['to_preview'])
+                to_btn.clicked.connect(partial(self._pick_to_color, item))
+                item['to_edit'].textChanged.connect(
+                    lambda txt, it=item: it['to_preview'].setStyleSheet(f"background-color: {txt or '#000000'};")
+                )
+
+                # angle
+                gl.addWidget(QLabel("angle", self))
+                item['angle_edit'] = QLineEdit(str(item['value'].get('angle', '')), self)
+                item['angle_edit'].setFixedWidth(60)
+                gl.addWidget(item['angle_edit'])
+
+                # relative-to
+                gl.addWidget(QLabel("relative-to", self))
+                item['rel_edit'] = QLineEdit(item['value'].get('relative-to', ''), self)
+                item['rel_edit'].setFixedWidth(160)
+                gl.addWidget(item['rel_edit'])
+
+            gl.addStretch(1)
+            g.setLayout(gl)
+            layout.addWidget(g)
+
+            # any edit may trigger a live preview
+            if 'check' in item:
+                item['check'].stateChanged.connect(self._on_edit)
+            for name in ('entry', 'color_edit', 'from_edit', 'to_edit', 'angle_edit', 'rel_edit'):
+                if name in item:
+                    item[name].textChanged.connect(self._on_edit)
+
+        # Save button + status
+        btn_row = QHBoxLayout()
+        save_btn = QPushButton("Save Configuration", self)
+        btn_row.addWidget(save_btn)
+        self.live_check = QCheckBox("Live preview", self)
+        self.live_check.setToolTip(f"Apply edits as you make them, at most {preview_rate:g} times a second")
+        btn_row.addWidget(self.live_check)
+        self.status_label = QLabel("", self)
+        self.status_label.setStyleSheet("color: green;")
+        btn_row.addWidget(self.status_label, alignment=Qt.AlignLeft)
+        layout.addLayout(btn_row)
+
+        layout.addStretch(1)
+        scroll.setWidget(container)
+        outer.addWidget(scroll)
+
+        save_btn.clicked.connect(self.on_save)
+        self.live_check.toggled.connect(self._on_edit)
+
+        # Writes go through one worker thread, in order, so the UI never
+        # waits on the disk. Edits arriving faster than preview_rate are
+        # coalesced by the timer into one write.
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._writes_in_flight = 0
+        self._preview_pending = False
+        self._signals = _WriteSignals()
+        self._signals.done.connect(self._write_done)
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(max(1, int(1000 / preview_rate)))
+        self._preview_timer.timeout.connect(self._apply_preview)
+
+        # Size hint
+        self.resize(860, 600)
+
+    # ------------------------------------------------------------------ 
+    # Color pickers (ignore clicked(bool) via partial)
+    # ------------------------------------------------------------------ 
+
+    def _pick_color_for(self, it, _checked=False):
+        self._pick_into(it['color_edit'], "Pick color")
+
+    def _pick_from_color(self, it, _checked=False):
+        self._pick_into(it['from_edit'], "Pick color (from)")
+
+    def _pick_to_color(self, it, _checked=False):
+        self._pick_into(it['to_edit'], "Pick color (to)")
+
+    def _pick_into(self, edit, title):
+        """Run a colour dialog for edit.
+
+        The colour under the cursor goes into edit while the dialog is
+        open, so the swatch and a live preview follow the picker; Cancel
+        puts the old value back.
+        """
+        original = edit.text()
+        dialog = QColorDialog(QColor(original or "#000000"), self)
+        dialog.setWindowTitle(title)
+        dialog.currentColorChanged.connect(lambda color: edit.setText(color.name()))
+        if dialog.exec_() == QColorDialog.Accepted and dialog.selectedColor().isValid():
+            edit.setText(dialog.selectedColor().name())
+        else:
+            edit.setText(original)
+
+    # ------------------------------------------------------------------ 
+    # Save
+    # ------------------------------------------------------------------ 
+
+    def on_save(self):
+        """Collect UI state -> items -> reconstruct -> replace block -> write."""
+        self._collect()
+        self._submit(preview=False)
+
+    def _collect(self):
+        """Copy values back from the widgets into self.items."""
+        for it in self.items:
+            if it['type'] == 'off':
+                if 'check' in it:
+                    it['enabled'] = it['check'].isChecked()
+
+            elif it['type'] == 'simple':
+                if it['key'] == 'width':
+                    if 'entry' in it:
+                        it['value'] = it['entry'].text().strip()
+                else:
+                    if 'check' in it:
+                        it['enabled'] = it['check'].isChecked()
+                    if 'entry' in it:
+                        it['value'] = it['entry'].text().strip()
+
+            elif it['type'] == 'color':
+                if 'check' in it:
+                    it['enabled'] = it['check'].isChecked()
+                if 'color_edit' in it:
+                    it['value'] = it['color_edit'].text().strip()
+
+            elif it['type'] == 'gradient':
+                if 'check' in it:
+                    it['enabled'] = it['check'].isChecked()
+                v = it['value']
+                if 'from_edit' in it:
+                    v['from'] = it['from_edit'].text().strip()
+                if 'to_edit' in it:
+                    v['to'] = it['to_edit'].text().strip()
+                if 'angle_edit' in it:
+                    v['angle'] = it['angle_edit'].text().strip()
+                if 'rel_edit' in it:
+                    v['relative-to'] = it['rel_edit'].text().strip()
+
+    def _snapshot(self):
+        """The items without their widgets, safe to hand to the writer thread."""
+        return [
+            {
+                'type': it['type'],
+                'enabled': it['enabled'],
+                'key': it['key'],
+                'value': dict(it['value']) if isinstance(it['value'], dict) else it['value'],
+            }
+            for it in self.items
+        ]
+
+    def _submit(self, preview):
+        self._writes_in_flight += 1
+        future = self._writer.submit(write_items, self._snapshot())
+        future.add_done_callback(lambda f: self._signals.done.emit(preview, f))
+
+    def _write_done(self, preview, future):
+        self._writes_in_flight -= 1
+        try:
+            changed = future.result()
+        except Exception as e:
+            if preview:
+                self._set_status(f"Preview failed: {e}", "red")
+            else:
+                QMessageBox.critical(self, "Save Error", str(e))
+        else:
+            if preview:
+                self._set_status("Previewing in Niri (live).")
+            elif changed:
+                self._set_status("Changes saved! Check Niri.")
+            else:
+                self._set_status("No changes to save.")
+        if self._preview_pending and not self._writes_in_flight:
+            self._preview_pending = False
+            self._on_edit()
+
+    # ------------------------------------------------------------------ 
+    # Live preview
+    # ------------------------------------------------------------------ 
+
+    def _on_edit(self, *_):
+        # The timer is not restarted while running: a steady stream of
+        # edits still gives one write per interval, not none until it stops.
+        if self.live_check.isChecked() and not self._preview_timer.isActive():
+            self._preview_timer.start()
+
+    def _apply_preview(self):
+        if not self.live_check.isChecked():
+            return
+        if self._writes_in_flight:
+            # Write again with the latest values once this one is done.
+            self._preview_pending = True
+            return
+        self._collect()
+        problem = self._invalid_input()
+        if problem:
+            self._set_status(f"Preview paused: {problem}", "orange")
+            return
+        self._submit(preview=True)
+
+    def _invalid_input(self):
+        """Why the enabled values cannot be written yet, or None."""
+        for it in self.items:
+            if not it['enabled']:
+                continue
+            if it['type'] == 'color' and not _is_color(it['value']):
+                return f"{it['key']} is not a colour"
+            if it['type'] == 'simple' and it['key'] == 'width' and not _is_number(it['value']):
+                return "width is not a number"
+            if it['type'] == 'gradient':
+                v = it['value']
+                if not (_is_color(v.get('from')) and _is_color(v.get('to'))):
+                    return f"{it['key']} needs two colours"
+                if v.get('angle') and not _is_number(v['angle']):
+                    return f"{it['key']} angle is not a number"
+        return None
+
+    def _set_status(self, text, color="green"):
+        self.status_label.setStyleSheet(f"color: {color};")
+        self.status_label.setText(text)
+
+    def closeEvent(self, event):
+        # Let a write in progress finish rather than cut it off.
+        self._preview_timer.stop()
+        self._writer.shutdown(wait=True)
+        super().closeEvent(event)
+
+def _is_color(value):
+    return bool(value) and value.startswith('#') and QColor.isValidColor(value)
+
+def _is_number(value):
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+# ----------------------------------------------------------------------------- 
+# main
+# -----------------------------------------------------------------------------
+
+def main(argv=None):
+    args = parse_hot_change_args(argv)
+    try:
+        doc, node = load_focus_ring()
+        items = parse_focus_ring(doc.body(node))
+    except Exception as e:
+        app = QApplication([])
+        QMessageBox.critical(None, "Error", str(e))
+        return 1
+
+    app = QApplication([])
+    w = FocusRingEditor(items, preview_rate=args.preview_rate)
+    w.show()
+    return app.exec_()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import sys
+import tkinter as tk
+from tkinter import messagebox, colorchooser
+
+from config import kdl
+from config.focus_ring import CONFIG_PATH, load_focus_ring, parse_focus_ring, update_focus_ring
+
+def update_preview(preview_label, color_var):
+    """Update the background color of the preview label, handling invalid colors."""
+    color = color_var.get()
+    try:
+        preview_label.config(bg=color)
+    except tk.TclError:
+        pass  # Invalid color, keep previous or default
+
+def create_gui(items):
+    """Build the Tkinter GUI for editing."""
+    root = tk.Tk()
+    root.title("Niri Focus Ring Editor")
+    root.geometry("600x600")  # Larger to fit gradients
+    root.attributes('-topmost', True)  # Stay on top
+
+    row = 0
+    for idx, item in enumerate(items):
+        frame = tk.Frame(root)
+        frame.grid(row=row, column=0, columnspan=2, padx=10, pady=5, sticky='w')
+        item['check_var'] = tk.BooleanVar(value=item['enabled'])
+        check = tk.Checkbutton(frame, text="", variable=item['check_var'])
+        check.pack(side=tk.LEFT)
+
+        if item['type'] == 'off':
+            tk.Label(frame, text="off").pack(side=tk.LEFT)
+        elif item['type'] == 'simple':
+            tk.Label(frame, text=f"{item['key']}: ").pack(side=tk.LEFT)
+            item['entry_var'] = tk.StringVar(value=item['value'])
+            tk.Entry(frame, textvariable=item['entry_var'], width=10).pack(side=tk.LEFT)
+        elif item['type'] == 'color':
+            tk.Label(frame, text=f"{item['key']}: ").pack(side=tk.LEFT)
+            item['color_var'] = tk.StringVar(value=item['value'])
+            entry = tk.Entry(frame, textvariable=item['color_var'], width=15)
+            entry.pack(side=tk.LEFT)
+            def pick_color(color_var):
+                color = colorchooser.askcolor(initialcolor=color_var.get())[1]
+                if color:
+                    color_var.set(color)
+            tk.Button(frame, text="Pick", command=lambda cv=item['color_var']: pick_color(cv)).pack(side=tk.LEFT)
+            # Color preview
+            preview_label = tk.Label(frame, width=4, height=1, bg=item['color_var'].get(), relief="solid", borderwidth=1)
+            preview_label.pack(side=tk.LEFT, padx=5)
+            item['color_var'].trace("w", lambda *args, pl=preview_label, cv=item['color_var']: update_preview(pl, cv))
+        elif item['type'] == 'gradient':
+            tk.Label(frame, text=f"{item['key']}: ").pack(side=tk.LEFT)
+            # From
+            tk.Label(frame, text="from ").pack(side=tk.LEFT)
+            item['from_var'] = tk.StringVar(value=item['value'].get('from', '#000000'))
+            from_entry = tk.Entry(frame, textvariable=item['from_var'], width=15)
+            from_entry.pack(side=tk.LEFT)
+            tk.Button(frame, text="Pick", command=lambda cv=item['from_var']: pick_color(cv)).pack(side=tk.LEFT)
+            from_preview = tk.Label(frame, width=4, height=1, bg=item['from_var'].get(), relief="solid", borderwidth=1)
+            from_preview.pack(side=tk.LEFT, padx=5)
+            item['from_var'].trace("w", lambda *args, pl=from_preview, cv=item['from_var']: update_preview(pl, cv))
+            # To
+            tk.Label(frame, text=" to ").pack(side=tk.LEFT)
+            item['to_var'] = tk.StringVar(value=item['value'].get('to', '#000000'))
+            to_entry = tk.Entry(frame, textvariable=item['to_var'], width=15)
+            to_entry.pack(side=tk.LEFT)
+            tk.Button(frame, text="Pick", command=lambda cv=item['to_var']: pick_color(cv)).pack(side=tk.LEFT)
+            to_preview = tk.Label(frame, width=4, height=1, bg=item['to_var'].get(), relief="solid", borderwidth=1)
+            to_preview.pack(side=tk.LEFT, padx=5)
+            item['to_var'].trace("w", lambda *args, pl=to_preview, cv=item['to_var']: update_preview(pl, cv))
+            # Angle
+            tk.Label(frame, text=" angle ").pack(side=tk.LEFT)
+            item['angle_var'] = tk.StringVar(value=item['value'].get('angle', '45'))
+            tk.Entry(frame, textvariable=item['angle_var'], width=5).pack(side=tk.LEFT)
+            # Relative-to
+            tk.Label(frame, text=" relative-to ").pack(side=tk.LEFT)
+            item['rel_var'] = tk.StringVar(value=item['value'].get('relative-to', 'workspace-view'))
+            tk.Entry(frame, textvariable=item['rel_var'], width=20).pack(side=tk.LEFT)
+        row += 1
+
+    status_label = tk.Label(root, text="", fg="green")
+    status_label.grid(row=row, column=0, columnspan=2, pady=5)
+
+    def save_changes():
+        for item in items:
+            item['enabled'] = item['check_var'].get()
+            if item['type'] == 'simple':
+                item['value'] = item['entry_var'].get()
+            elif item['type'] == 'color':
+                item['value'] = item['color_var'].get()
+            elif item['type'] == 'gradient':
+                item['value']['from'] = item['from_var'].get()
+                item['value']['to'] = item['to_var'].get()
+                item['value']['angle'] = item['angle_var'].get()
+                item['value']['relative-to'] = item['rel_var'].get()
+        
+        doc = update_focus_ring(items)  # Re-read if changed elsewhere
+        if kdl.save(CONFIG_PATH, doc):
+            print("Config saved! Changes should apply immediately in Niri.")
+            status_label.config(text="Changes saved! Check Niri.")
+        else:
+            status_label.config(text="No changes to save.")
+        root.after(3000, lambda: status_label.config(text=""))  # Clear message after 3 seconds
+
+    tk.Button(root, text="Save", command=save_changes).grid(row=row + 1, column=0, columnspan=2, pady=10)
+    
+    root.mainloop()
+
+def main(argv=None):
+    try:
+        doc, node = load_focus_ring()
+        items = parse_focus_ring(doc.body(node))
+        create_gui(items)
+    except Exception as e:
+        print(f"Error: {e}")
+        # Could add GUI error if desired
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
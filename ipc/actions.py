@@ -6,6 +6,12 @@ def list_windows_query():
 def list_workspaces_query():
     return '"Workspaces"'
 
+def list_outputs_query():
+    return '"Outputs"'
+
+def event_stream_query():
+    return '{"EventStream": null}'
+
 def move_window_to_workspace_action(window_id, reference, focus=True):
     return {
         "Action": {
@@ -37,6 +43,6 @@ def move_window_to_monitor_action(window_id, output):
     }
 
 def format_workspace_reference(workspace):
-    if workspace.isdigit():
+    if workspace.isdecimal():
         return {"Index": int(workspace)}
     return {"Name": workspace}
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""JSON decoding through orjson or msgspec when either is installed.
+
+Both parse niri's large replies several times faster than the stdlib and
+take bytes straight from the socket, but importing them costs more than
+the stdlib needs for a short reply or a single event. So small documents
+go to ``json.loads`` and the fast backend is only imported once a large
+one shows up.
+"""
+
+import json
+
+FAST_THRESHOLD = 16 * 1024  # bytes
+
+DecodeError = ValueError
+
+_fast_loads = None
+_backend_name = None
+
+def loads(data):
+    if len(data) < FAST_THRESHOLD:
+        return json.loads(data)
+    return (_fast_loads or _load_backend())(data)
+
+def backend():
+    """Name of the decoder used for large documents."""
+    _load_backend()
+    return _backend_name
+
+def _load_backend():
+    global _fast_loads, _backend_name
+    if _fast_loads is not None:
+        return _fast_loads
+    try:
+        import orjson
+        _fast_loads, _backend_name = orjson.loads, "orjson"  # its errors are ValueErrors
+        return _fast_loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+    except ImportError:
+        _fast_loads, _backend_name = json.loads, "json"
+        return _fast_loads
+
+    decode = msgspec.json.decode
+
+    def msgspec_loads(data):
+        try:
+            return decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from None
+
+    _fast_loads, _backend_name = msgspec_loads, "msgspec"
+    return _fast_loads
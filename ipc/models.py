@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Slotted Window, Workspace and Output models and their reply decoders.
+
+A slotted object takes a fraction of the memory of the dict it replaces,
+which adds up in the daemon's long-lived state. The models keep
+dict-style access (``win["id"]``, ``win.get("title", "")``, ``"layout" in
+win``) so code written against niri's raw JSON works on either, and
+``to_dict()`` gives the JSON shape back. Keys a model does not know, e.g.
+from a newer niri, are kept in ``extra`` rather than dropped.
+
+When msgspec is installed, large replies are decoded by ipc.structs into
+msgspec versions of the same classes instead; see decode_structs.
+"""
+
+from ipc.fast_json import FAST_THRESHOLD, backend, loads
+
+class Model:
+    """Dict-style access over FIELDS; subclasses provide the storage."""
+
+    __slots__ = ()
+    FIELDS = ()
+    FIELD_SET = frozenset()
+
+    @classmethod
+    def from_dict(cls, data):
+        obj = cls(*map(data.get, cls.FIELDS))
+        if not cls.FIELD_SET.issuperset(data):
+            obj.extra = {k: v for k, v in data.items() if k not in cls.FIELD_SET}
+        return obj
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in self.FIELDS}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def get(self, key, default=None):
+        """Like dict.get; a field that is unset or null gives default."""
+        if key in self.FIELD_SET:
+            value = getattr(self, key)
+        elif self.extra:
+            value = self.extra.get(key)
+        else:
+            value = None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key in self.FIELD_SET:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        return key in self.FIELD_SET or (bool(self.extra) and key in self.extra)
+
+    def __eq__(self, other):
+        if isinstance(other, Model):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+class Window(Model):
+    __slots__ = ("id", "title", "app_id", "pid", "workspace_id", "is_focused",
+                 "is_floating", "is_urgent", "layout", "focus_timestamp", "extra")
+    FIELDS = __slots__[:-1]
+    FIELD_SET = frozenset(FIELDS)
+
+    def __init__(self, id=None, title=None, app_id=None, pid=None, workspace_id=None,
+                 is_focused=False, is_floating=False, is_urgent=False, layout=None,
+                 focus_timestamp=None):
+        self.id = id
+        self.title = title
+        self.app_id = app_id
+        self.pid = pid
+        self.workspace_id = workspace_id
+        self.is_focused = is_focused
+        self.is_floating = is_floating
+        self.is_urgent = is_urgent
+        self.layout = layout
+        self.focus_timestamp = focus_timestamp
+        self.extra = None
+
+class Workspace(Model):
+    __slots__ = ("id", "idx", "name", "output", "is_urgent", "is_active",
+                 "is_focused", "active_window_id", "extra")
+    FIELDS = __slots__[:-1]
+    FIELD_SET = frozenset(FIELDS)
+
+    def __init__(self, id=None, idx=None, name=None, output=None, is_urgent=False,
+                 is_active=False, is_focused=False, active_window_id=None):
+        self.id = id
+        self.idx = idx
+        self.name = name
+        self.output = output
+        self.is_urgent = is_urgent
+        self.is_active = is_active
+        self.is_focused = is_focused
+        self.active_window_id = active_window_id
+        self.extra = None
+
+class Output(Model):
+    __slots__ = ("name", "make", "model", "serial", "physical_size", "modes",
+                 "current_mode", "is_custom_mode", "vrr_supported", "vrr_enabled", "logical",
+                 "extra")
+    FIELDS = __slots__[:-1]
+    FIELD_SET = frozenset(FIELDS)
+
+    def __init__(self, name=None, make=None, model=None, serial=None, physical_size=None,
+                 modes=None, current_mode=None, is_custom_mode=None, vrr_supported=None,
+                 vrr_enabled=None, logical=None):
+        self.name = name
+        self.make = make
+        self.model = model
+        self.serial = serial
+        self.physical_size = physical_size
+        self.modes = modes
+        self.current_mode = current_mode
+        self.is_custom_mode = is_custom_mode
+        self.vrr_supported = vrr_supported
+        self.vrr_enabled = vrr_enabled
+        self.logical = logical
+        self.extra = None
+
+def unwrap_response(response, key, default):
+    """Pull the payload out of an ``{"Ok": {key: ...}}`` reply.
+
+    response may also be the raw reply line as bytes or str.
+    """
+    if isinstance(response, (bytes, str)):
+        response = loads(response)
+    ok = response.get("Ok", default)
+    if isinstance(ok, dict) and key in ok:
+        return ok[key]
+    return ok
+
+# ipc.structs once imported, False when msgspec is not installed.
+_structs = None
+
+def decode_structs(response, key):
+    """A large raw reply decoded straight into msgspec models, or None.
+
+    With msgspec, a reply of thousands of windows is parsed and turned
+    into models in one pass, in less time than ``json.loads`` takes to
+    build the dicts alone. Small replies, decoded dicts, error replies and
+    installs without msgspec get None and take the generic path.
+    """
+    global _structs
+    if not isinstance(response, (bytes, str)) or len(response) < FAST_THRESHOLD:
+        return None
+    if _structs is None:
+        try:
+            from ipc import structs as _structs
+        except ImportError:
+            _structs = False
+    if not _structs:
+        return None
+    return _structs.decode(response, key)
+
+def decoder_name():
+    """Name of the decoder used for large replies."""
+    decode_structs(b" " * FAST_THRESHOLD, None)
+    return "msgspec structs" if _structs else backend()
+
+def as_windows(items):
+    return [win if isinstance(win, Model) else Window.from_dict(win) for win in items]
+
+def as_workspaces(items):
+    return [wsp if isinstance(wsp, Model) else Workspace.from_dict(wsp) for wsp in items]
+
+def decode_windows(response):
+    """Windows reply -> [Window]."""
+    windows = decode_structs(response, "Windows")
+    if windows is not None:
+        return windows
+    return as_windows(unwrap_response(response, "Windows", None) or [])
+
+def decode_workspaces(response):
+    """Workspaces reply -> [Workspace]."""
+    workspaces = decode_structs(response, "Workspaces")
+    if workspaces is not None:
+        return workspaces
+    return as_workspaces(unwrap_response(response, "Workspaces", None) or [])
+
+def decode_outputs(response):
+    """Outputs reply -> {name: Output}."""
+    outputs = decode_structs(response, "Outputs")
+    if outputs is not None:
+        return outputs
+    outputs = unwrap_response(response, "Outputs", None)
+    if not isinstance(outputs, dict):
+        return {}
+    return {name: Output.from_dict(out) for name, out in outputs.items()}
+
+def decode_focused_window(response):
+    """FocusedWindow reply -> Window, or None when nothing has focus."""
+    win = unwrap_response(response, "FocusedWindow", None)
+    return Window.from_dict(win) if isinstance(win, dict) else None
+
+def decode_focused_output(response):
+    """FocusedOutput reply -> Output, or None."""
+    out = unwrap_response(response, "FocusedOutput", None)
+    return Output.from_dict(out) if isinstance(out, dict) else None
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""msgspec versions of the ipc.models classes, for large replies.
+
+ipc.models imports this only when msgspec is installed and a reply is
+big enough to be worth it. The classes have the same fields and the same
+dict-style access as their ipc.models counterparts, so callers cannot
+tell them apart. Unlike those, keys a model does not know are dropped
+while decoding rather than kept in ``extra``.
+"""
+
+from typing import Any
+
+import msgspec
+
+from ipc import models
+
+class Window(models.Model, msgspec.Struct, gc=False):
+    FIELDS = models.Window.FIELDS
+    FIELD_SET = models.Window.FIELD_SET
+
+    id: Any = None
+    title: Any = None
+    app_id: Any = None
+    pid: Any = None
+    workspace_id: Any = None
+    is_focused: Any = False
+    is_floating: Any = False
+    is_urgent: Any = False
+    layout: Any = None
+    focus_timestamp: Any = None
+    extra: Any = None
+
+class Workspace(models.Model, msgspec.Struct, gc=False):
+    FIELDS = models.Workspace.FIELDS
+    FIELD_SET = models.Workspace.FIELD_SET
+
+    id: Any = None
+    idx: Any = None
+    name: Any = None
+    output: Any = None
+    is_urgent: Any = False
+    is_active: Any = False
+    is_focused: Any = False
+    active_window_id: Any = None
+    extra: Any = None
+
+class Output(models.Model, msgspec.Struct, gc=False):
+    FIELDS = models.Output.FIELDS
+    FIELD_SET = models.Output.FIELD_SET
+
+    name: Any = None
+    make: Any = None
+    model: Any = None
+    serial: Any = None
+    physical_size: Any = None
+    modes: Any = None
+    current_mode: Any = None
+    is_custom_mode: Any = None
+    vrr_supported: Any = None
+    vrr_enabled: Any = None
+    logical: Any = None
+    extra: Any = None
+
+# One decoder per reply, for {"Ok": {key: payload}}.
+_decoders = {
+    "Windows": msgspec.json.Decoder(dict[str, dict[str, list[Window]]]),
+    "Workspaces": msgspec.json.Decoder(dict[str, dict[str, list[Workspace]]]),
+    "Outputs": msgspec.json.Decoder(dict[str, dict[str, dict[str, Output]]]),
+}
+
+def decode(data, key):
+    """The key payload of an Ok reply, or None if data is not one."""
+    decoder = _decoders.get(key)
+    if decoder is None:
+        return None
+    try:
+        ok = decoder.decode(data).get("Ok")
+    except msgspec.DecodeError:
+        return None
+    return ok.get(key) if ok is not None else None
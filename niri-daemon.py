@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+import sys
+
+from client.socket_path import get_niri_socket_path
+from service.daemon import NiriDaemon, get_daemon_socket_path, serve
+
+def main():
+    sock_path = get_niri_socket_path()
+    if not sock_path:
+        print("❌ Could not find Niri IPC socket.")
+        return 1
+
+    niri_daemon = NiriDaemon(sock_path)
+    niri_daemon.start()
+    try:
+        serve(niri_daemon, get_daemon_socket_path())
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
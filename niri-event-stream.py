@@ -1,41 +1,90 @@
 #!/usr/bin/env python3
-import subprocess
-import json
+import io
+import os
 import sys
 
-def format_kv(d, indent=0):
+from client.socket_client import subscribe
+from client.socket_path import get_niri_socket_path
+
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+def format_kv(d, indent=0, out=None):
+    out = sys.stdout if out is None else out
     pad = "  " * indent
     if isinstance(d, dict):
         for k, v in d.items():
             if isinstance(v, dict):
-                print(f"{pad}{k}:")
-                format_kv(v, indent + 1)
+                out.write(f"{pad}{k}:\n")
+                format_kv(v, indent + 1, out)
             else:
-                print(f"{pad}{k}: {v}")
+                out.write(f"{pad}{k}: {v}\n")
     else:
-        print(f"{pad}{d}")
+        out.write(f"{pad}{d}\n")
 
 def main():
-    proc = subprocess.Popen(
-        ["niri", "msg", "-j", "event-stream"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
-        universal_newlines=True
+    import socket
+
+    from ipc.fast_json import DecodeError, loads
+
+    socket_path = get_niri_socket_path()
+    if not socket_path:
+        print("❌ Could not find Niri IPC socket.", file=sys.stderr)
+        return 1
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        reader = subscribe(sock)
+    except OSError as e:
+        print(f"❌ Could not subscribe to the event stream: {e}", file=sys.stderr)
+        sock.close()
+        return 1
+
+    # Flushed once per burst of events rather than once per line.
+    out = io.TextIOWrapper(
+        io.BufferedWriter(io.FileIO(sys.stdout.fileno(), "w", closefd=False), OUTPUT_BUFFER_SIZE),
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
     )
 
+    status = 0
     try:
-        for line in proc.stdout:
+        while True:
             try:
-                event = json.loads(line)
-                print("Event:")
-                format_kv(event)
-                print("-" * 40)
-            except Exception as e:
+                line = reader.readline()
+            except OSError as e:
+                print(f"❌ Lost the event stream: {e}", file=sys.stderr)
+                status = 1
+                break
+            if line is None:
+                break
+            try:
+                event = loads(line)
+            except DecodeError as e:
+                out.flush()
                 print(f"Error parsing JSON: {e}", file=sys.stderr)
+            else:
+                out.write("Event:\n")
+                format_kv(event, out=out)
+                out.write("-" * 40 + "\n")
+            if not reader.ready():
+                out.flush()
     except KeyboardInterrupt:
-        proc.terminate()
+        pass
+    except BrokenPipeError:
+        # Whoever read our output has gone; drop what is left unflushed.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except OSError as e:
+        # Socket errors are caught above; this is stdout failing.
+        print(f"❌ Could not write events: {e}", file=sys.stderr)
+        status = 1
+    finally:
+        sock.close()
+        try:
+            out.flush()
+        except OSError:
+            pass
+    return status
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
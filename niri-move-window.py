@@ -1,11 +1,8 @@
 #!/usr/bin/env python3
 
-from util.cli import parse_args
-from cmds.move_window import move_window_by_match
+import sys
 
-def main():
-    args = parse_args()
-    move_window_by_match(args)
+from cmds.move_window import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
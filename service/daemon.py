@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+from client.socket_client import NiriClient, iter_event_stream
+from client.socket_path import get_niri_socket_path
+from cmds.bulk_move import bulk_move
+from cmds.layout import save_layout, restore_layout
+from cmds.move_window import move_window_by_match
+from cmds.scratchpad import run_scratchpad
+from state.niri_state import NiriState
+from util.cli import parse_args, parse_bulk_move_args, parse_layout_args, parse_scratchpad_args
+
+def get_daemon_socket_path():
+    """Locate the niri_tools daemon control socket."""
+    path = os.environ.get("NIRI_TOOLS_SOCKET")
+    if path:
+        return path
+    xdg_runtime = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+    return os.path.join(xdg_runtime, "niri_tools.sock")
+
+class NiriDaemon:
+    """Hold the niri connection and a live NiriState for command requests.
+
+    The state is loaded once and kept current by a background thread that
+    follows the event stream. Commands run one at a time under ``lock`` with
+    their output captured, so the cmds/ functions work unchanged.
+    """
+
+    def __init__(self, niri_socket_path):
+        self.client = NiriClient(niri_socket_path)
+        self.state = NiriState()
+        self.lock = threading.Lock()
+        self.commands = {
+            "ping": self.cmd_ping,
+            "move-window": self.cmd_move_window,
+            "bulk-move": self.cmd_bulk_move,
+            "layout": self.cmd_layout,
+            "scratchpad": self.cmd_scratchpad,
+            "windows": self.cmd_windows,
+            "workspaces": self.cmd_workspaces,
+        }
+
+    def start(self):
+        self.state.load(self.client)
+        threading.Thread(target=self._follow_events, daemon=True).start()
+
+    def _follow_events(self):
+        # handle() points sys.stdout/stderr at the running command's reply,
+        # so this thread logs through _log and never prints.
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.client.sock_path)
+                for event in iter_event_stream(sock):
+                    with self.lock:
+                        self.state.apply_event(event)
+            except (OSError, ValueError) as e:
+                _log(f"⚠️ Event stream error: {e}")
+            finally:
+                sock.close()
+
+            _log("🔌 Event stream lost, reconnecting...")
+            time.sleep(1)
+            with self.lock:
+                self.client.close()
+                self.client.sock_path = get_niri_socket_path() or self.client.sock_path
+                try:
+                    self.state.load(self.client)
+                except (OSError, ValueError) as e:
+                    _log(f"⚠️ Could not reload state: {e}")
+
+    def handle(self, argv):
+        """Run one command line and return ``(status, captured output)``."""
+        if not argv:
+            return 2, "❌ No command given.\n"
+        handler = self.commands.get(argv[0])
+        if handler is None:
+            return 2, f"❌ Unknown command: {argv[0]}\n"
+
+        out = io.StringIO()
+        status = 0
+        with self.lock, contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            try:
+                status = handler(argv[1:]) or 0
+            except SystemExit as e:
+                status = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                print(f"❌ {e}")
+                status = 1
+        return status, out.getvalue()
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def cmd_ping(self, argv):
+        print("pong")
+
+    def cmd_move_window(self, argv):
+        return move_window_by_match(self.client, parse_args(argv, prog="niri-ctl move-window"), state=self.state)
+
+    def cmd_bulk_move(self, argv):
+        return bulk_move(self.client, parse_bulk_move_args(argv, prog="niri-ctl bulk-move"), state=self.state)
+
+    def cmd_layout(self, argv):
+        args = parse_layout_args(argv, prog="niri-ctl layout")
+        if args.action == "save":
+            return save_layout(self.client, args.file, state=self.state)
+        return restore_layout(self.client, args.file, args.strict_order, args.dry_run, state=self.state)
+
+    def cmd_scratchpad(self, argv):
+        args = parse_scratchpad_args(argv, prog="niri-ctl scratchpad")
+        # A picker here would hold the lock for as long as the menu is
+        # open. get/toggle list the candidates instead and exit with
+        # CHOOSE_WINDOW; the caller picks and asks again with --window_id.
+        args.picker = None
+        return run_scratchpad(self.client, args, state=self.state)
+
+    def cmd_windows(self, argv):
+        print(json.dumps([win.to_dict() for win in self.state.windows.values()]))
+
+    def cmd_workspaces(self, argv):
+        print(json.dumps([wsp.to_dict() for wsp in self.state.workspaces.values()]))
+
+def _log(message):
+    """Write to the daemon's own stderr, whatever sys.stderr points at now."""
+    print(message, file=sys.__stderr__, flush=True)
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    """One JSON argv array per connection in, one JSON reply out."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # A bare connect/close, e.g. another daemon checking whether
+            # this one is alive. There is nobody to reply to.
+            return
+        try:
+            argv = json.loads(line)
+            if not isinstance(argv, list):
+                raise ValueError("expected a JSON array of arguments")
+            status, output = self.server.niri_daemon.handle([str(a) for a in argv])
+        except ValueError as e:
+            status, output = 2, f"❌ Bad request: {e}\n"
+        reply = {"status": status, "output": output}
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+def serve(niri_daemon, control_path):
+    """Serve control requests on control_path until interrupted or terminated."""
+    _remove_stale_socket(control_path)
+    server = socketserver.UnixStreamServer(control_path, _ControlHandler)
+    server.niri_daemon = niri_daemon
+    os.chmod(control_path, 0o600)
+    # shutdown() waits for serve_forever() to return, so it cannot be
+    # called from the handler, which runs on the serving thread.
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    print(f"✅ niri_tools daemon listening on {control_path}")
+    try:
+        server.serve_forever()
+        print("🛑 Terminated — shutting down.")
+    except KeyboardInterrupt:
+        print("\n🛑 Interrupted — shutting down.")
+    finally:
+        server.server_close()
+        os.unlink(control_path)
+
+def _remove_stale_socket(path):
+    """Remove a leftover control socket, refusing if a daemon still owns it."""
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise RuntimeError(f"A niri_tools daemon is already listening on {path}")
+    finally:
+        probe.close()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+
+import time
+
+from client.socket_client import iter_event_stream
+from ipc.actions import (
+    list_windows_query,
+    list_workspaces_query,
+    list_outputs_query,
+)
+from ipc.models import (
+    Window,
+    as_windows,
+    as_workspaces,
+    decode_outputs,
+    decode_windows,
+    decode_workspaces,
+)
+from util.window_index import WindowIndex
+from util.window_match import WindowMatcher
+
+class NiriState:
+    """In-memory mirror of niri's windows, workspaces and outputs.
+
+    Load one snapshot with ``load()`` and keep it current by feeding every
+    event-stream message to ``apply_event()``. Lookups by window id,
+    workspace id or name, app_id and output are dict hits instead of scans
+    over freshly fetched lists. Entries are ipc.models objects, which keep
+    the dict-style access of niri's JSON in far less memory.
+    """
+
+    def __init__(self):
+        self.windows = {}
+        self.workspaces = {}
+        self.outputs = {}
+        self.focused_window_id = None
+
+        self.windows_by_workspace = {}
+        self.windows_by_app_id = {}
+        self.workspaces_by_name = {}
+        self.workspaces_by_output = {}
+        self.window_index = WindowIndex()
+        self.window_matcher = None
+        self.focus_recency = {}  # window id -> time.monotonic() of last focus
+
+    # ------------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------------
+
+    def load(self, client):
+        """Replace the mirror with a fresh snapshot taken over client."""
+        self.outputs = decode_outputs(client.request(list_outputs_query(), raw=True))
+        self.set_workspaces(decode_workspaces(client.request(list_workspaces_query(), raw=True)))
+        self.set_windows(decode_windows(client.request(list_windows_query(), raw=True)))
+        return self
+
+    def follow(self, sock):
+        """Apply events from sock until niri closes the event stream."""
+        for event in iter_event_stream(sock):
+            self.apply_event(event)
+
+    def set_workspaces(self, workspaces):
+        self.workspaces = {}
+        self.workspaces_by_name = {}
+        self.workspaces_by_output = {}
+        for wsp in as_workspaces(workspaces):
+            self._add_workspace(wsp)
+
+    def set_windows(self, windows):
+        self.windows = {}
+        self.windows_by_workspace = {}
+        self.windows_by_app_id = {}
+        self.window_index = WindowIndex()
+        self.focused_window_id = None
+        for win in as_windows(windows):
+            self._add_window(win)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def find_window_by_id(self, window_id):
+        return self.windows.get(window_id)
+
+    def find_windows_by_app_id(self, app_id):
+        return list(self.windows_by_app_id.get(app_id, {}).values())
+
+    def find_windows_by_workspace_id(self, wsp_id):
+        return list(self.windows_by_workspace.get(wsp_id, {}).values())
+
+    def find_windows_by_output(self, output):
+        windows = []
+        for wsp_id in self.workspaces_by_output.get(output, {}):
+            windows.extend(self.windows_by_workspace.get(wsp_id, {}).values())
+        return windows
+
+    def find_workspace_by_id(self, wsp_id):
+        return self.workspaces.get(wsp_id)
+
+    def find_workspace_by_name(self, wsp_name):
+        return self.workspaces_by_name.get(wsp_name)
+
+    def find_workspaces_by_output(self, output):
+        return list(self.workspaces_by_output.get(output, {}).values())
+
+    def find_matching_window(self, match_str):
+        return self.window_index.find_matching_window(match_str)
+
+    def rank_windows(self, match_str, limit=10):
+        """Ranked ``(tier, window)`` matches, see util.window_match."""
+        if self.window_matcher is None or self.window_matcher.index is not self.window_index:
+            self.window_matcher = WindowMatcher(self.window_index, self.focus_recency)
+        return self.window_matcher.rank(match_str, limit)
+
+    def focused_window(self):
+        return self.windows.get(self.focused_window_id)
+
+    def focused_workspace(self):
+        for wsp in self.workspaces.values():
+            if wsp.get("is_focused"):
+                return wsp
+        return None
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def apply_event(self, event):
+        """Update the mirror from one decoded event-stream message.
+
+        Returns the event name, or None for messages the mirror ignores.
+        """
+        for name, body in event.items():
+            handler = self._handlers.get(name)
+            if handler is None:
+                return None
+            handler(self, body)
+            return name
+        return None
+
+    def _on_workspaces_changed(self, body):
+        self.set_workspaces(body["workspaces"])
+
+    def _on_workspace_activated(self, body):
+        wsp = self.workspaces.get(body["id"])
+        if wsp is None:
+            return
+        for other in self.workspaces_by_output.get(wsp.get("output"), {}).values():
+            other["is_active"] = False
+        wsp["is_active"] = True
+        if body.get("focused"):
+            for other in self.workspaces.values():
+                other["is_focused"] = False
+            wsp["is_focused"] = True
+
+    def _on_workspace_active_window_changed(self, body):
+        wsp = self.workspaces.get(body["workspace_id"])
+        if wsp is not None:
+            wsp["active_window_id"] = body.get("active_window_id")
+
+    def _on_workspace_urgency_changed(self, body):
+        wsp = self.workspaces.get(body["id"])
+        if wsp is not None:
+            wsp["is_urgent"] = body["urgent"]
+
+    def _on_windows_changed(self, body):
+        self.set_windows(body["windows"])
+
+    def _on_window_opened_or_changed(self, body):
+        win = Window.from_dict(body["window"])
+        self._remove_window(win["id"])
+        if win.get("is_focused"):
+            self._set_focused_window(win["id"])
+        self._add_window(win)
+
+    def _on_window_closed(self, body):
+        self._remove_window(body["id"])
+        self.window_index.remove(body["id"])
+        self.focus_recency.pop(body["id"], None)
+
+    def _on_window_focus_changed(self, body):
+        self._set_focused_window(body.get("id"))
+
+    def _on_window_urgency_changed(self, body):
+        win = self.windows.get(body["id"])
+        if win is not None:
+            win["is_urgent"] = body["urgent"]
+
+    def _on_window_layouts_changed(self, body):
+        for window_id, layout in body["changes"]:
+            win = self.windows.get(window_id)
+            if win is not None:
+                win["layout"] = layout
+
+    def _on_window_focus_timestamp_changed(self, body):
+        win = self.windows.get(body["id"])
+        if win is not None:
+            win["focus_timestamp"] = body.get("focus_timestamp")
+
+    _handlers = {
+        "WorkspacesChanged": _on_workspaces_changed,
+        "WorkspaceActivated": _on_workspace_activated,
+        "WorkspaceActiveWindowChanged": _on_workspace_active_window_changed,
+        "WorkspaceUrgencyChanged": _on_workspace_urgency_changed,
+        "WindowsChanged": _on_windows_changed,
+        "WindowOpenedOrChanged": _on_window_opened_or_changed,
+        "WindowClosed": _on_window_closed,
+        "WindowFocusChanged": _on_window_focus_changed,
+        "WindowUrgencyChanged": _on_window_urgency_changed,
+        "WindowLayoutsChanged": _on_window_layouts_changed,
+        "WindowFocusTimestampChanged": _on_window_focus_timestamp_changed,
+    }
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _add_workspace(self, wsp):
+        self.workspaces[wsp["id"]] = wsp
+        if wsp.get("name"):
+            self.workspaces_by_name[wsp["name"]] = wsp
+        self.workspaces_by_output.setdefault(wsp.get("output"), {})[wsp["id"]] = wsp
+
+    def _add_window(self, win):
+        window_id = win["id"]
+        self.windows[window_id] = win
+        self.windows_by_workspace.setdefault(win.get("workspace_id"), {})[window_id] = win
+        self.windows_by_app_id.setdefault(win.get("app_id"), {})[window_id] = win
+        self.window_index.add(win)
+        if win.get("is_focused"):
+            self.focused_window_id = window_id
+
+    def _remove_window(self, window_id):
+        """Drop window_id from the dict indexes; the search index is left to the caller."""
+        win = self.windows.pop(window_id, None)
+        if win is None:
+            return None
+        _discard(self.windows_by_workspace, win.get("workspace_id"), window_id)
+        _discard(self.windows_by_app_id, win.get("app_id"), window_id)
+        if self.focused_window_id == window_id:
+            self.focused_window_id = None
+        return win
+
+    def _set_focused_window(self, window_id):
+        previous = self.windows.get(self.focused_window_id)
+        if previous is not None:
+            previous["is_focused"] = False
+        self.focused_window_id = window_id
+        win = self.windows.get(window_id)
+        if win is not None:
+            win["is_focused"] = True
+            # Same clock as niri's focus_timestamp (CLOCK_MONOTONIC).
+            self.focus_recency[window_id] = time.monotonic()
+
+def _discard(index, key, item_id):
+    """Remove item_id from index[key], dropping the bucket once empty."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(item_id, None)
+        if not bucket:
+            del index[key]
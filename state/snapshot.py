@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+
+from ipc.actions import list_windows_query, list_workspaces_query
+from ipc.models import decode_windows, decode_workspaces
+
+def fetch_snapshot(client, state=None):
+    """Return ``(workspaces, windows)`` from state, or from niri in one round trip.
+
+    Both queries go out together through ``client.batch()``, so the two
+    lists describe the same moment as closely as niri allows.
+    """
+    if state is not None:
+        return list(state.workspaces.values()), list(state.windows.values())
+    workspaces, windows = client.batch([list_workspaces_query(), list_windows_query()], raw=True)
+    return decode_workspaces(workspaces), decode_windows(windows)
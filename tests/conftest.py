@@ -0,0 +1,36 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# The tools import their packages from the repository root, as the
+# niri-*.py wrappers do.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.fake_niri import FakeNiriServer, default_world
+from client.socket_client import NiriClient
+
+@pytest.fixture
+def runtime_dir(monkeypatch):
+    # Not tmp_path: Unix socket paths must stay under ~100 bytes.
+    with tempfile.TemporaryDirectory(prefix="niri-test-") as path:
+        monkeypatch.setenv("XDG_RUNTIME_DIR", path)
+        yield path
+
+@pytest.fixture
+def world():
+    return default_world()
+
+@pytest.fixture
+def niri(runtime_dir, world, monkeypatch):
+    """A fake niri serving world, with NIRI_SOCKET pointing at it."""
+    path = os.path.join(runtime_dir, "niri.test.sock")
+    monkeypatch.setenv("NIRI_SOCKET", path)
+    with FakeNiriServer(path, world) as server:
+        yield server
+
+@pytest.fixture
+def client(niri):
+    with NiriClient(niri.path) as client:
+        yield client
@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+from bench.fake_niri import make_world
+from client.async_client import AsyncNiriClient
+from ipc.actions import focus_window_action, list_windows_query, list_workspaces_query
+
+def test_request_returns_decoded_reply(niri, world):
+    reply = asyncio.run(AsyncNiriClient(niri.path).request(list_workspaces_query()))
+    assert reply == {"Ok": {"Workspaces": world["workspaces"]}}
+
+def test_request_reads_replies_past_the_default_stream_limit(niri, world):
+    world["windows"][:] = make_world(outputs=1, workspaces=2, windows=2000)["windows"]
+    reply = asyncio.run(AsyncNiriClient(niri.path).request(list_windows_query()))
+    assert len(reply["Ok"]["Windows"]) == 2000
+
+def test_request_many_runs_concurrently_and_keeps_order(niri, world):
+    niri.latency = 0.2
+    messages = [list_workspaces_query(), list_windows_query(), focus_window_action(999)]
+    t0 = time.monotonic()
+    replies = asyncio.run(AsyncNiriClient(niri.path).request_many(messages))
+    assert time.monotonic() - t0 < 0.5  # one at a time would take 0.6 s
+    assert replies[0] == {"Ok": {"Workspaces": world["workspaces"]}}
+    assert replies[1] == {"Ok": {"Windows": world["windows"]}}
+    assert "Err" in replies[2]
+
+def test_events_yield_the_state_then_live_events(niri):
+    async def collect():
+        client = AsyncNiriClient(niri.path)
+        events = []
+        async for event in client.events():
+            events.append(event)
+            if len(events) == 2:
+                # Subscribed; an action now comes back as events.
+                assert "Ok" in await client.request(focus_window_action(2))
+            if len(events) == 4:
+                niri.stop()
+        return events
+
+    events = asyncio.run(asyncio.wait_for(collect(), 5))
+    assert [next(iter(event)) for event in events][:2] == ["WorkspacesChanged", "WindowsChanged"]
+    assert {"WindowFocusChanged": {"id": 2}} in events
@@ -0,0 +1,64 @@
+import pytest
+
+from bench.fake_niri import make_world
+from cmds.bulk_move import bulk_move
+from util.cli import parse_bulk_move_args
+
+@pytest.fixture
+def world():
+    return make_world(outputs=2, workspaces=6, windows=40)
+
+def bulk(client, *argv):
+    return bulk_move(client, parse_bulk_move_args(list(argv)))
+
+def on_workspace(world, workspace_id):
+    return [win["id"] for win in world["windows"] if win["workspace_id"] == workspace_id]
+
+def test_moves_every_window_of_an_app(client, world):
+    foot = [win["id"] for win in world["windows"] if win["app_id"] == "foot"]
+    assert foot
+    assert bulk(client, "--app_id", "FOOT", "--target", "w", "--target_id", "scratchpad") == 0
+    assert set(foot) <= set(on_workspace(world, 2))
+
+def test_empties_a_workspace_onto_an_output(client, world):
+    # Index 2 on the focused output DP-1 is workspace 3; DP-2 shows workspace 2.
+    moving = on_workspace(world, 3)
+    assert moving
+    assert bulk(client, "--from_workspace", "2", "--target", "m", "--target_id", "DP-2") == 0
+    assert on_workspace(world, 3) == []
+    assert set(moving) <= set(on_workspace(world, 2))
+
+def test_dry_run_moves_nothing(client, world):
+    before = [win["workspace_id"] for win in world["windows"]]
+    assert bulk(client, "--app_id", "foot", "--target", "w", "--target_id", "scratchpad", "--dry_run") == 0
+    assert [win["workspace_id"] for win in world["windows"]] == before
+
+def test_strict_order_sends_one_request_per_window(client, world, niri):
+    slack = [win["id"] for win in world["windows"] if win["app_id"] == "slack" and win["workspace_id"] != 2]
+    assert bulk(client, "--app_id", "slack", "--target", "w", "--target_id", "scratchpad", "--strict_order") == 0
+    assert set(slack) <= set(on_workspace(world, 2))
+    assert niri.requests == 2 + len(slack)
+
+def test_windows_already_there_stay_put(client, world, capsys):
+    bulk(client, "--app_id", "foot", "--target", "w", "--target_id", "scratchpad")
+    capsys.readouterr()
+    assert bulk(client, "--app_id", "foot", "--target", "w", "--target_id", "scratchpad") == 0
+    assert "Nothing to move" in capsys.readouterr().out
+
+def test_unknown_target_fails(client, world):
+    assert bulk(client, "--app_id", "foot", "--target", "w", "--target_id", "nowhere") == 1
+
+def test_only_decimal_references_are_indexes(client, world):
+    assert bulk(client, "--app_id", "foot", "--target", "w", "--target_id", "²") == 1
+
+def test_a_workspace_named_like_a_digit_is_found(client, world):
+    world["workspaces"][3]["name"] = "²"
+    slack = [win["id"] for win in world["windows"] if win["app_id"] == "slack"]
+    assert bulk(client, "--app_id", "slack", "--target", "w", "--target_id", "²") == 0
+    assert set(slack) <= set(on_workspace(world, 4))
+
+def test_an_index_target_is_sent_as_the_resolved_id(client, world):
+    # Index 2 on the focused output DP-1 is workspace 3.
+    slack = [win["id"] for win in world["windows"] if win["app_id"] == "slack"]
+    assert bulk(client, "--app_id", "slack", "--target", "w", "--target_id", "2") == 0
+    assert set(slack) <= set(on_workspace(world, 3))
@@ -0,0 +1,65 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def control_path(runtime_dir, monkeypatch):
+    path = os.path.join(runtime_dir, "niri_tools.sock")
+    monkeypatch.setenv("NIRI_TOOLS_SOCKET", path)
+    return path
+
+@pytest.fixture
+def daemon(niri, control_path):
+    proc = subprocess.Popen([sys.executable, os.path.join(ROOT, "niri-daemon.py")],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    deadline = time.monotonic() + 10
+    while not os.path.exists(control_path):
+        assert proc.poll() is None, proc.communicate()
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.02)
+    yield proc
+    if proc.poll() is None:
+        proc.kill()
+        proc.communicate()
+
+def ctl(*argv):
+    return subprocess.run([sys.executable, os.path.join(ROOT, "niri-ctl"), *argv],
+                          capture_output=True, text=True, timeout=10)
+
+def test_ctl_talks_to_the_daemon(daemon):
+    result = ctl("ping")
+    assert result.returncode == 0
+    assert result.stdout == "pong\n"
+
+def test_ctl_reports_a_missing_daemon(control_path):
+    assert ctl("ping").returncode == 69
+
+def test_subcommand_help_names_niri_ctl(daemon):
+    result = ctl("move-window", "--help")
+    assert result.returncode == 0
+    assert result.stdout.startswith("usage: niri-ctl move-window")
+
+def test_second_daemon_refuses_quietly(daemon):
+    second = subprocess.run([sys.executable, os.path.join(ROOT, "niri-daemon.py")],
+                            capture_output=True, text=True, timeout=10)
+    assert second.returncode == 1
+    assert "❌ A niri_tools daemon is already listening" in second.stdout
+    assert "Traceback" not in second.stderr
+    assert ctl("ping").returncode == 0
+
+    daemon.send_signal(signal.SIGTERM)
+    _, stderr = daemon.communicate(timeout=10)
+    assert "Traceback" not in stderr
+
+def test_sigterm_removes_the_control_socket(daemon, control_path):
+    daemon.send_signal(signal.SIGTERM)
+    stdout, _ = daemon.communicate(timeout=10)
+    assert daemon.returncode == 0
+    assert "Terminated" in stdout
+    assert not os.path.exists(control_path)
@@ -0,0 +1,88 @@
+import json
+import socket
+import threading
+
+import pytest
+
+from client.event_dispatch import DEBOUNCE, EACH, LATEST, RATE, EventDispatcher
+
+def title(window_id, text):
+    return json.dumps({"WindowOpenedOrChanged": {"window": {"id": window_id, "title": text}}}).encode()
+
+def recorder(dispatcher, policy, **kwargs):
+    calls = []
+    dispatcher.on("WindowOpenedOrChanged", lambda payloads: calls.append(
+        [(p["window"]["id"], p["window"]["title"]) for p in payloads]), policy=policy, **kwargs)
+    return calls
+
+def test_each_calls_for_every_event():
+    dispatcher = EventDispatcher()
+    calls = recorder(dispatcher, EACH)
+    for i in range(3):
+        dispatcher.feed(title(1, f"t{i}"), now=0.0)
+    assert calls == [[(1, "t0")], [(1, "t1")], [(1, "t2")]]
+
+def test_latest_collapses_a_burst_per_window():
+    dispatcher = EventDispatcher()
+    calls = recorder(dispatcher, LATEST)
+    for line in (title(1, "a"), title(2, "b"), title(1, "c")):
+        dispatcher.feed(line, now=0.0)
+    assert calls == []
+    dispatcher.burst_end(now=0.0)
+    assert calls == [[(2, "b"), (1, "c")]]
+    assert dispatcher.stats()["merged"] == 1
+
+def test_debounce_waits_for_a_quiet_stream():
+    dispatcher = EventDispatcher()
+    calls = recorder(dispatcher, DEBOUNCE, wait=0.1)
+    dispatcher.feed(title(1, "a"), now=0.0)
+    dispatcher.burst_end(now=0.0)
+    dispatcher.feed(title(1, "b"), now=0.05)
+    dispatcher.poll(now=0.12)
+    assert calls == []
+    assert dispatcher.next_deadline() == pytest.approx(0.15)
+    dispatcher.poll(now=0.16)
+    assert calls == [[(1, "b")]]
+
+def test_rate_spaces_calls_by_the_interval():
+    dispatcher = EventDispatcher()
+    calls = recorder(dispatcher, RATE, interval=0.5)
+    dispatcher.feed(title(1, "a"), now=0.0)
+    dispatcher.burst_end(now=0.0)
+    dispatcher.feed(title(1, "b"), now=0.1)
+    dispatcher.burst_end(now=0.1)
+    assert calls == [[(1, "a")]]
+    assert dispatcher.next_deadline() == pytest.approx(0.5)
+    dispatcher.poll(now=0.5)
+    assert calls == [[(1, "a")], [(1, "b")]]
+
+def test_unhandled_types_are_dropped_and_handler_errors_counted(capsys):
+    dispatcher = EventDispatcher()
+    sub = dispatcher.on("WindowOpenedOrChanged", lambda payloads: 1 / 0, policy=EACH)
+    dispatcher.feed(b'{"WindowFocusChanged":{"id":1}}', now=0.0)
+    dispatcher.feed(title(1, "a"), now=0.0)
+    assert dispatcher.stats()["dropped"] == 1
+    assert sub.errors == 1
+    assert "handler failed" in capsys.readouterr().out
+
+def test_unknown_policy_is_refused():
+    with pytest.raises(ValueError):
+        EventDispatcher().on("WindowFocusChanged", print, policy="sometimes")
+
+def test_run_coalesces_a_burst_from_niri(niri):
+    dispatcher = EventDispatcher()
+    calls = recorder(dispatcher, LATEST)
+    subscribed = threading.Event()
+    dispatcher.on("WindowsChanged", lambda payloads: subscribed.set(), policy=EACH)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        sock.connect(niri.path)
+        runner = threading.Thread(target=dispatcher.run, args=(sock,))
+        runner.start()
+        assert subscribed.wait(5)
+        niri.emit(*[json.loads(title(1, f"t{i}")) for i in range(100)])
+        niri.stop()
+        runner.join(5)
+    assert not runner.is_alive()
+    assert sum(len(call) for call in calls) < 100
+    assert calls[-1] == [(1, "t99")]
@@ -0,0 +1,62 @@
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from bench.event_replay import EventReplayServer, load_recording, record
+from client.socket_client import subscribe
+
+def events_from(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        sock.connect(path)
+        return list(subscribe(sock))
+
+@pytest.fixture
+def replay_path(runtime_dir):
+    return os.path.join(runtime_dir, "niri.replay.sock")
+
+def test_record_keeps_events_and_offsets(niri, runtime_dir):
+    path = os.path.join(runtime_dir, "session.ndjson.gz")
+    threading.Timer(0.1, niri.emit, [{"WindowFocusChanged": {"id": 2}}]).start()
+    assert record(niri.path, path, duration=5, count=3) == 3
+    events = load_recording(path)
+    assert [line.split(b'"')[1] for _, line in events] == [
+        b"WorkspacesChanged", b"WindowsChanged", b"WindowFocusChanged"]
+    assert all(line.endswith(b"\n") for _, line in events)
+    assert events[0][0] <= events[1][0] < 0.05 < events[2][0]
+
+def test_replay_sends_every_event_in_order(replay_path):
+    events = [(i / 1000, b'{"WindowFocusChanged":{"id":%d}}\n' % i) for i in range(500)]
+    with EventReplayServer(replay_path, events, speed=None) as server:
+        received = events_from(replay_path)
+        assert server.finished.wait(5)
+    assert received == [line.rstrip(b"\n") for _, line in events]
+    assert server.sent == 500
+
+def test_replay_keeps_the_recorded_pace(replay_path):
+    events = [(0.0, b'{"A":{}}\n'), (0.2, b'{"B":{}}\n')]
+    with EventReplayServer(replay_path, events, speed=2.0):
+        t0 = time.monotonic()
+        assert len(events_from(replay_path)) == 2
+        elapsed = time.monotonic() - t0
+    assert 0.09 <= elapsed < 1.0
+
+def test_replay_refuses_a_live_socket_or_other_file(niri, runtime_dir):
+    with pytest.raises(FileExistsError):
+        EventReplayServer(niri.path, []).start()
+    path = os.path.join(runtime_dir, "config.kdl")
+    open(path, "w").close()
+    with pytest.raises(FileExistsError):
+        EventReplayServer(path, []).start()
+    assert os.path.exists(path)
+
+def test_replay_answers_other_requests_with_err(replay_path):
+    with EventReplayServer(replay_path, []):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with sock:
+            sock.connect(replay_path)
+            sock.sendall(b'"Windows"\n')
+            assert sock.makefile("rb").readline().startswith(b'{"Err"')
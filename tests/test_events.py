@@ -0,0 +1,44 @@
+import io
+import json
+import socket
+
+from cmds.events import project, tail_events
+
+STREAM = (
+    b'{"Ok":"Handled"}\n'
+    b'{"WorkspaceActivated":{"id":3,"focused":true}}\n'
+    b'{"WindowOpenedOrChanged":{"window":{"id":7,"title":"foot","app_id":"foot"}}}\n'
+    b'{"WindowFocusChanged":{"id":7}}\n'
+)
+
+def tail(stream, only=None, fields=None):
+    ours, theirs = socket.socketpair()
+    with ours, theirs:
+        theirs.sendall(stream)
+        theirs.shutdown(socket.SHUT_WR)
+        out = io.BytesIO()
+        status = tail_events(ours, out, only, fields)
+    return status, out.getvalue().splitlines()
+
+def test_compact_passes_events_through_as_sent():
+    status, lines = tail(STREAM)
+    assert status is None
+    assert lines == STREAM.splitlines()[1:]
+
+def test_only_keeps_the_named_event_types():
+    _, lines = tail(STREAM, only={"WindowFocusChanged", "WorkspaceActivated"})
+    assert [next(iter(json.loads(line))) for line in lines] == ["WorkspaceActivated", "WindowFocusChanged"]
+
+def test_fields_project_dotted_paths():
+    _, lines = tail(STREAM, only={"WindowOpenedOrChanged"}, fields=[["window", "title"], ["id"]])
+    assert [json.loads(line) for line in lines] == [{"event": "WindowOpenedOrChanged", "window.title": "foot"}]
+
+def test_project_skips_missing_and_non_dict_paths():
+    payload = {"id": 7, "window": {"title": "foot"}}
+    assert project("X", payload, [["id"], ["id", "deeper"], ["window", "title"], ["nope"]]) == {
+        "event": "X", "id": 7, "window.title": "foot"}
+
+def test_err_reply_fails():
+    status, lines = tail(b'{"Err":"no"}\n')
+    assert status == 1
+    assert lines == []
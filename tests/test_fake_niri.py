@@ -0,0 +1,20 @@
+import os
+import threading
+import time
+
+from bench.fake_niri import FakeNiriServer
+
+def test_stop_ends_the_accept_loop_cleanly(runtime_dir, monkeypatch):
+    errors = []
+    monkeypatch.setattr(threading, "excepthook", errors.append)
+    path = os.path.join(runtime_dir, "niri.test.sock")
+    before = threading.active_count()
+    for _ in range(20):
+        with FakeNiriServer(path):
+            pass
+    deadline = time.monotonic() + 5
+    while threading.active_count() > before and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert threading.active_count() == before
+    assert errors == []
+    assert not os.path.exists(path)
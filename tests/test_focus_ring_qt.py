@@ -0,0 +1,120 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from config import kdl
+from config.focus_ring import load_focus_ring, parse_focus_ring
+from editors import focus_ring_qt
+
+CONFIG = """\
+layout {
+    focus-ring {
+        width 4
+        active-color "#7fc8ff"
+        // inactive-color "#505050"
+    }
+}
+"""
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def config_path(runtime_dir, monkeypatch):
+    path = os.path.join(runtime_dir, "config.kdl")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(CONFIG)
+    monkeypatch.setattr(focus_ring_qt, "CONFIG_PATH", path)
+    return path
+
+@pytest.fixture
+def writes(config_path, monkeypatch):
+    """Every write_items call the editor makes, with whether it changed the file."""
+    calls = []
+    write_items = focus_ring_qt.write_items
+
+    def counting(items):
+        changed = write_items(items)
+        calls.append(changed)
+        return changed
+
+    monkeypatch.setattr(focus_ring_qt, "write_items", counting)
+    return calls
+
+@pytest.fixture
+def editor(app, config_path, writes):
+    doc, node = load_focus_ring(config_path)
+    editor = focus_ring_qt.FocusRingEditor(parse_focus_ring(doc.body(node)), preview_rate=10)
+    yield editor
+    editor.close()
+
+def item(editor, key):
+    return next(it for it in editor.items if it['key'] == key)
+
+def run_events(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        QApplication.processEvents()
+        time.sleep(0.002)
+
+def settle(editor):
+    # Let the last timer tick and write land.
+    run_events(0.3)
+    while editor._writes_in_flight or editor._preview_timer.isActive():
+        run_events(0.05)
+
+def width_in_file(path):
+    doc, node = load_focus_ring(path)
+    return next(it['value'] for it in parse_focus_ring(doc.body(node)) if it['key'] == 'width')
+
+def test_live_preview_coalesces_a_burst_of_edits(editor, writes, config_path):
+    editor.live_check.setChecked(True)
+    entry = item(editor, 'width')['entry']
+    start = time.monotonic()
+    n = 0
+    while time.monotonic() - start < 1.0:
+        n += 1
+        entry.setText(str(n % 20 + 1))
+        run_events(0.005)
+    entry.setText("7")
+    settle(editor)
+
+    # 10 writes a second at most, however many edits came in.
+    assert n > 50
+    assert 3 <= len(writes) <= 13
+    assert width_in_file(config_path) == "7"
+
+def test_without_live_preview_only_save_writes(editor, writes, config_path):
+    item(editor, 'width')['entry'].setText("9")
+    run_events(0.3)
+    assert writes == []
+
+    editor.on_save()
+    settle(editor)
+    assert writes == [True]
+    assert width_in_file(config_path) == "9"
+    assert editor.status_label.text() == "Changes saved! Check Niri."
+
+def test_invalid_values_pause_the_preview(editor, writes, config_path):
+    editor.live_check.setChecked(True)
+    settle(editor)
+    before = len(writes)
+    item(editor, 'active-color')['color_edit'].setText("#7fc8f")
+    settle(editor)
+    assert len(writes) == before
+    assert editor.status_label.text().startswith("Preview paused")
+
+def test_saving_unchanged_values_does_not_write(editor, writes, config_path):
+    mtime = os.stat(config_path).st_mtime_ns
+    editor.on_save()
+    settle(editor)
+    assert writes == [False]
+    assert os.stat(config_path).st_mtime_ns == mtime
+    assert kdl.load(config_path).text == CONFIG
@@ -0,0 +1,144 @@
+import os
+
+import pytest
+
+from config import kdl
+from config.focus_ring import load_focus_ring, parse_focus_ring, update_focus_ring
+
+CONFIG = """\
+// focus-ring { width 1; }
+input {
+    keyboard { xkb { layout "us"; } }
+}
+
+layout {
+    gaps 16
+    /* focus-ring {
+        width 99
+    } */
+    focus-ring {
+        width 4
+        active-color "#7fc8ff"
+        // inactive-color "#505050"
+    }
+    /-border { width 2; }
+    border {
+        off
+    }
+}
+
+window-rule {
+    focus-ring { width 8; }
+}
+"""
+
+@pytest.fixture
+def config_path(runtime_dir):
+    path = os.path.join(runtime_dir, "config.kdl")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(CONFIG)
+    return path
+
+def test_find_skips_comments_and_other_blocks():
+    doc = kdl.Document(CONFIG)
+    node = doc.find("layout/focus-ring")
+    assert doc.source(node).startswith("focus-ring {\n        width 4")
+    assert [n.path for n in doc.find_all("layout/border")] == ["layout/border"]
+    assert doc.find("window-rule/focus-ring") is not None
+    assert doc.find("focus-ring") is None
+
+def test_body_is_the_text_between_the_braces():
+    doc = kdl.Document(CONFIG)
+    body = doc.body(doc.find("layout/focus-ring"))
+    assert body.strip().splitlines()[0] == "width 4"
+    assert body.endswith("\n    ")
+
+def test_replace_changes_only_the_node():
+    doc = kdl.Document(CONFIG)
+    node = doc.find("layout/focus-ring")
+    new = doc.replace(node, "focus-ring {\n        width 6\n    }")
+    before, after = CONFIG.split(doc.source(node))
+    assert new.text == before + "focus-ring {\n        width 6\n    }" + after
+    # The copied tree points at the same places as a fresh parse.
+    fresh = kdl.Document(new.text)
+    for path in ("layout/border", "window-rule/focus-ring", "layout/focus-ring"):
+        assert new.source(new.find(path)) == fresh.source(fresh.find(path))
+
+def test_replace_rejects_anything_but_one_node():
+    doc = kdl.Document(CONFIG)
+    node = doc.find("layout/focus-ring")
+    with pytest.raises(kdl.KdlError):
+        doc.replace(node, "focus-ring { width 6; } border { off; }")
+    with pytest.raises(kdl.KdlError):
+        doc.replace(node, "focus-ring {")
+
+def test_unbalanced_text_is_an_error():
+    with pytest.raises(kdl.KdlError):
+        kdl.Document("layout {\n")
+    with pytest.raises(kdl.KdlError):
+        kdl.Document("}\n")
+
+def test_braces_in_strings_and_raw_strings_are_text():
+    doc = kdl.Document('a "}" {\n    b r#"{"#\n}\n')
+    assert doc.find("a/b") is not None
+
+def test_crlf_round_trips(runtime_dir):
+    path = os.path.join(runtime_dir, "crlf.kdl")
+    text = CONFIG.replace("\n", "\r\n")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    assert kdl.load(path).text == text
+
+def test_save_skips_an_unchanged_document(config_path):
+    doc = kdl.load(config_path)
+    mtime = os.stat(config_path).st_mtime_ns
+    assert kdl.save(config_path, doc) is False
+    assert os.stat(config_path).st_mtime_ns == mtime
+
+def test_save_writes_and_reloads(config_path):
+    doc = kdl.load(config_path)
+    new = doc.replace(doc.find("layout/focus-ring"), "focus-ring {\n        width 6\n    }")
+    assert kdl.save(config_path, new) is True
+    with open(config_path, encoding="utf-8", newline="") as f:
+        assert f.read() == new.text
+    assert kdl.load(config_path) is new
+    assert [name for name in os.listdir(os.path.dirname(config_path)) if name.startswith(".config.kdl")] == []
+
+def test_load_notices_changes_made_elsewhere(config_path):
+    kdl.load(config_path)
+    with open(config_path, "a", encoding="utf-8") as f:
+        f.write("cursor { xcursor-size 24; }\n")
+    assert kdl.load(config_path).find("cursor") is not None
+
+def test_write_atomic_keeps_the_symlink(runtime_dir, config_path):
+    link = os.path.join(runtime_dir, "link.kdl")
+    os.symlink(config_path, link)
+    kdl.write_atomic(link, "layout {}\n")
+    assert os.path.islink(link)
+    with open(config_path, encoding="utf-8") as f:
+        assert f.read() == "layout {}\n"
+
+def test_focus_ring_items_round_trip(config_path):
+    doc, node = load_focus_ring(config_path)
+    original = doc.source(node)
+    items = parse_focus_ring(doc.body(node))
+    assert [(item["key"], item["enabled"]) for item in items] == [
+        ("width", True), ("active-color", True), ("inactive-color", False)]
+
+    # Rebuilding the unchanged items gives back the same document.
+    assert update_focus_ring(items, config_path) is doc
+
+    items[0]["value"] = "6"
+    items[2]["enabled"] = True
+    new = update_focus_ring(items, config_path)
+    assert kdl.save(config_path, new)
+    doc, node = load_focus_ring(config_path)
+    block = (
+        'focus-ring {\n'
+        '        width 6\n'
+        '        active-color "#7fc8ff"\n'
+        '        inactive-color "#505050"\n'
+        '    }'
+    )
+    assert doc.source(node) == block
+    assert doc.text == CONFIG.replace(original, block)
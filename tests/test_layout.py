@@ -0,0 +1,95 @@
+import json
+import os
+
+import pytest
+
+from bench.fake_niri import make_world
+from cmds.layout import match_windows, restore_layout, save_layout, title_pattern
+
+@pytest.fixture
+def world():
+    return make_world(outputs=2, workspaces=6, windows=30)
+
+@pytest.fixture
+def layout_file(runtime_dir):
+    return os.path.join(runtime_dir, "layout.json")
+
+def placement(world):
+    return {win["id"]: win["workspace_id"] for win in world["windows"]}
+
+def scramble(world):
+    for win in world["windows"]:
+        win["workspace_id"] = 1
+
+def test_save_then_restore_puts_windows_back(client, world, layout_file):
+    saved = placement(world)
+    assert save_layout(client, layout_file) == 0
+
+    scramble(world)
+    assert restore_layout(client, layout_file) == 0
+    assert placement(world) == saved
+
+def test_restore_matches_changed_titles_by_pattern(client, world, layout_file):
+    def name(win):
+        return "".join(chr(ord("a") + int(digit)) for digit in str(win["id"]))
+
+    for win in world["windows"]:
+        win["title"] = f"{name(win)} ({win['id']})"
+    saved = placement(world)
+    save_layout(client, layout_file)
+
+    scramble(world)
+    for win in world["windows"]:
+        win["title"] = f"{name(win)} ({win['id'] * 7})"  # unread counts moved on
+    world["windows"].reverse()  # so order alone would pair them wrongly
+    assert restore_layout(client, layout_file) == 0
+    assert placement(world) == saved
+
+def test_dry_run_moves_nothing(client, world, layout_file):
+    save_layout(client, layout_file)
+    scramble(world)
+    assert restore_layout(client, layout_file, dry_run=True) == 0
+    assert set(placement(world).values()) == {1}
+
+def test_strict_order_restores_too(client, world, layout_file):
+    saved = placement(world)
+    save_layout(client, layout_file)
+    scramble(world)
+    assert restore_layout(client, layout_file, strict_order=True) == 0
+    assert placement(world) == saved
+
+def test_restore_refuses_a_file_that_is_not_a_layout(client, layout_file, capsys):
+    with open(layout_file, "w", encoding="utf-8") as f:
+        json.dump([1, 2], f)
+    assert restore_layout(client, layout_file) == 1
+    assert "❌" in capsys.readouterr().out
+
+def test_restore_reports_unreadable_files(client, layout_file):
+    assert restore_layout(client, layout_file) == 1
+
+def test_title_pattern_generalises_numbers():
+    import re
+
+    pattern = title_pattern("Inbox (3) - mail.example 2024")
+    assert re.search(pattern, "Inbox (12) - mail.example 2025")
+    assert not re.search(pattern, "Inbox (x) - mail.example 2025")
+    assert not re.search(pattern, "Re: Inbox (3) - mail.example 2024")
+
+def test_bad_title_pattern_leaves_the_entry_unmatched(capsys):
+    entries = [{"app_id": "foot", "title": "gone", "title_pattern": "("}]
+    windows = [{"id": 1, "app_id": "foot", "title": "other"}]
+    assert match_windows(entries, windows) == [None]
+    assert "❌" in capsys.readouterr().out
+
+def test_exact_titles_win_over_patterns_and_order():
+    entries = [
+        {"app_id": "foot", "title": "a 1", "title_pattern": title_pattern("a 1")},
+        {"app_id": "foot", "title": "b", "title_pattern": title_pattern("b")},
+        {"app_id": "foot", "title": "a 2"},
+    ]
+    windows = [
+        {"id": 1, "app_id": "foot", "title": "a 2"},
+        {"id": 2, "app_id": "foot", "title": "a 9"},
+        {"id": 3, "app_id": "foot", "title": "c"},
+    ]
+    assert [win["id"] for win in match_windows(entries, windows)] == [2, 3, 1]
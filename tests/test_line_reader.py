@@ -0,0 +1,31 @@
+import socket
+import threading
+
+from client.socket_client import LineReader
+
+def test_line_reader_splits_a_burst_in_order():
+    ours, theirs = socket.socketpair()
+    with ours, theirs:
+        theirs.sendall(b"one\ntwo\nthree\nfour")
+        theirs.shutdown(socket.SHUT_WR)
+        reader = LineReader(ours)
+        assert reader.readline() == b"one"
+        assert reader.ready()
+        assert list(reader) == [b"two", b"three"]
+        assert reader.pending()
+
+def test_line_reader_grows_for_large_frames():
+    ours, theirs = socket.socketpair()
+    frame = b"x" * 200_000
+
+    def send():
+        theirs.sendall(frame + b"\n")
+        theirs.shutdown(socket.SHUT_WR)
+
+    with ours, theirs:
+        sender = threading.Thread(target=send)
+        sender.start()
+        reader = LineReader(ours, chunk_size=1024)
+        assert reader.readline() == frame
+        assert reader.readline() is None
+        sender.join()
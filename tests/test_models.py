@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from bench.fake_niri import make_world
+from ipc import models
+from ipc.fast_json import FAST_THRESHOLD
+from ipc.models import Window, decode_outputs, decode_windows, decode_workspaces
+
+@pytest.fixture(params=["generic", "msgspec"])
+def decoder(request, monkeypatch):
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    else:
+        monkeypatch.setattr(models, "_structs", False)
+    return request.param
+
+def same(decoded, raw):
+    # Models fill in the fields niri left out.
+    return len(decoded) == len(raw) and all(
+        all(model[key] == value for key, value in item.items()) for model, item in zip(decoded, raw))
+
+def reply(key, payload):
+    return json.dumps({"Ok": {key: payload}}).encode("utf-8")
+
+def test_large_replies_decode_to_the_same_models(decoder):
+    world = make_world(outputs=3, workspaces=12, windows=500)
+    line = reply("Windows", world["windows"])
+    assert len(line) > FAST_THRESHOLD
+
+    windows = decode_windows(line)
+    assert same(windows, world["windows"])
+    assert all(isinstance(win, models.Model) for win in windows)
+    assert (type(windows[0]).__module__ == "ipc.structs") == (decoder == "msgspec")
+    assert windows[0].get("title") == world["windows"][0]["title"]
+    assert windows[0].get("layout", {}) == {}
+    workspaces = decode_workspaces(reply("Workspaces", world["workspaces"] * 40))
+    assert same(workspaces[:12], world["workspaces"])
+
+def test_models_act_like_dicts(decoder):
+    world = make_world(windows=300)
+    win = decode_windows(reply("Windows", world["windows"]))[0]
+    win["is_urgent"] = True
+    win["unknown"] = 1
+    assert win["is_urgent"] and win["unknown"] == 1
+    assert "unknown" in win and "title" in win and "nothing" not in win
+    with pytest.raises(KeyError):
+        win["nothing"]
+    assert json.loads(json.dumps(win.to_dict()))["is_urgent"] is True
+
+def test_error_replies_decode_to_nothing(decoder):
+    big_error = json.dumps({"Err": "x" * FAST_THRESHOLD}).encode("utf-8")
+    assert decode_windows(big_error) == []
+    assert decode_outputs(big_error) == {}
+    assert decode_windows({"Err": "nope"}) == []
+
+def test_unknown_keys_are_kept_on_the_generic_path():
+    win = Window.from_dict({"id": 1, "title": "t", "new_in_niri": [1]})
+    assert win["new_in_niri"] == [1]
+    assert win.to_dict()["new_in_niri"] == [1]
@@ -0,0 +1,63 @@
+import pytest
+
+from cmds.move_window import move_window_by_match
+from state.niri_state import NiriState
+from util.cli import parse_args
+
+def window(world, window_id):
+    return next(win for win in world["windows"] if win["id"] == window_id)
+
+def test_moves_the_matching_window_to_a_named_workspace(client, world):
+    args = parse_args(["--match", "messages", "--target", "w", "--target_id", "main"])
+    assert move_window_by_match(client, args) == 0
+    assert window(world, 2)["workspace_id"] == 1
+    assert window(world, 1)["is_focused"]
+
+def test_focus_follows_the_move(client, world):
+    args = parse_args(["--match", "googlemessages", "--target", "m", "--target_id", "HDMI-A-2", "--focus"])
+    assert move_window_by_match(client, args) == 0
+    assert window(world, 2)["workspace_id"] == 3
+    assert window(world, 2)["is_focused"]
+
+def test_no_match_fails_without_moving(client, world, capsys):
+    args = parse_args(["--match", "nothing-like-this", "--target", "w", "--target_id", "main"])
+    assert move_window_by_match(client, args) == 1
+    assert "No matching window" in capsys.readouterr().out
+    assert window(world, 2)["workspace_id"] == 2
+
+def test_error_reply_fails(client, world):
+    args = parse_args(["--match", "Messages", "--target", "w", "--target_id", "no-such-workspace"])
+    assert move_window_by_match(client, args) == 1
+
+def test_uses_the_daemon_state(client, world):
+    state = NiriState().load(client)
+    args = parse_args(["--match", "2", "--target", "w", "--target_id", "main"])
+    assert move_window_by_match(client, args, state=state) == 0
+    assert window(world, 2)["workspace_id"] == 1
+
+def test_ranked_match_prefers_the_exact_app_id(client, world):
+    world["windows"].append({"id": 3, "title": "foot notes", "app_id": "emacs", "pid": 103,
+                             "workspace_id": 2, "is_focused": False, "is_floating": False,
+                             "is_urgent": False})
+    state = NiriState().load(client)
+    args = parse_args(["--match", "foot", "--match_mode", "ranked",
+                       "--target", "w", "--target_id", "scratchpad"])
+    assert move_window_by_match(client, args, state=state) == 0
+    assert window(world, 1)["workspace_id"] == 2
+
+@pytest.mark.parametrize("match_mode", ["first", "ranked"])
+@pytest.mark.parametrize("query", ["1", "2", "foot", "FOOT", "messages", "google", "src"])
+def test_same_window_with_and_without_the_daemon_state(client, world, query, match_mode, capsys):
+    world["windows"].append({"id": 3, "title": "foot notes", "app_id": "emacs", "pid": 103,
+                             "workspace_id": 2, "is_focused": False, "is_floating": False,
+                             "is_urgent": False})
+    state = NiriState().load(client)
+    args = parse_args(["--match", query, "--match_mode", match_mode, "--target", "w", "--target_id", "main"])
+    assert move_window_by_match(client, args) == 0
+    stateless = capsys.readouterr().out
+    assert move_window_by_match(client, args, state=state) == 0
+    with_state = capsys.readouterr().out
+    moved = stateless.splitlines()[-1]
+    assert moved.startswith("✅ Moved window")
+    assert moved == with_state.splitlines()[-1]
+    assert "Raw IPC" not in stateless
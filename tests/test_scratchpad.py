@@ -0,0 +1,76 @@
+import json
+
+from cmds.scratchpad import CHOOSE_WINDOW, run_scratchpad
+from util.cli import parse_scratchpad_args
+
+def window(world, window_id):
+    return next(win for win in world["windows"] if win["id"] == window_id)
+
+def scratchpad(client, *argv):
+    return run_scratchpad(client, parse_scratchpad_args(["--scratchpad_name", "scratchpad", *argv]))
+
+def test_list_prints_the_scratchpad_windows(client, capsys):
+    assert scratchpad(client, "--action", "list") == 0
+    listed = json.loads(capsys.readouterr().out)
+    assert [win["id"] for win in listed] == [2]
+
+def test_put_sends_the_focused_window_away(client, world):
+    assert scratchpad(client, "--action", "put") == 0
+    assert window(world, 1)["workspace_id"] == 2
+
+def test_get_brings_the_only_window_to_the_focused_output(client, world):
+    assert scratchpad(client, "--action", "get") == 0
+    assert window(world, 2)["workspace_id"] == 1
+    assert window(world, 2)["is_focused"]
+
+def test_toggle_sends_back_what_get_brought_out(client, world):
+    assert scratchpad(client, "--action", "toggle") == 0
+    assert window(world, 2)["workspace_id"] == 1
+
+    assert scratchpad(client, "--action", "toggle") == 0
+    assert window(world, 2)["workspace_id"] == 2
+
+def test_toggle_gets_when_the_focused_window_did_not_come_from_the_scratchpad(client, world):
+    assert scratchpad(client, "--action", "toggle") == 0
+    assert window(world, 1)["workspace_id"] == 1
+    assert window(world, 2)["workspace_id"] == 1
+
+def test_several_windows_go_through_the_picker(client, world):
+    scratchpad(client, "--action", "put")
+    assert scratchpad(client, "--action", "get", "--picker", "tail -n 1") == 0
+    assert window(world, 2)["workspace_id"] == 1
+    assert window(world, 1)["workspace_id"] == 2
+
+def test_without_a_picker_the_candidates_are_printed(client, world, capsys):
+    scratchpad(client, "--action", "put")
+    capsys.readouterr()
+    assert scratchpad(client, "--action", "get", "--picker", "") == CHOOSE_WINDOW
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split("|", 1)[0] for line in lines] == ["1", "2"]
+    assert window(world, 1)["workspace_id"] == 2
+
+def test_window_id_skips_the_picker(client, world):
+    scratchpad(client, "--action", "put")
+    assert scratchpad(client, "--action", "get", "--picker", "", "--window_id", "1") == 0
+    assert window(world, 1)["workspace_id"] == 1
+    assert window(world, 2)["workspace_id"] == 2
+
+def test_window_id_outside_the_scratchpad_fails(client, world):
+    assert scratchpad(client, "--action", "get", "--window_id", "1") == 1
+
+def test_missing_scratchpad_workspace_fails(client, world):
+    args = parse_scratchpad_args(["--scratchpad_name", "nowhere", "--action", "get"])
+    assert run_scratchpad(client, args) == 1
+
+def test_get_fails_when_niri_refuses_focus(client, world, niri, monkeypatch, capsys):
+    reply_to = niri.reply_to
+
+    def refuse_focus(request):
+        if isinstance(request, dict) and "FocusWindow" in request.get("Action", {}):
+            return {"Err": "focus refused"}
+        return reply_to(request)
+
+    monkeypatch.setattr(niri, "reply_to", refuse_focus)
+    assert scratchpad(client, "--action", "get") == 1
+    assert "❌ focus refused" in capsys.readouterr().out
+    assert window(world, 2)["workspace_id"] == 1
@@ -0,0 +1,65 @@
+import socket
+
+import pytest
+
+from client.socket_client import subscribe
+from ipc.actions import focus_window_action, list_windows_query, list_workspaces_query
+from ipc.models import decode_windows
+
+def test_request_returns_decoded_reply(client, world):
+    reply = client.request(list_windows_query())
+    assert reply == {"Ok": {"Windows": world["windows"]}}
+
+def test_request_raw_feeds_the_model_decoders(client, world):
+    line = client.request(list_windows_query(), raw=True)
+    assert isinstance(line, bytes)
+    assert [win["id"] for win in decode_windows(line)] == [win["id"] for win in world["windows"]]
+
+def test_request_reconnects_after_niri_hangs_up(client, niri):
+    # niri answers one request per connection, so this is the normal case.
+    for _ in range(3):
+        assert "Ok" in client.request(list_workspaces_query())
+    assert niri.requests == 3
+
+def test_request_fails_cleanly_without_niri(client, niri):
+    niri.stop()
+    with pytest.raises(OSError):
+        client.request(list_windows_query())
+
+def test_batch_keeps_replies_in_order(client, world):
+    replies = client.batch([list_workspaces_query(), list_windows_query(), focus_window_action(999)])
+    assert replies[0] == {"Ok": {"Workspaces": world["workspaces"]}}
+    assert replies[1] == {"Ok": {"Windows": world["windows"]}}
+    assert "Err" in replies[2]
+
+def test_batch_applies_every_action(client, world):
+    replies = client.batch([focus_window_action(2), focus_window_action(1)], max_in_flight=1)
+    assert replies == [{"Ok": "Handled"}, {"Ok": "Handled"}]
+    assert [win["id"] for win in world["windows"] if win["is_focused"]] == [1]
+
+def test_batch_reports_undeliverable_messages(niri, client):
+    niri.stop()
+    replies = client.batch([list_windows_query()])
+    assert "Err" in replies[0]
+
+def test_subscribe_returns_the_stream_after_the_ok(niri):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        sock.connect(niri.path)
+        reader = subscribe(sock)
+        assert reader.readline().startswith(b'{"WorkspacesChanged"')
+
+def test_subscribe_raises_on_err():
+    ours, theirs = socket.socketpair()
+    with ours, theirs:
+        theirs.sendall(b'{"Err":"no events for you"}\n')
+        with pytest.raises(ConnectionError, match="no events for you"):
+            subscribe(ours)
+
+def test_subscribe_raises_when_niri_hangs_up():
+    ours, theirs = socket.socketpair()
+    with ours:
+        theirs.shutdown(socket.SHUT_WR)
+        with pytest.raises(OSError):
+            subscribe(ours)
+        theirs.close()
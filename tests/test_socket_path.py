@@ -0,0 +1,87 @@
+import os
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from bench.fake_niri import FakeNiriServer
+from client.socket_client import NiriClient
+from client.socket_path import get_niri_socket_path, invalidate_socket_cache
+from ipc.actions import list_windows_query
+
+@pytest.fixture(autouse=True)
+def no_niri_socket(monkeypatch):
+    monkeypatch.delenv("NIRI_SOCKET", raising=False)
+    monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-1")
+
+def sock_name(runtime_dir, display="wayland-1", pid=None):
+    return os.path.join(runtime_dir, f"niri.{display}.{pid or os.getpid()}.sock")
+
+def dead_pid():
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+def stale_socket(path):
+    """A socket file nobody listens on, as a crashed niri leaves behind."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    sock.close()
+
+def cache_contents(runtime_dir):
+    with open(os.path.join(runtime_dir, "niri_tools.socket-path"), encoding="utf-8") as f:
+        return f.read()
+
+def test_niri_socket_wins_when_live(runtime_dir, monkeypatch):
+    path = os.path.join(runtime_dir, "custom.sock")
+    with FakeNiriServer(path), FakeNiriServer(sock_name(runtime_dir)):
+        monkeypatch.setenv("NIRI_SOCKET", path)
+        assert get_niri_socket_path() == path
+
+def test_dead_niri_socket_falls_back_to_the_runtime_dir(runtime_dir, monkeypatch):
+    monkeypatch.setenv("NIRI_SOCKET", os.path.join(runtime_dir, "gone.sock"))
+    with FakeNiriServer(sock_name(runtime_dir)) as niri:
+        assert get_niri_socket_path() == niri.path
+
+def test_scan_skips_dead_pids_and_stale_sockets(runtime_dir):
+    stale_socket(sock_name(runtime_dir, pid=dead_pid()))
+    stale_socket(sock_name(runtime_dir, display="wayland-0"))
+    with FakeNiriServer(sock_name(runtime_dir, display="wayland-9")) as niri:
+        assert get_niri_socket_path() == niri.path
+    assert get_niri_socket_path() is None
+
+def test_scan_prefers_this_sessions_display(runtime_dir):
+    with FakeNiriServer(sock_name(runtime_dir, display="wayland-0")), \
+            FakeNiriServer(sock_name(runtime_dir)) as ours:
+        assert get_niri_socket_path() == ours.path
+
+def test_scan_result_is_cached_until_it_dies(runtime_dir):
+    first = FakeNiriServer(sock_name(runtime_dir)).start()
+    assert get_niri_socket_path() == first.path
+    assert cache_contents(runtime_dir) == first.path
+
+    # The cache is trusted over a new scan while it looks alive...
+    with FakeNiriServer(sock_name(runtime_dir, display="wayland-0")) as second:
+        assert get_niri_socket_path() == first.path
+        # ...and rescanned once the socket has gone.
+        first.stop()
+        assert get_niri_socket_path() == second.path
+        assert cache_contents(runtime_dir) == second.path
+
+def test_invalidate_only_drops_the_named_path(runtime_dir):
+    with FakeNiriServer(sock_name(runtime_dir)) as niri:
+        get_niri_socket_path()
+        invalidate_socket_cache("/somewhere/else.sock")
+        assert cache_contents(runtime_dir) == niri.path
+        invalidate_socket_cache(niri.path)
+        assert not os.path.exists(os.path.join(runtime_dir, "niri_tools.socket-path"))
+
+def test_client_invalidates_a_cached_path_that_refuses_connections(runtime_dir):
+    with FakeNiriServer(sock_name(runtime_dir)):
+        path = get_niri_socket_path()
+    # Same pid, so the cheap check still passes, but nobody is listening.
+    stale_socket(path)
+    with NiriClient(path) as client, pytest.raises(ConnectionError):
+        client.request(list_windows_query())
+    assert not os.path.exists(os.path.join(runtime_dir, "niri_tools.socket-path"))
@@ -0,0 +1,48 @@
+from util.window_index import WindowIndex, first_matching_window
+
+WINDOWS = [
+    {"id": 1, "title": "~/src/niri_tools", "app_id": "foot"},
+    {"id": 2, "title": "Messages", "app_id": "googlemessages"},
+    {"id": 3, "title": "Firefox Nightly - footnotes", "app_id": "firefox"},
+    {"id": 12, "title": "notes.org", "app_id": "emacs"},
+    {"id": 21, "title": "Foot Locker sale", "app_id": "firefox"},
+]
+
+def ids(windows):
+    return [win["id"] for win in windows]
+
+def test_find_matching_window_order_of_preference():
+    index = WindowIndex(WINDOWS)
+    assert index.find_matching_window("12")["id"] == 12
+    assert index.find_matching_window("FOOT")["id"] == 1
+    assert index.find_matching_window("nightly")["id"] == 3
+    assert index.find_matching_window("missing") is None
+
+def test_first_matching_window_agrees_with_the_index():
+    index = WindowIndex(WINDOWS)
+    for query in ("12", "2", "FOOT", "firefox", "nightly", "no", "²", "missing"):
+        assert first_matching_window(WINDOWS, query) is index.find_matching_window(query)
+
+def test_only_decimal_strings_are_ids():
+    index = WindowIndex(WINDOWS)
+    assert index.find_matching_window("²") is None  # '²'.isdigit() but not a number
+
+def test_search_keeps_niri_order_and_limit():
+    index = WindowIndex(WINDOWS)
+    assert ids(index.search("foot")) == [1, 3, 21]
+    assert ids(index.search("foot", limit=2)) == [1, 3]
+    assert ids(index.search("no")) == [3, 12]
+
+def test_prefix_search_covers_title_and_app_id():
+    index = WindowIndex(WINDOWS)
+    assert ids(index.prefix_search("foot")) == [1, 21]
+    assert ids(index.prefix_search("google")) == [2]
+
+def test_index_follows_changes():
+    index = WindowIndex(WINDOWS)
+    index.add({"id": 3, "title": "Firefox", "app_id": "firefox"})
+    assert ids(index.search("footnotes")) == []
+    index.remove(1)
+    assert index.first_by_app_id("foot") is None
+    assert ids(index.find_by_app_id("FIREFOX")) == [3, 21]
+    assert len(index) == 4
@@ -0,0 +1,46 @@
+from util.window_index import WindowIndex
+from util.window_match import (
+    EXACT_APP_ID,
+    EXACT_ID,
+    FUZZY,
+    PREFIX,
+    SUBSTRING,
+    WindowMatcher,
+    rank_windows,
+)
+
+WINDOWS = [
+    {"id": 1, "title": "~/src/niri_tools", "app_id": "foot"},
+    {"id": 2, "title": "Messages", "app_id": "googlemessages"},
+    {"id": 3, "title": "Firefox Nightly - footnotes", "app_id": "firefox"},
+    {"id": 12, "title": "notes.org", "app_id": "emacs"},
+    {"id": 21, "title": "Foot Locker sale", "app_id": "firefox"},
+]
+
+def ids(windows):
+    return [win["id"] for win in windows]
+
+def test_matcher_tiers():
+    matcher = WindowMatcher(WindowIndex(WINDOWS))
+    assert matcher.rank("12")[0] == (EXACT_ID, WINDOWS[3])
+    assert [tier for tier, _ in matcher.rank("foot")] == [EXACT_APP_ID, PREFIX, SUBSTRING]
+    assert matcher.rank("msgs", limit=1) == [(FUZZY, WINDOWS[1])]
+    assert matcher.rank("zzz") == []
+
+def test_matcher_breaks_ties_by_recency():
+    index = WindowIndex(WINDOWS)
+    matcher = WindowMatcher(index, {3: 10.0, 21: 20.0})
+    assert ids(win for _, win in matcher.rank("firefox")) == [21, 3]
+
+def test_matcher_narrows_as_the_query_grows_and_sees_changes():
+    index = WindowIndex(WINDOWS)
+    matcher = WindowMatcher(index)
+    assert len(matcher.rank("f")) == 3
+    assert ids(win for _, win in matcher.rank("fi")) == [3, 21]
+    index.add({"id": 30, "title": "fig", "app_id": "feh"})
+    assert 30 in ids(win for _, win in matcher.rank("fig"))
+
+def test_rank_windows_matches_the_matcher():
+    matcher = WindowMatcher(WindowIndex(WINDOWS))
+    for query in ("foot", "notes", "msgs", "2"):
+        assert rank_windows(WINDOWS, query) == matcher.rank(query)
@@ -0,0 +1,83 @@
+import io
+import os
+import re
+import shutil
+
+import pytest
+
+from cmds.windows import LiveWindowTable, sort_windows
+
+WINDOWS = [
+    {"id": 1, "title": "foot", "app_id": "foot", "workspace_id": 1, "is_focused": True},
+    {"id": 2, "title": "Messages", "app_id": "googlemessages", "workspace_id": 2, "is_focused": False},
+    {"id": 3, "title": None, "app_id": "firefox", "workspace_id": 1, "is_focused": False},
+]
+
+@pytest.fixture
+def terminal(monkeypatch):
+    size = [os.terminal_size((80, 10))]
+    monkeypatch.setattr(shutil, "get_terminal_size", lambda *_: size[0])
+    return size
+
+@pytest.fixture
+def table(terminal):
+    return LiveWindowTable(io.StringIO(), ["id", "title", "app_id"])
+
+def written(table):
+    """Screen lines rewritten since the last call, and the raw output."""
+    text = table.out.getvalue()
+    table.out.seek(0)
+    table.out.truncate()
+    return [int(n) for n in re.findall(r"\x1b\[(\d+);1H", text)], text
+
+def test_first_draw_clears_and_writes_every_line(table):
+    table.draw(WINDOWS)
+    lines, text = written(table)
+    assert text.startswith("\x1b[2J")
+    assert lines == [1, 2, 3, 4, 5, 10]
+    assert "\x1b[1m1 " in text  # the focused window is bold
+
+def test_unchanged_redraw_writes_nothing(table):
+    table.draw(WINDOWS)
+    written(table)
+    table.draw([dict(win) for win in WINDOWS])
+    assert written(table) == ([], "")
+
+def test_a_title_change_rewrites_one_line(table):
+    table.draw(WINDOWS)
+    written(table)
+    changed = [dict(win) for win in WINDOWS]
+    changed[1]["title"] = "Messages (1)"
+    table.draw(changed)
+    lines, text = written(table)
+    assert lines == [4]
+    assert "Messages (1)" in text
+
+def test_a_closed_window_clears_its_line(table):
+    table.draw(WINDOWS)
+    written(table)
+    table.draw(WINDOWS[:2])
+    lines, text = written(table)
+    assert lines == [10, 5]
+    assert text.endswith("\x1b[5;1H\x1b[K")
+
+def test_resize_and_invalidate_redraw_everything(table, terminal):
+    table.draw(WINDOWS)
+    written(table)
+    terminal[0] = os.terminal_size((100, 10))
+    table.draw(WINDOWS)
+    assert written(table)[0] == [1, 2, 3, 4, 5, 10]
+    table.invalidate()
+    table.draw(WINDOWS)
+    assert written(table)[0] == [1, 2, 3, 4, 5, 10]
+
+def test_rows_past_the_screen_are_counted_not_drawn(table, terminal):
+    terminal[0] = os.terminal_size((80, 5))
+    table.draw(WINDOWS)
+    lines, text = written(table)
+    assert lines == [1, 2, 3, 4, 5]
+    assert "3 windows, sorted by niri order, 1 below the fold" in text
+
+def test_sort_puts_missing_values_first():
+    assert [win["id"] for win in sort_windows(WINDOWS, "title")] == [3, 1, 2]
+    assert [win["id"] for win in sort_windows(WINDOWS, None, reverse=True)] == [3, 2, 1]
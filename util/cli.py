@@ -1,11 +1,89 @@
 #!/usr/bin/env python3
 
 import argparse
+import os
 
-def parse_args():
-    parser = argparse.ArgumentParser(description="Move a Niri window to a specific workspace.")
+def parse_args(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Move a Niri window to a specific workspace.")
     parser.add_argument("--match", required=True, help="Match window title or app_id")
+    parser.add_argument("--match_mode", choices=["first", "ranked"], default="first",
+                        help="first=first window containing the match, "
+                             "ranked=best of id/app_id/prefix/substring/fuzzy matches")
     parser.add_argument("--target", required=True, help="m=monitor, w=workspace")
     parser.add_argument("--target_id", required=True, help="Target name or index")
     parser.add_argument("--focus", action="store_true", help="Focus moved window")
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+DEFAULT_PICKER = "rofi -dmenu -i -p 'Select window:'"
+
+def parse_scratchpad_args(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Manage Niri scratchpad workspace.")
+    parser.add_argument("--scratchpad_name", required=True, help="Name of scratchpad workspace (e.g. myscratchpad)")
+    parser.add_argument("--action", choices=["list", "put", "get", "toggle"], default="list",
+                        help="list=print the scratchpad's windows as JSON, put=send the focused window there, "
+                             "get=bring one back, toggle=put it back if it came from the scratchpad, else get")
+    parser.add_argument("--target_output", help="Output to bring windows to (default: the focused output)")
+    parser.add_argument("--picker", default=DEFAULT_PICKER,
+                        help="Command that reads one window per line on stdin and prints the chosen one")
+    parser.add_argument("--window_id", type=int,
+                        help="Bring this scratchpad window back instead of asking the picker")
+    return parser.parse_args(argv)
+
+def parse_events_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tail the Niri event stream.")
+    parser.add_argument("--only", help="Comma-separated event types to keep (e.g. WindowFocusChanged,WorkspaceActivated)")
+    parser.add_argument("--fields", help="Comma-separated payload fields to keep, dotted for nesting (e.g. id,window.title)")
+    parser.add_argument("--compact", action="store_true",
+                        help="One JSON object per line (NDJSON); unfiltered events are passed through undecoded")
+    return parser.parse_args(argv)
+
+def parse_bulk_move_args(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Move every Niri window matching a selector in one go.")
+    parser.add_argument("--app_id", help="Select windows whose app_id equals this (case-insensitive)")
+    parser.add_argument("--match", help="Select windows whose title, app_id or id contains this")
+    parser.add_argument("--from_workspace", help="Select the windows on this workspace (name, or index on the focused output)")
+    parser.add_argument("--target", required=True, choices=["m", "w"], help="m=monitor, w=workspace")
+    parser.add_argument("--target_id", required=True, help="Target name or index")
+    parser.add_argument("--strict_order", action="store_true",
+                        help="Send the moves one after another so columns keep their order exactly")
+    parser.add_argument("--dry_run", action="store_true", help="Show what would move without moving it")
+    args = parser.parse_args(argv)
+    if not (args.app_id or args.match or args.from_workspace):
+        parser.error("give at least one of --app_id, --match or --from_workspace")
+    return args
+
+def parse_layout_args(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Save the Niri window layout, or restore a saved one.")
+    parser.add_argument("--action", required=True, choices=["save", "restore"], help="save=write the layout, restore=move windows back")
+    parser.add_argument("--file", required=True, type=os.path.expanduser,
+                        help="Layout file (JSON); give an absolute path when going through niri-ctl")
+    parser.add_argument("--strict_order", action="store_true",
+                        help="Send the moves one after another so columns keep their order exactly")
+    parser.add_argument("--dry_run", action="store_true", help="Show the moves a restore would make")
+    return parser.parse_args(argv)
+
+def parse_hot_change_args(argv=None):
+    parser = argparse.ArgumentParser(description="Edit the focus-ring section of niri's config.kdl (Qt).")
+    parser.add_argument("--preview_rate", type=float, default=4.0,
+                        help="Live preview writes the config at most this many times a second (default 4)")
+    args = parser.parse_args(argv)
+    if args.preview_rate <= 0:
+        parser.error("--preview_rate must be greater than 0")
+    return args
+
+WINDOW_COLUMNS = ["id", "title", "app_id", "workspace_id", "is_focused", "is_floating", "is_urgent"]
+
+def parse_windows_args(argv=None):
+    parser = argparse.ArgumentParser(description="Show a table of Niri windows.")
+    parser.add_argument("--watch", action="store_true", help="Keep the table open and update it live from the event stream")
+    parser.add_argument("--sort", choices=WINDOW_COLUMNS, default=None, help="Column to sort by (default: niri's order)")
+    parser.add_argument("--reverse", action="store_true", help="Sort in descending order")
+    parser.add_argument("--columns", default=",".join(WINDOW_COLUMNS),
+                        help=f"Comma-separated columns to show, from: {', '.join(WINDOW_COLUMNS)}")
+    parser.add_argument("--title_width", type=int, default=30, help="Characters of the title to show")
+    args = parser.parse_args(argv)
+    args.columns = [c.strip() for c in args.columns.split(",") if c.strip()]
+    unknown = [c for c in args.columns if c not in WINDOW_COLUMNS]
+    if unknown or not args.columns:
+        parser.error(f"unknown column(s): {', '.join(unknown) or '(none given)'}")
+    return args
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+GRAM = 3
+
+def normalise_window(win):
+    """Lowercased ``title\\0app_id\\0id`` so one substring test covers all three.
+
+    Queries never contain NUL, so a hit can never straddle two fields.
+    """
+    title = (win.get("title") or "").lower()
+    app_id = (win.get("app_id") or "").lower()
+    return f"{title}\0{app_id}\0{win.get('id', '')}"
+
+def first_matching_window(windows, match_str):
+    """WindowIndex.find_matching_window over a plain window list.
+
+    Same order of preference, without building the index, for single-use
+    command-line calls.
+    """
+    query = match_str.lower()
+    if query.isdecimal():
+        window_id = int(query)
+        for win in windows:
+            if win.get("id") == window_id:
+                return win
+    first_hit = None
+    for win in windows:
+        if (win.get("app_id") or "").lower() == query:
+            return win
+        if first_hit is None and query in normalise_window(win):
+            first_hit = win
+    return first_hit
+
+def _grams(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+class WindowIndex:
+    """Pre-normalised search index over windows.
+
+    Titles and app_ids are lowercased once when a window is added instead of
+    on every lookup. Exact id and app_id lookups are dict hits; substring
+    and prefix searches narrow the candidates with a trigram index before
+    verifying them. Results keep the order in which windows were first
+    added, which matches the order niri lists them in.
+    """
+
+    def __init__(self, windows=()):
+        self.windows = {}
+        self.keys = {}  # window id -> normalised search key
+        self.seq = {}   # window id -> insertion position
+        self.by_app_id = {}
+        self.grams = {}
+        self.counter = 0
+        self.generation = 0  # bumped on every change, for result caches
+        for win in windows:
+            self.add(win)
+
+    def __len__(self):
+        return len(self.windows)
+
+    def add(self, win):
+        """Index win, replacing any earlier version with the same id.
+
+        A replaced window keeps its position in the result order.
+        """
+        window_id = win["id"]
+        self.generation += 1
+        if window_id in self.windows:
+            self._unindex(window_id)
+        else:
+            self.seq[window_id] = self.counter
+            self.counter += 1
+
+        key = normalise_window(win)
+        self.windows[window_id] = win
+        self.keys[window_id] = key
+        self.by_app_id.setdefault((win.get("app_id") or "").lower(), set()).add(window_id)
+        for gram in _grams(key):
+            self.grams.setdefault(gram, set()).add(window_id)
+
+    def remove(self, window_id):
+        if window_id not in self.windows:
+            return None
+        self.generation += 1
+        self._unindex(window_id)
+        del self.keys[window_id]
+        del self.seq[window_id]
+        return self.windows.pop(window_id)
+
+    def _unindex(self, window_id):
+        win = self.windows[window_id]
+        _discard(self.by_app_id, (win.get("app_id") or "").lower(), window_id)
+        for gram in _grams(self.keys[window_id]):
+            _discard(self.grams, gram, window_id)
+
+    def get(self, window_id):
+        return self.windows.get(window_id)
+
+    def find_by_app_id(self, app_id):
+        ids = self.by_app_id.get(app_id.lower(), ())
+        return self._ordered(ids)
+
+    def first_by_app_id(self, app_id):
+        ids = self.by_app_id.get(app_id.lower())
+        if not ids:
+            return None
+        return self.windows[min(ids, key=self.seq.__getitem__)]
+
+    def search(self, query, limit=None):
+        """Return windows whose title, app_id or id contains query."""
+        query = query.lower()
+        postings = self._postings(query)
+        if postings is None or (limit is not None and len(postings[0]) * 8 > len(self.windows)):
+            # Short or very common query: the keys are already in result
+            # order, so a scan that stops at the first hits beats set work.
+            hits = []
+            for window_id, key in self.keys.items():
+                if query in key:
+                    hits.append(self.windows[window_id])
+                    if len(hits) == limit:
+                        break
+            return hits
+        hits = [i for i in _intersect(postings) if query in self.keys[i]]
+        return self._ordered(hits)[:limit]
+
+    def prefix_search(self, query, limit=None):
+        """Return windows whose title or app_id starts with query."""
+        query = query.lower()
+        postings = self._postings(query)
+        candidates = self.windows.keys() if postings is None else _intersect(postings)
+        hits = []
+        for i in candidates:
+            title, app_id, _ = self.keys[i].split("\0")
+            if title.startswith(query) or app_id.startswith(query):
+                hits.append(i)
+        return self._ordered(hits)[:limit]
+
+    def find_matching_window(self, match_str):
+        """Exact id, then exact app_id, then the first substring hit."""
+        if match_str.isdecimal() and int(match_str) in self.windows:
+            return self.windows[int(match_str)]
+        by_app_id = self.first_by_app_id(match_str)
+        if by_app_id is not None:
+            return by_app_id
+        hits = self.search(match_str, limit=1)
+        return hits[0] if hits else None
+
+    def _postings(self, query):
+        """Trigram posting sets for query, smallest first.
+
+        Returns None when query is too short to use the index, and a single
+        empty set when one of its trigrams occurs nowhere.
+        """
+        if len(query) < GRAM:
+            return None
+        postings = []
+        for gram in _grams(query):
+            ids = self.grams.get(gram)
+            if not ids:
+                return [set()]
+            postings.append(ids)
+        postings.sort(key=len)
+        return postings
+
+    def _ordered(self, ids):
+        if len(ids) * 8 > len(self.windows):
+            # Replacing a window keeps its slot, so dict order is seq order.
+            ids = set(ids)
+            return [win for i, win in self.windows.items() if i in ids]
+        return [self.windows[i] for i in sorted(ids, key=self.seq.__getitem__)]
+
+def _intersect(postings):
+    return postings[0].intersection(*postings[1:])
+
+def _discard(index, key, item_id):
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.discard(item_id)
+        if not bucket:
+            del index[key]
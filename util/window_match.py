@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+import heapq
+
+from util.window_index import normalise_window
+
+# Match tiers, best first.
+EXACT_ID = 0
+EXACT_APP_ID = 1
+PREFIX = 2
+SUBSTRING = 3
+FUZZY = 4
+
+TIER_NAMES = {
+    EXACT_ID: "id",
+    EXACT_APP_ID: "app_id",
+    PREFIX: "prefix",
+    SUBSTRING: "substring",
+    FUZZY: "fuzzy",
+}
+
+def score_key(query, key):
+    """Score a lowercased query against a normalised window key.
+
+    Returns a tuple that sorts better-first, or None when the window does
+    not match at all. The first element is the match tier.
+    """
+    pos = key.find(query)
+    if pos != -1:
+        app_start = key.find("\0") + 1
+        if key.endswith("\0" + query):
+            return (EXACT_ID, 0, 0)
+        if key.startswith(query + "\0", app_start):
+            return (EXACT_APP_ID, 0, 0)
+        if pos == 0 or key.startswith(query, app_start):
+            return (PREFIX, 0, 0)
+        return (SUBSTRING, pos, 0)
+
+    title, app_id, _ = key.split("\0")
+    best = None
+    for text in (title, app_id):
+        span = _fuzzy_span(query, text)
+        if span is not None and (best is None or span < best):
+            best = span
+    if best is None:
+        return None
+    gaps, start = best
+    return (FUZZY, gaps, start)
+
+def _fuzzy_span(query, text):
+    """Return ``(gaps, start)`` of the tightest subsequence hit, or None."""
+    pos = -1
+    for ch in query:
+        pos = text.find(ch, pos + 1)
+        if pos == -1:
+            return None
+    end = pos
+    # Walk back from the end of the greedy hit for the latest possible start.
+    for ch in reversed(query[:-1]):
+        pos = text.rfind(ch, 0, pos)
+    return (end - pos + 1 - len(query), pos)
+
+def window_recency(win):
+    """Focus recency of a window from niri's focus_timestamp, if reported."""
+    if win.get("is_focused"):
+        return float("inf")
+    stamp = win.get("focus_timestamp")
+    if isinstance(stamp, dict):
+        return stamp.get("secs", 0) + stamp.get("nanos", 0) / 1e9
+    return 0
+
+class WindowMatcher:
+    """Ranked matching over a WindowIndex.
+
+    Results rank exact id, then exact app_id, then title/app_id prefix,
+    then substring, then fuzzy subsequence hits. Ties go to the most
+    recently focused window, then to niri's list order. The windows that
+    matched the previous query are remembered, so typing one more
+    character only re-scores those, which keeps an interactive picker
+    responsive over thousands of windows.
+    """
+
+    def __init__(self, index, recency=None):
+        self.index = index
+        self.recency = recency if recency is not None else {}
+        self.last_query = None
+        self.last_ids = None
+        self.last_generation = None
+
+    def rank(self, query, limit=10):
+        """Return up to limit ``(tier, window)`` pairs, best first."""
+        query = query.lower()
+        keys = self.index.keys
+        reuse = (
+            self.last_query
+            and query.startswith(self.last_query)
+            and self.last_generation == self.index.generation
+        )
+        if reuse:
+            candidates = [i for i in self.last_ids if i in keys]
+        else:
+            candidates = keys
+
+        scored = []
+        seq = self.index.seq
+        windows = self.index.windows
+        recency = self.recency
+        for window_id in candidates:
+            score = score_key(query, keys[window_id])
+            if score is not None:
+                rec = recency.get(window_id)
+                if rec is None:
+                    rec = window_recency(windows[window_id])
+                scored.append((score, -rec, seq[window_id], window_id))
+
+        # Any window matching an extension of this query is among these.
+        self.last_query = query
+        self.last_ids = [entry[3] for entry in scored]
+        self.last_generation = self.index.generation
+
+        best = heapq.nsmallest(limit, scored) if limit is not None else sorted(scored)
+        return [(entry[0][0], windows[entry[3]]) for entry in best]
+
+def rank_windows(windows, match_str, limit=10):
+    """One-shot ranked match over a plain window list.
+
+    Builds only the normalised keys, not the trigram index, so it stays
+    cheap for single-use command-line calls.
+    """
+    query = match_str.lower()
+    scored = []
+    for seq, win in enumerate(windows):
+        score = score_key(query, normalise_window(win))
+        if score is not None:
+            scored.append((score, -window_recency(win), seq, win))
+    best = heapq.nsmallest(limit, scored, key=lambda entry: entry[:3])
+    return [(entry[0][0], entry[3]) for entry in best]